@@ -47,8 +47,9 @@ function loadModel() {
   draco.setDecoderPath('https://www.gstatic.com/draco/v1/decoders/');
   loader.setDRACOLoader(draco);
 
-  loader.load('/output/model.glb', (gltf) => {
+  loader.load('/output/model.glb', async (gltf) => {
     model = gltf.scene;
+    await applyLods(gltf);
 
     const box = new THREE.Box3().setFromObject(model);
     const center = box.getCenter(new THREE.Vector3());
@@ -63,6 +64,45 @@ function loadModel() {
   });
 }
 
+// Levels of detail (MSFT_lod): GLTFLoader only loads the finest level, so
+// fetch the coarser nodes and switch between them with a THREE.LOD.
+// MSFT_screencoverage gives, per level, the smallest fraction of the
+// viewport height the model must span for that level to be shown.
+async function applyLods(gltf) {
+  const parser = gltf.parser;
+  const nodes = parser.json.nodes || [];
+
+  const roots = [];
+  gltf.scene.traverse((object) => {
+    const association = parser.associations.get(object);
+    const index = association ? association.nodes : undefined;
+    if (index !== undefined && nodes[index].extensions && nodes[index].extensions.MSFT_lod) {
+      roots.push([object, nodes[index]]);
+    }
+  });
+
+  for (const [root, node] of roots) {
+    const ids = node.extensions.MSFT_lod.ids;
+    const coverage = (node.extras && node.extras.MSFT_screencoverage) || [];
+    const levels = await Promise.all(ids.map((id) => parser.getDependency('node', id)));
+
+    // Measure distances from the geometry center, not the node origin
+    const sphere = new THREE.Box3().setFromObject(root).getBoundingSphere(new THREE.Sphere());
+    const halfFov = THREE.MathUtils.degToRad(camera.fov / 2);
+    const distanceFor = (c) => (c > 0 ? sphere.radius / (c * Math.tan(halfFov)) : Infinity);
+
+    const lod = new THREE.LOD();
+    lod.position.copy(sphere.center);
+    root.parent.add(lod);
+    [root, ...levels].forEach((level, k) => {
+      level.position.sub(sphere.center);
+      // Level k takes over once coverage drops below level k - 1's threshold
+      const distance = k === 0 ? 0 : distanceFor(coverage[k - 1] !== undefined ? coverage[k - 1] : 0);
+      if (distance !== Infinity) lod.addLevel(level, distance);
+    });
+  }
+}
+
 function animate() {
   requestAnimationFrame(animate);
   renderer.render(scene, camera);
@@ -0,0 +1,357 @@
+"""
+BVH MODULE
+Array-based bounding volume hierarchy over mesh triangles
+
+Purpose: Find faces of a mesh that cut through each other (overlapping
+wall solids, folded floors) without testing every pair of triangles.
+
+Layout (built in a few vectorized passes, no per-node Python work):
+- Triangles are sorted by the Morton code of their box centers and cut
+  into leaves of leaf_size consecutive triangles, so every split is a
+  median split of the sorted order (a linear BVH)
+- The tree is a complete binary tree over the leaves (padded to a power
+  of two): node i of level d has children 2i and 2i + 1 in level d + 1,
+  and each level is one (2^d, 3) array of box corners
+
+Queries:
+- overlapping_pairs(): face pairs whose boxes overlap, found by walking
+  the tree against itself one level at a time (the frontier of node
+  pairs is an array)
+- self_intersections(): the pairs whose triangles properly cross, by the
+  vectorized plane/interval test of triangles_intersect(); each chunk of
+  candidate pairs is tested as soon as it is found, so the search can
+  stop after the first few hits
+
+Touching faces (shared edges or vertices, a wall standing on the slab,
+coplanar contact) are not intersections: both triangles must straddle
+the other's plane and their cuts must overlap by more than the tolerance.
+
+Used by: Stage 8 (self-intersection check).
+"""
+
+import numpy as np
+from typing import Callable, Iterator, List, Tuple
+import logging
+
+log = logging.getLogger(__name__)
+
+LEAF_SIZE = 8             # triangles per leaf
+PAIR_CHUNK = 1 << 21      # candidate pairs tested per vectorized batch
+MORTON_BITS = 10          # bits per axis (30-bit codes)
+
+# ============================================================================
+# TRIANGLE-TRIANGLE TEST
+# ============================================================================
+
+def _spread_bits(values: np.ndarray) -> np.ndarray:
+    """Insert two zero bits after each of the low 10 bits"""
+
+    v = values.astype(np.int64) & 0x3FF
+    v = (v | (v << 16)) & 0x030000FF
+    v = (v | (v << 8)) & 0x0300F00F
+    v = (v | (v << 4)) & 0x030C30C3
+    v = (v | (v << 2)) & 0x09249249
+    return v
+
+
+def morton_codes(points: np.ndarray) -> np.ndarray:
+    """30-bit Morton codes of (N, 3) points, quantized over their bounds"""
+
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    if len(points) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    lo = points.min(axis=0)
+    span = np.maximum(points.max(axis=0) - lo, 1e-12)
+    cells = (1 << MORTON_BITS) - 1
+    q = np.clip(((points - lo) / span * cells).astype(np.int64), 0, cells)
+    return (_spread_bits(q[:, 0]) << 2) | (_spread_bits(q[:, 1]) << 1) | _spread_bits(q[:, 2])
+
+
+def unit_normals(tri: np.ndarray) -> np.ndarray:
+    """(P, 3) unit normals of (P, 3, 3) triangles (zero for degenerate ones)"""
+
+    normals = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+    length = np.linalg.norm(normals, axis=1)
+    valid = length > 1e-18
+    normals[valid] /= length[valid, None]
+    normals[~valid] = 0.0
+    return normals
+
+
+def _spread(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Row-wise (min, max) of a (P, 3) array (faster than axis reductions)"""
+    a, b, c = values[:, 0], values[:, 1], values[:, 2]
+    return np.minimum(np.minimum(a, b), c), np.maximum(np.maximum(a, b), c)
+
+
+def _cut_interval(tri: np.ndarray, distances: np.ndarray,
+                  direction: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Interval a triangle covers on the planes' intersection line.
+
+    Args:
+        tri: (P, 3, 3) triangles
+        distances: (P, 3) signed vertex distances to the other plane
+            (values within tolerance already snapped to 0)
+        direction: (P, 3) unit direction of the intersection line
+
+    Returns:
+        (low, high) parameters along direction
+    """
+
+    proj = np.einsum('pvk,pk->pv', tri, direction)
+    low = np.where(distances == 0, proj, np.inf).min(axis=1)
+    high = np.where(distances == 0, proj, -np.inf).max(axis=1)
+
+    for i, j in ((0, 1), (1, 2), (2, 0)):
+        crossing = distances[:, i] * distances[:, j] < 0
+        denominator = np.where(crossing, distances[:, i] - distances[:, j], 1.0)
+        x = proj[:, i] + distances[:, i] / denominator * (proj[:, j] - proj[:, i])
+        low = np.where(crossing, np.minimum(low, x), low)
+        high = np.where(crossing, np.maximum(high, x), high)
+
+    return low, high
+
+
+def _crossing(a: np.ndarray, b: np.ndarray, normal_a: np.ndarray, normal_b: np.ndarray,
+              offset_a: np.ndarray, offset_b: np.ndarray, tolerance: float) -> np.ndarray:
+    """triangles_intersect() with the planes (unit normal, offset) already known"""
+
+    result = np.zeros(len(a), dtype=bool)
+
+    # Each triangle must have corners strictly on both sides of the other's
+    # plane; test a against plane b first and only go on with survivors
+    dist_a = np.einsum('pk,pvk->pv', normal_b, a)
+    dist_a -= offset_b[:, None]
+    low, high = _spread(dist_a)
+    keep = np.flatnonzero((high > tolerance) & (low < -tolerance))
+    b, normal_a, normal_b, offset_a, dist_a = b[keep], normal_a[keep], normal_b[keep], offset_a[keep], dist_a[keep]
+    a = a[keep]
+
+    dist_b = np.einsum('pk,pvk->pv', normal_a, b)
+    dist_b -= offset_a[:, None]
+    low, high = _spread(dist_b)
+    straddle = (high > tolerance) & (low < -tolerance)
+
+    direction = np.cross(normal_a, normal_b)
+    length = np.linalg.norm(direction, axis=1)
+    candidates = np.flatnonzero(straddle & (length > 1e-12))
+    if len(candidates) == 0:
+        return result
+
+    direction = direction[candidates] / length[candidates, None]
+    dist_a = dist_a[candidates]
+    dist_b = dist_b[candidates]
+    dist_a[np.abs(dist_a) <= tolerance] = 0.0
+    dist_b[np.abs(dist_b) <= tolerance] = 0.0
+
+    low_a, high_a = _cut_interval(a[candidates], dist_a, direction)
+    low_b, high_b = _cut_interval(b[candidates], dist_b, direction)
+    result[keep[candidates]] = np.minimum(high_a, high_b) - np.maximum(low_a, low_b) > tolerance
+    return result
+
+
+def triangles_intersect(a: np.ndarray, b: np.ndarray, tolerance: float = 1e-7) -> np.ndarray:
+    """
+    Proper intersection test for triangle pairs (vectorized Moller test).
+
+    Args:
+        a, b: (P, 3, 3) triangle corners
+        tolerance: distances (same units) below which points count as
+            touching rather than crossing
+
+    Returns:
+        (P,) bool, True where the interiors cross
+    """
+
+    a = np.asarray(a, dtype=np.float64).reshape(-1, 3, 3)
+    b = np.asarray(b, dtype=np.float64).reshape(-1, 3, 3)
+    normal_a, normal_b = unit_normals(a), unit_normals(b)
+    return _crossing(a, b, normal_a, normal_b, np.einsum('pk,pk->p', normal_a, a[:, 0]),
+                     np.einsum('pk,pk->p', normal_b, b[:, 0]), tolerance)
+
+# ============================================================================
+# TRIANGLE BVH
+# ============================================================================
+
+def _round_down(values: np.ndarray) -> np.ndarray:
+    """float32 copy no larger than the float64 values"""
+    rounded = values.astype(np.float32)
+    return np.where(rounded > values, np.nextafter(rounded, np.float32(-np.inf)), rounded)
+
+
+def _round_up(values: np.ndarray) -> np.ndarray:
+    """float32 copy no smaller than the float64 values"""
+    rounded = values.astype(np.float32)
+    return np.where(rounded < values, np.nextafter(rounded, np.float32(np.inf)), rounded)
+
+
+class TriangleBVH:
+    """Linear BVH over the triangles of a mesh (see module docstring)"""
+
+    def __init__(self, positions: np.ndarray, triangles: np.ndarray,
+                 leaf_size: int = LEAF_SIZE):
+        """
+        Args:
+            positions: (N, 3) vertex positions
+            triangles: (F, 3) vertex indices
+            leaf_size: triangles per leaf
+        """
+
+        triangles = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+        self.corners = np.asarray(positions, dtype=np.float64)[triangles]
+        self.face_lo = self.corners.min(axis=1)
+        self.face_hi = self.corners.max(axis=1)
+        self.normals = unit_normals(self.corners)
+        self.offsets = np.einsum('fk,fk->f', self.normals, self.corners[:, 0])  # plane n . x = offset
+        self.leaf_size = int(leaf_size)
+
+        count = len(triangles)
+        order = np.argsort(morton_codes(0.5 * (self.face_lo + self.face_hi)), kind='stable')
+        leaves = max(1, -(-count // self.leaf_size))
+        self.depth = int(np.ceil(np.log2(leaves))) if leaves > 1 else 0
+
+        # Pad to a full last level; empty slots (-1) get inverted boxes
+        slots = np.full((1 << self.depth) * self.leaf_size, -1, dtype=np.int64)
+        slots[:count] = order
+        self.leaf_faces = slots.reshape(-1, self.leaf_size)
+
+        lo = np.full((len(slots), 3), np.inf)
+        hi = np.full((len(slots), 3), -np.inf)
+        lo[:count] = self.face_lo[order]
+        hi[:count] = self.face_hi[order]
+        self.slot_lo = lo.reshape(-1, self.leaf_size, 3)  # face boxes per leaf
+        self.slot_hi = hi.reshape(-1, self.leaf_size, 3)
+
+        self.node_lo: List[np.ndarray] = [None] * (self.depth + 1)
+        self.node_hi: List[np.ndarray] = [None] * (self.depth + 1)
+        self.node_lo[self.depth] = self.slot_lo.min(axis=1)
+        self.node_hi[self.depth] = self.slot_hi.max(axis=1)
+        for level in range(self.depth - 1, -1, -1):
+            self.node_lo[level] = self.node_lo[level + 1].reshape(-1, 2, 3).min(axis=1)
+            self.node_hi[level] = self.node_hi[level + 1].reshape(-1, 2, 3).max(axis=1)
+
+    @property
+    def face_count(self) -> int:
+        return len(self.corners)
+
+    def tolerance(self, relative: float = 1e-7) -> float:
+        """Length tolerance scaled to the mesh extent"""
+        if self.face_count == 0:
+            return relative
+        extent = float(np.max(self.node_hi[0] - self.node_lo[0]))
+        return max(relative * extent, 1e-9)
+
+    def _leaf_pairs(self, margin: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Leaf pairs (a <= b) whose boxes overlap, one tree level at a time"""
+
+        a = np.zeros(1, dtype=np.int64)
+        b = np.zeros(1, dtype=np.int64)
+        for level in range(self.depth + 1):
+            # Per-axis rows, so each test gathers from a contiguous array
+            lo = np.ascontiguousarray(self.node_lo[level].T)
+            hi = np.ascontiguousarray(self.node_hi[level].T) + margin
+            keep = np.ones(len(a), dtype=bool)
+            for axis in range(3):
+                keep &= (lo[axis][a] <= hi[axis][b]) & (lo[axis][b] <= hi[axis][a])
+            a, b = a[keep], b[keep]
+            if level == self.depth:
+                break
+
+            # Self pairs open into 3 child pairs, distinct pairs into 4
+            same = a == b
+            sa, da, db = a[same], a[~same], b[~same]
+            a = np.concatenate([(2 * sa[:, None] + [0, 0, 1]).ravel(),
+                                (2 * da[:, None] + [0, 0, 1, 1]).ravel()])
+            b = np.concatenate([(2 * sa[:, None] + [0, 1, 1]).ravel(),
+                                (2 * db[:, None] + [0, 1, 0, 1]).ravel()])
+        return a, b
+
+    def _candidate_blocks(self, margin: float) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Face pairs whose boxes overlap (boxes grown by margin), in chunks.
+
+        Yields:
+            (faces_a, faces_b) index arrays of up to about PAIR_CHUNK pairs;
+            every pair appears once, in either order
+        """
+
+        leaf_a, leaf_b = self._leaf_pairs(margin)
+        size = self.leaf_size
+        upper = np.triu(np.ones((size, size), dtype=bool), k=1)
+        chunk = max(1, PAIR_CHUNK // (size * size))
+
+        # Slot boxes per axis as (axis, leaf, slot) float32, rounded outward
+        # so the coarse test never drops a pair the float64 test would keep
+        lo = _round_down(self.slot_lo - margin).transpose(2, 0, 1).copy()
+        hi = _round_up(self.slot_hi).transpose(2, 0, 1).copy()
+
+        for start in range(0, len(leaf_a), chunk):
+            la, lb = leaf_a[start:start + chunk], leaf_b[start:start + chunk]
+
+            # (K, size, size) slot-pair box tests; empty slots have inverted
+            # boxes and never pass
+            overlap = (la != lb)[:, None, None] | upper
+            for axis in range(3):
+                overlap &= lo[axis][la][:, :, None] <= hi[axis][lb][:, None, :]
+                overlap &= lo[axis][lb][:, None, :] <= hi[axis][la][:, :, None]
+
+            k, i, j = np.nonzero(overlap)
+            yield self.leaf_faces[la[k], i], self.leaf_faces[lb[k], j]
+
+    def overlapping_pairs(self, margin: float = 0.0) -> np.ndarray:
+        """
+        Face pairs whose bounding boxes overlap (boxes grown by margin).
+
+        Returns:
+            (K, 2) int64 face indices, i < j
+        """
+
+        pairs = [np.column_stack([np.minimum(fa, fb), np.maximum(fa, fb)])
+                 for fa, fb in self._candidate_blocks(margin)]
+        if not pairs:
+            return np.zeros((0, 2), dtype=np.int64)
+        return np.concatenate(pairs)
+
+    def self_intersections(self, tolerance: float = None, limit: int = None,
+                           skip: Callable[[np.ndarray, np.ndarray], np.ndarray] = None) -> np.ndarray:
+        """
+        Face pairs whose triangles properly cross each other.
+
+        Candidate chunks go straight into the triangle test; with a limit
+        the search stops at the first chunk that brings the hit count to
+        it, so a broken mesh is reported without testing every pair.
+
+        Args:
+            tolerance: touching distance (default: scaled to the mesh extent)
+            limit: stop once at least this many hits are found (None: find all)
+            skip: optional (faces_a, faces_b) -> bool mask of candidate
+                pairs not to test (intersections there are expected)
+
+        Returns:
+            (K, 2) int64 face indices, i < j, sorted
+        """
+
+        if tolerance is None:
+            tolerance = self.tolerance()
+
+        hits, found = [], 0
+        for fa, fb in self._candidate_blocks(tolerance):
+            if skip is not None:
+                test = ~skip(fa, fb)
+                fa, fb = fa[test], fb[test]
+            crossing = _crossing(self.corners[fa], self.corners[fb], self.normals[fa], self.normals[fb],
+                                 self.offsets[fa], self.offsets[fb], tolerance)
+            if not crossing.any():
+                continue
+            fa, fb = fa[crossing], fb[crossing]
+            hits.append(np.column_stack([np.minimum(fa, fb), np.maximum(fa, fb)]))
+            found += len(fa)
+            if limit is not None and found >= limit:
+                break
+
+        if not hits:
+            return np.zeros((0, 2), dtype=np.int64)
+        hits = np.concatenate(hits)
+        return hits[np.lexsort((hits[:, 1], hits[:, 0]))]
@@ -0,0 +1,185 @@
+"""
+COORDINATE FRAMES MODULE
+Affine frames over pixel-space geometry
+
+Purpose: Let stages read wall graph and room geometry in any coordinate
+frame (pixels, meters, ...) without copying the structures.
+
+Geometry is stored once, in image pixels. A frame is an affine map from
+pixels to its target space:
+
+    p' = R(rotation) · (scale · p) + offset
+
+Graphs and room sets hold a FrameSet ('pixel' is always the identity);
+Stage 5 registers 'metric'. Coordinates in a frame are computed lazily,
+as NumPy arrays, and cached until the geometry or the frame changes.
+
+Used by: Stage 3 (WallTopologyGraph), Stage 4 (RoomSet), Stage 5
+(registers the metric frame), Stages 6-9 (read metric arrays).
+"""
+
+import numpy as np
+from typing import Callable, Dict, Hashable, Tuple
+from dataclasses import dataclass
+import logging
+
+log = logging.getLogger(__name__)
+
+PIXEL_FRAME = 'pixel'
+METRIC_FRAME = 'metric'
+
+# ============================================================================
+# AFFINE FRAME
+# ============================================================================
+
+@dataclass(frozen=True)
+class AffineFrame:
+    """Similarity transform from pixel coordinates into a target frame"""
+    scale: float = 1.0                        # target units per pixel
+    offset: Tuple[float, float] = (0.0, 0.0)  # target-space translation
+    rotation: float = 0.0                     # radians, counter-clockwise
+
+    @property
+    def is_identity(self) -> bool:
+        return self.scale == 1.0 and self.rotation == 0.0 and tuple(self.offset) == (0.0, 0.0)
+
+    def matrix(self) -> np.ndarray:
+        """3x3 homogeneous matrix of the transform"""
+        c, s = np.cos(self.rotation), np.sin(self.rotation)
+        return np.array([
+            [self.scale * c, -self.scale * s, self.offset[0]],
+            [self.scale * s, self.scale * c, self.offset[1]],
+            [0.0, 0.0, 1.0]
+        ])
+
+    def apply(self, points: np.ndarray) -> np.ndarray:
+        """Transform (..., 2) points (returns a new float64 array)"""
+
+        points = np.asarray(points, dtype=np.float64)
+        if self.is_identity:
+            return points.copy()
+
+        m = self.matrix()
+        return points @ m[:2, :2].T + m[:2, 2]
+
+    def apply_length(self, length):
+        """Transform lengths (scalar or array)"""
+        return np.multiply(length, self.scale)
+
+    def apply_area(self, area):
+        """Transform areas (scalar or array)"""
+        return np.multiply(area, self.scale * self.scale)
+
+    def inverse(self) -> 'AffineFrame':
+        """Frame mapping target coordinates back to pixels"""
+        c, s = np.cos(-self.rotation), np.sin(-self.rotation)
+        ox, oy = self.offset
+        inv_scale = 1.0 / self.scale
+        return AffineFrame(
+            scale=inv_scale,
+            offset=(-inv_scale * (c * ox - s * oy), -inv_scale * (s * ox + c * oy)),
+            rotation=-self.rotation
+        )
+
+    def then(self, other: 'AffineFrame') -> 'AffineFrame':
+        """Frame equivalent to applying self, then other"""
+        m = other.matrix() @ self.matrix()
+        return AffineFrame(
+            scale=self.scale * other.scale,
+            offset=(float(m[0, 2]), float(m[1, 2])),
+            rotation=self.rotation + other.rotation
+        )
+
+
+IDENTITY_FRAME = AffineFrame()
+
+# ============================================================================
+# FRAME REGISTRY
+# ============================================================================
+
+class FrameSet:
+    """
+    Named frames attached to one geometry container, plus a cache of
+    coordinates already resolved in those frames.
+
+    Owners call invalidate() whenever their pixel geometry changes.
+    """
+
+    def __init__(self):
+        self.frames: Dict[str, AffineFrame] = {PIXEL_FRAME: IDENTITY_FRAME}
+        self._cache: Dict[Tuple[Hashable, str], np.ndarray] = {}
+
+    def register(self, name: str, frame: AffineFrame):
+        """Add or replace a frame"""
+        if name == PIXEL_FRAME and not frame.is_identity:
+            raise ValueError("The pixel frame is fixed to the identity")
+        self.frames[name] = frame
+        self._cache = {k: v for k, v in self._cache.items() if k[1] != name}
+
+    def get(self, name: str) -> AffineFrame:
+        """
+        Look up a frame by name.
+
+        Unregistered frames resolve to the identity: geometry that never went
+        through Stage 5 (e.g. graphs built directly in meters) is read as-is.
+        """
+        frame = self.frames.get(name)
+        if frame is None:
+            log.debug(f"[Frames] Frame '{name}' not registered, using identity")
+            return IDENTITY_FRAME
+        return frame
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.frames
+
+    def copy_from(self, other: 'FrameSet'):
+        """Adopt another container's frames (geometry cache is not shared)"""
+        self.frames = dict(other.frames)
+        self._cache.clear()
+
+    def resolve(self, key: Hashable, name: str,
+                pixel_values: Callable[[], np.ndarray],
+                kind: str = 'points') -> np.ndarray:
+        """
+        Values of a cached quantity in a frame.
+
+        Args:
+            key: quantity name (e.g. 'vertex_positions')
+            name: frame name
+            pixel_values: computes the quantity in pixels (called once per
+                invalidation)
+            kind: 'points', 'lengths' or 'areas'
+
+        Returns:
+            read-only array in the requested frame
+        """
+
+        cached = self._cache.get((key, name))
+        if cached is not None:
+            return cached
+
+        pixels = self._cache.get((key, PIXEL_FRAME))
+        if pixels is None:
+            pixels = np.asarray(pixel_values(), dtype=np.float64)
+            pixels.setflags(write=False)
+            self._cache[(key, PIXEL_FRAME)] = pixels
+        if name == PIXEL_FRAME:
+            return pixels
+
+        frame = self.get(name)
+        if kind == 'points':
+            values = frame.apply(pixels)
+        elif kind == 'lengths':
+            values = np.asarray(frame.apply_length(pixels), dtype=np.float64)
+        elif kind == 'areas':
+            values = np.asarray(frame.apply_area(pixels), dtype=np.float64)
+        else:
+            raise ValueError(f"Unknown quantity kind: {kind}")
+
+        values.setflags(write=False)
+        self._cache[(key, name)] = values
+        return values
+
+    def invalidate(self):
+        """Drop cached coordinates (geometry changed)"""
+        self._cache.clear()
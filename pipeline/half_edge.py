@@ -0,0 +1,206 @@
+"""
+HALF-EDGE MODULE
+Array-based half-edge structure over a triangle mesh
+
+Purpose: Give Stages 6-8 edge->face and vertex->face adjacency without
+each consumer rebuilding dictionaries from the face list.
+
+Layout (all int32, built from the (F, 3) face array in one sort):
+- Half-edge h = 3 * f + k runs from corner k to corner k + 1 of face f
+- origin[h]: start vertex; face[h] = h // 3; next[h] stays inside the face
+- twin[h]: opposite half-edge across the edge, or
+    BOUNDARY      (-1) edge used by this face only
+    NON_MANIFOLD  (-2) edge used by 3+ faces, or twice in one direction
+- vertex_half_edge[v]: one outgoing half-edge per vertex (a boundary one
+  when the vertex lies on a boundary, so one-ring walks start there)
+
+Queries:
+- one_ring(v) / vertex_faces(v): neighbours and faces around a vertex
+- boundary_loops(): closed vertex loops along open edges
+- non_manifold_edges(): vertex pairs of edges shared by 3+ faces
+- triangles(): back to an (F, 3) index array for export
+
+Used by: Stage 6 (Mesh.half_edges, cached with the face arrays) and
+Stage 8 (manifold diagnostics).
+"""
+
+import numpy as np
+from typing import Dict, Iterator, List, Optional
+import logging
+
+log = logging.getLogger(__name__)
+
+BOUNDARY = -1
+NON_MANIFOLD = -2
+
+# ============================================================================
+# HALF-EDGE MESH
+# ============================================================================
+
+class HalfEdgeMesh:
+    """Half-edge connectivity of a triangle mesh (positions are not stored)"""
+
+    def __init__(self, triangles: np.ndarray, vertex_count: Optional[int] = None):
+        """
+        Args:
+            triangles: (F, 3) vertex indices
+            vertex_count: number of vertices (default: max index + 1)
+        """
+
+        triangles = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+        face_count = len(triangles)
+        if vertex_count is None:
+            vertex_count = int(triangles.max()) + 1 if face_count else 0
+        self.vertex_count = int(vertex_count)
+
+        count = 3 * face_count
+        h = np.arange(count, dtype=np.int32)
+        self.origin = triangles.ravel().astype(np.int32)
+        self.face = h // 3
+        self.next = (h - h % 3 + (h + 1) % 3).astype(np.int32)
+        dest = self.origin[self.next].astype(np.int64)
+
+        # Match each directed edge (a, b) with (b, a): sort the packed keys
+        # once and look up every reverse key
+        forward = self.origin.astype(np.int64) * self.vertex_count + dest
+        reverse = dest * self.vertex_count + self.origin
+        order = np.argsort(forward, kind='stable')
+        keys = forward[order]
+
+        same = (np.searchsorted(keys, forward, side='right') -
+                np.searchsorted(keys, forward, side='left'))
+        lo = np.searchsorted(keys, reverse, side='left')
+        opposite = np.searchsorted(keys, reverse, side='right') - lo
+
+        self.twin = np.full(count, BOUNDARY, dtype=np.int32)
+        paired = (same == 1) & (opposite == 1)
+        self.twin[paired] = order[lo[paired]]
+        self.twin[(same > 1) | (opposite > 1)] = NON_MANIFOLD
+
+        # Degenerate faces (repeated corners) cannot be walked consistently
+        self.twin[self.origin == dest] = NON_MANIFOLD
+
+        self.vertex_half_edge = np.full(self.vertex_count, -1, dtype=np.int32)
+        self.vertex_half_edge[self.origin] = h
+        open_edges = np.flatnonzero(self.twin == BOUNDARY)
+        self.vertex_half_edge[self.origin[open_edges]] = open_edges
+
+    @property
+    def face_count(self) -> int:
+        return len(self.origin) // 3
+
+    def destination(self, h) -> np.ndarray:
+        """End vertex of half-edge(s) h"""
+        return self.origin[self.next[h]]
+
+    def prev(self, h) -> np.ndarray:
+        """Previous half-edge(s) in the same face"""
+        return self.next[self.next[h]]
+
+    def triangles(self) -> np.ndarray:
+        """(F, 3) uint32 vertex indices, in the original face order"""
+        return self.origin.reshape(-1, 3).astype(np.uint32)
+
+    # ------------------------------------------------------------------------
+    # Vertex adjacency
+    # ------------------------------------------------------------------------
+
+    def _outgoing(self, v: int) -> Iterator[int]:
+        """
+        Outgoing half-edges of v, rotating from face to face across edges.
+
+        Stops at a boundary or non-manifold edge; a vertex whose faces form
+        several fans (pinch vertex) only yields the fan of its stored
+        half-edge.
+        """
+
+        start = int(self.vertex_half_edge[v])
+        if start < 0:
+            return
+        h = start
+        while True:
+            yield h
+            twin = int(self.twin[self.next[self.next[h]]])
+            if twin < 0 or twin == start:
+                return
+            h = twin
+
+    def vertex_faces(self, v: int) -> List[int]:
+        """Faces around vertex v, in rotation order"""
+        return [h // 3 for h in self._outgoing(v)]
+
+    def one_ring(self, v: int) -> List[int]:
+        """Neighbouring vertices of v, in rotation order"""
+
+        ring = []
+        h = -1
+        for h in self._outgoing(v):
+            ring.append(int(self.origin[self.next[h]]))
+        if h >= 0:
+            # On a boundary the last face's far corner closes the fan
+            incoming = int(self.next[self.next[h]])
+            if self.twin[incoming] < 0:
+                ring.append(int(self.origin[incoming]))
+        return ring
+
+    # ------------------------------------------------------------------------
+    # Edge queries
+    # ------------------------------------------------------------------------
+
+    def boundary_half_edges(self) -> np.ndarray:
+        """Half-edges of open edges (face on their left)"""
+        return np.flatnonzero(self.twin == BOUNDARY).astype(np.int32)
+
+    def non_manifold_edges(self) -> np.ndarray:
+        """(K, 2) sorted vertex pairs of edges shared by 3+ faces"""
+
+        bad = np.flatnonzero(self.twin == NON_MANIFOLD)
+        pairs = np.sort(np.column_stack([self.origin[bad], self.destination(bad)]), axis=1)
+        return np.unique(pairs, axis=0) if len(pairs) else pairs.reshape(0, 2)
+
+    def boundary_loops(self) -> List[np.ndarray]:
+        """
+        Closed loops of open edges.
+
+        Each loop lists its vertices in half-edge order (the surface lies to
+        the left). A walk that runs into a non-manifold edge is dropped.
+
+        Returns:
+            list of (L,) int32 vertex arrays
+        """
+
+        open_edges = self.boundary_half_edges()
+        visited = np.zeros(len(self.origin), dtype=bool)
+        loops: List[np.ndarray] = []
+
+        for start in open_edges.tolist():
+            if visited[start]:
+                continue
+
+            loop, h, closed = [], start, False
+            while not visited[h]:
+                visited[h] = True
+                loop.append(int(self.origin[h]))
+
+                # Rotate around the end vertex to its outgoing open edge
+                g = int(self.next[h])
+                while self.twin[g] >= 0:
+                    g = int(self.next[self.twin[g]])
+                if self.twin[g] == NON_MANIFOLD:
+                    break
+                h = g
+                closed = h == start
+
+            if closed:
+                loops.append(np.asarray(loop, dtype=np.int32))
+
+        return loops
+
+    def summary(self) -> Dict:
+        """Connectivity counts"""
+        return {
+            'half_edges': len(self.origin),
+            'faces': self.face_count,
+            'boundary_edges': int(np.count_nonzero(self.twin == BOUNDARY)),
+            'non_manifold_half_edges': int(np.count_nonzero(self.twin == NON_MANIFOLD))
+        }
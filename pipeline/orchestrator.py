@@ -19,7 +19,7 @@ import sys
 import cv2
 import numpy as np
 import logging
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, List, Tuple
 from datetime import datetime
 
 # Import all stages
@@ -32,7 +32,10 @@ try:
     from pipeline.stage3_topology_extraction import stage3_topology_extraction
     from pipeline.stage4_room_detection import stage4_room_detection
     from pipeline.stage5_metric_normalization import MetricNormalizer
-    from pipeline.stage6_3d_construction import create_cutaway_mesh
+    from pipeline.stage6_3d_construction import (
+        create_cutaway_mesh,
+        build_lod_chain
+    )
     from pipeline.stage7_openings import (
         OpeningDetector,
         OpeningGenerator,
@@ -40,6 +43,7 @@ try:
     )
     from pipeline.stage8_validation import stage8_validation
     from pipeline.stage9_export import stage9_export
+    from pipeline.coordinate_frames import METRIC_FRAME
 except ImportError as e:
     # Fallback if modules not available
     print(f"Warning: Some modules could not be imported: {e}")
@@ -57,16 +61,31 @@ class BlueprintPipeline:
     Enforces strict stage ordering and validation gates.
     """
     
-    def __init__(self, image_path: str, device: str = 'auto', verbose: bool = True):
+    def __init__(self, image_path: str, device: str = 'auto', verbose: bool = True,
+                 topology_engine: str = 'skeleton', wall_mode: str = 'footprint',
+                 instanced_walls: bool = False, export_lods: bool = False,
+                 quantized_export: bool = False):
         """
         Args:
             image_path: Path to blueprint image
             device: 'cuda', 'cpu', or 'auto'
             verbose: Enable detailed logging
+            topology_engine: Stage 3 engine, 'skeleton' or 'segments'
+            wall_mode: Stage 6 walls, 'footprint' or 'boxes'
+            instanced_walls: Stage 9 writes box walls as GPU instances
+                             (EXT_mesh_gpu_instancing; needs wall_mode='boxes')
+            export_lods: Stage 9 adds coarser levels of detail (MSFT_lod)
+            quantized_export: Stage 9 writes quantized attributes
+                              (KHR_mesh_quantization)
         """
         self.image_path = image_path
         self.device = device
         self.verbose = verbose
+        self.topology_engine = topology_engine
+        self.wall_mode = wall_mode
+        self.instanced_walls = instanced_walls
+        self.export_lods = export_lods
+        self.quantized_export = quantized_export
         
         # Pipeline state
         self.image = None
@@ -222,7 +241,8 @@ class BlueprintPipeline:
         
         try:
             self.wall_graph = stage3_topology_extraction(
-                self.refined_wall_mask
+                self.refined_wall_mask,
+                engine=self.topology_engine
             )
             
             if self.wall_graph is None:
@@ -304,7 +324,8 @@ class BlueprintPipeline:
             mesh = create_cutaway_mesh(
                 self.normalized_wall_graph,
                 self.normalized_room_set,
-                context
+                context,
+                wall_mode=self.wall_mode
             )
             
             if mesh is None:
@@ -348,7 +369,8 @@ class BlueprintPipeline:
                 window_mask,
                 wall_mask,
                 self.normalized_wall_graph,
-                scale_factor
+                scale_factor,
+                wall_mode=self.wall_mode
             )
             
             if not success or mesh_with_openings is None:
@@ -384,7 +406,12 @@ class BlueprintPipeline:
             # Log validation report
             for check_name, check_passed, message in validation_result.checks:
                 status = "✓" if check_passed else "✗"
-                self._log(f"[Stage8] [{status}] {check_name}: {message}")
+                seconds = validation_result.timings.get(check_name, 0.0)
+                self._log(f"[Stage8] [{status}] {check_name}: {message} ({seconds * 1000:.1f} ms)")
+            
+            slowest = ", ".join(f"{name} {seconds * 1000:.1f} ms"
+                                for name, seconds in validation_result.slowest())
+            self._log(f"[Stage8] Slowest checks: {slowest}")
             
             if not passed:
                 self._log("[Stage8] ✗ VALIDATION FAILED - Pipeline halting")
@@ -418,13 +445,27 @@ class BlueprintPipeline:
                 'scale_factor': self.normalization_context['scale_factor'],
                 'normalized_width_m': self.normalization_context['target_width_m'],
                 'room_count': len(self.room_set.rooms) if self.room_set else 0,
-                'wall_count': len(self.wall_graph.edges) if self.wall_graph else 0
+                'wall_count': len(self.wall_graph.edges) if self.wall_graph else 0,
+                'rooms': self._room_outlines()
             }
             
+            lods, lod_coverage = None, None
+            if self.export_lods:
+                chain, lod_coverage = build_lod_chain(self.model_with_openings,
+                                                      self.normalized_wall_graph,
+                                                      self.normalized_room_set)
+                lods = chain[1:]
+                self._log(f"[Stage9] Levels of detail: "
+                          f"{', '.join(str(m.face_count) for m in chain)} triangles")
+            
             success, result = stage9_export(
                 self.model_with_openings,
                 output_path,
-                metadata=metadata
+                metadata=metadata,
+                instancing=self.instanced_walls,
+                lods=lods,
+                lod_coverage=lod_coverage,
+                quantize=self.quantized_export
             )
             
             if not success:
@@ -442,6 +483,31 @@ class BlueprintPipeline:
             self._log(f"[Stage9] Exception: {e}")
             return False
     
+    def _room_outlines(self) -> List[Dict]:
+        """Metric room polygons for export metadata"""
+        
+        if not self.normalized_room_set:
+            return []
+        
+        room_set = self.normalized_room_set
+        areas = room_set.areas(METRIC_FRAME)
+        perimeters = room_set.perimeters(METRIC_FRAME)
+        
+        outlines = []
+        for row, room_id in enumerate(room_set.room_ids().tolist()):
+            polygon, holes = room_set.outline(room_id, METRIC_FRAME)
+            if polygon is None:
+                continue
+            outlines.append({
+                'id': room_id,
+                'area_m2': round(float(areas[row]), 3),
+                'perimeter_m': round(float(perimeters[row]), 3),
+                'outline': np.round(polygon, 3).tolist(),
+                'holes': [np.round(h, 3).tolist() for h in holes]
+            })
+        
+        return outlines
+    
     def _log_stage(self, stage_name: str):
         """Log stage separator"""
         self._log(f"\n[Pipeline] {'='*60}")
@@ -0,0 +1,427 @@
+"""
+SPATIAL INDEX MODULE
+Segment index over wall graph edges
+
+Purpose: Answer "which wall segments are near this point/box" without
+scanning every edge of the wall graph, and "which mesh faces overlap
+these boxes" without scanning every face.
+
+Structure: Uniform grids. Each item is registered in every cell its
+bounding box covers, in one vectorized pass.
+- SegmentIndex supports incremental insertion afterwards, so a graph can
+  keep its index current as edges are added.
+- BoxIndex is static and stored as flat sorted arrays, so a whole batch
+  of query boxes is answered without Python loops.
+
+Queries:
+- query_bbox(x_min, y_min, x_max, y_max): segments whose bounds overlap a box
+- segments_within(point, radius): segments within a distance of a point
+- nearest_segment(point, k): k closest segments to a point
+- BoxIndex.query(boxes): (query, item) pairs of overlapping boxes
+
+Used by: Stage 3 (WallTopologyGraph), Stage 6/7 (Mesh.face_index for
+local wall edits around openings), Stage 7 (opening placement), Stage 8
+(connectivity diagnostics) and the review UI.
+"""
+
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+import logging
+
+log = logging.getLogger(__name__)
+
+# ============================================================================
+# GEOMETRY HELPERS
+# ============================================================================
+
+def point_segment_distances(points: np.ndarray,
+                            segments: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Distances from every point to every segment (broadcast).
+
+    Args:
+        points: (P, 2) array of (x, y)
+        segments: (S, 4) array of (x0, y0, x1, y1)
+
+    Returns:
+        (distances, t) both (P, S); t is the clamped projection parameter
+        along each segment (0 at start, 1 at end)
+    """
+
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    segments = np.asarray(segments, dtype=np.float64).reshape(-1, 4)
+
+    p0 = segments[:, 0:2]
+    d = segments[:, 2:4] - p0
+    length_sq = np.einsum('ij,ij->i', d, d)
+    safe_length_sq = np.where(length_sq > 1e-12, length_sq, 1.0)
+
+    # (P, S, 2) offsets from segment starts
+    rel = points[:, None, :] - p0[None, :, :]
+    t = np.einsum('psk,sk->ps', rel, d) / safe_length_sq
+    t = np.clip(np.where(length_sq > 1e-12, t, 0.0), 0.0, 1.0)
+
+    closest = p0[None, :, :] + t[:, :, None] * d[None, :, :]
+    diff = points[:, None, :] - closest
+    distances = np.sqrt(np.einsum('psk,psk->ps', diff, diff))
+
+    return distances, t
+
+
+def _cell_keys(cx: np.ndarray, cy: np.ndarray) -> np.ndarray:
+    """Pack integer cell coordinates into one int64 key"""
+    return (cx.astype(np.int64) << 32) + (cy.astype(np.int64) & 0xFFFFFFFF)
+
+
+def _covered_cells(boxes: np.ndarray, cell_size: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Enumerate the grid cells covered by each box, without a Python loop.
+
+    Args:
+        boxes: (N, 4) array of (x_min, y_min, x_max, y_max)
+        cell_size: grid cell edge length
+
+    Returns:
+        (owners, keys): box row and packed cell key of every (box, cell) pair
+    """
+
+    cx0 = np.floor(boxes[:, 0] / cell_size).astype(np.int64)
+    cy0 = np.floor(boxes[:, 1] / cell_size).astype(np.int64)
+    cx1 = np.floor(boxes[:, 2] / cell_size).astype(np.int64)
+    cy1 = np.floor(boxes[:, 3] / cell_size).astype(np.int64)
+    nx = cx1 - cx0 + 1
+    ny = cy1 - cy0 + 1
+    per_box = nx * ny
+
+    owners = np.repeat(np.arange(len(boxes), dtype=np.int64), per_box)
+    starts = np.cumsum(per_box) - per_box
+    local = np.arange(len(owners), dtype=np.int64) - np.repeat(starts, per_box)
+    ny_rep = np.repeat(ny, per_box)
+    cx = np.repeat(cx0, per_box) + local // ny_rep
+    cy = np.repeat(cy0, per_box) + local % ny_rep
+
+    return owners, _cell_keys(cx, cy)
+
+
+# ============================================================================
+# UNIFORM GRID SEGMENT INDEX
+# ============================================================================
+
+class SegmentIndex:
+    """
+    Uniform-grid spatial index over 2D line segments.
+
+    Segments are identified by caller-supplied integer ids (wall edge ids).
+    """
+
+    def __init__(self, cell_size: float):
+        """
+        Args:
+            cell_size: grid cell edge length (same units as the segments)
+        """
+        if cell_size <= 0:
+            raise ValueError("Cell size must be positive")
+
+        self.cell_size = float(cell_size)
+        self.cells: Dict[int, List[int]] = {}  # cell key -> slots
+
+        self._segments = np.empty((16, 4), dtype=np.float64)
+        self._ids = np.empty(16, dtype=np.int64)
+        self._count = 0
+        self._bounds = [np.inf, np.inf, -np.inf, -np.inf]
+
+    @classmethod
+    def bulk_load(cls, segments: np.ndarray,
+                  ids: Optional[np.ndarray] = None,
+                  cell_size: Optional[float] = None) -> 'SegmentIndex':
+        """
+        Build an index from many segments at once.
+
+        Args:
+            segments: (N, 4) or (N, 2, 2) segment endpoints
+            ids: (N,) segment ids (defaults to 0..N-1)
+            cell_size: grid cell size (estimated from the data if omitted)
+
+        Returns:
+            SegmentIndex
+        """
+
+        segments = np.asarray(segments, dtype=np.float64).reshape(-1, 4)
+        n = len(segments)
+        ids = np.arange(n, dtype=np.int64) if ids is None else np.asarray(ids, dtype=np.int64)
+
+        if cell_size is None:
+            cell_size = cls._estimate_cell_size(segments)
+
+        index = cls(cell_size)
+        if n == 0:
+            return index
+
+        index._segments = segments.copy()
+        index._ids = ids.copy()
+        index._count = n
+
+        bounds = np.column_stack([
+            np.minimum(segments[:, 0], segments[:, 2]), np.minimum(segments[:, 1], segments[:, 3]),
+            np.maximum(segments[:, 0], segments[:, 2]), np.maximum(segments[:, 1], segments[:, 3])
+        ])
+        index._bounds = [*bounds[:, :2].min(axis=0), *bounds[:, 2:].max(axis=0)]
+
+        # (slot, cell) pairs covering each segment's bounding box
+        slots, keys = _covered_cells(bounds, index.cell_size)
+
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        slots = slots[order]
+        unique_keys, first = np.unique(keys, return_index=True)
+
+        index.cells = dict(zip(unique_keys.tolist(),
+                               (s.tolist() for s in np.split(slots, first[1:]))))
+
+        log.info(f"[SpatialIndex] Bulk-loaded {n} segments into {len(index.cells)} cells "
+                 f"(cell size {index.cell_size:.3f})")
+
+        return index
+
+    @staticmethod
+    def _estimate_cell_size(segments: np.ndarray) -> float:
+        """Pick a cell size of roughly one typical segment per cell"""
+
+        if len(segments) == 0:
+            return 1.0
+
+        extents = np.maximum(np.abs(segments[:, 2] - segments[:, 0]),
+                             np.abs(segments[:, 3] - segments[:, 1]))
+        typical = float(np.median(extents))
+
+        width = segments[:, 0::2].max() - segments[:, 0::2].min()
+        height = segments[:, 1::2].max() - segments[:, 1::2].min()
+        spacing = float(np.sqrt(max(width * height, 0.0) / len(segments)))
+
+        cell_size = max(typical, spacing)
+        return cell_size if cell_size > 1e-9 else 1.0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def insert(self, segment_id: int,
+               p_start: Tuple[float, float],
+               p_end: Tuple[float, float]):
+        """Add a single segment to the index"""
+
+        if self._count == len(self._segments):
+            capacity = max(16, 2 * len(self._segments))
+            segments = np.empty((capacity, 4), dtype=np.float64)
+            ids = np.empty(capacity, dtype=np.int64)
+            segments[:self._count] = self._segments[:self._count]
+            ids[:self._count] = self._ids[:self._count]
+            self._segments, self._ids = segments, ids
+
+        slot = self._count
+        x0, y0 = float(p_start[0]), float(p_start[1])
+        x1, y1 = float(p_end[0]), float(p_end[1])
+        self._segments[slot] = (x0, y0, x1, y1)
+        self._ids[slot] = segment_id
+        self._count += 1
+
+        b = self._bounds
+        self._bounds = [min(b[0], x0, x1), min(b[1], y0, y1),
+                        max(b[2], x0, x1), max(b[3], y0, y1)]
+
+        for key in self._keys_in_box(min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1)):
+            self.cells.setdefault(key, []).append(slot)
+
+    def _keys_in_box(self, x_min: float, y_min: float,
+                     x_max: float, y_max: float) -> List[int]:
+        """Cell keys covering a box"""
+
+        cs = self.cell_size
+        cx0, cx1 = int(np.floor(x_min / cs)), int(np.floor(x_max / cs))
+        cy0, cy1 = int(np.floor(y_min / cs)), int(np.floor(y_max / cs))
+        return [(cx << 32) + (cy & 0xFFFFFFFF)
+                for cx in range(cx0, cx1 + 1)
+                for cy in range(cy0, cy1 + 1)]
+
+    def _candidate_slots(self, x_min: float, y_min: float,
+                         x_max: float, y_max: float) -> np.ndarray:
+        """Slots registered in cells overlapping a box (superset of hits)"""
+
+        if self._count == 0:
+            return np.empty(0, dtype=np.int64)
+
+        # Clip the query to the populated extent before enumerating cells
+        b = self._bounds
+        x_min, y_min = max(x_min, b[0]), max(y_min, b[1])
+        x_max, y_max = min(x_max, b[2]), min(y_max, b[3])
+        if x_min > x_max or y_min > y_max:
+            return np.empty(0, dtype=np.int64)
+
+        cs = self.cell_size
+        cell_count = ((np.floor(x_max / cs) - np.floor(x_min / cs) + 1) *
+                      (np.floor(y_max / cs) - np.floor(y_min / cs) + 1))
+        if cell_count > len(self.cells):
+            # Box covers most of the grid: a vectorized scan is cheaper
+            return np.arange(self._count, dtype=np.int64)
+
+        found: List[int] = []
+        for key in self._keys_in_box(x_min, y_min, x_max, y_max):
+            bucket = self.cells.get(key)
+            if bucket:
+                found.extend(bucket)
+
+        return np.unique(np.asarray(found, dtype=np.int64))
+
+    def query_bbox(self, x_min: float, y_min: float,
+                   x_max: float, y_max: float) -> List[int]:
+        """
+        Find segments whose bounding box overlaps a query box.
+
+        Returns:
+            sorted list of segment ids
+        """
+
+        slots = self._candidate_slots(x_min, y_min, x_max, y_max)
+        if len(slots) == 0:
+            return []
+
+        seg = self._segments[slots]
+        hit = ((np.minimum(seg[:, 0], seg[:, 2]) <= x_max) &
+               (np.maximum(seg[:, 0], seg[:, 2]) >= x_min) &
+               (np.minimum(seg[:, 1], seg[:, 3]) <= y_max) &
+               (np.maximum(seg[:, 1], seg[:, 3]) >= y_min))
+
+        return sorted(self._ids[slots[hit]].tolist())
+
+    def segments_within(self, point: Tuple[float, float],
+                        radius: float) -> List[Tuple[int, float]]:
+        """
+        Find segments within a distance of a point.
+
+        Returns:
+            list of (segment_id, distance), nearest first
+        """
+
+        x, y = float(point[0]), float(point[1])
+        slots = self._candidate_slots(x - radius, y - radius, x + radius, y + radius)
+        if len(slots) == 0:
+            return []
+
+        distances, _ = point_segment_distances((x, y), self._segments[slots])
+        distances = distances[0]
+        keep = distances <= radius
+        slots, distances = slots[keep], distances[keep]
+        order = np.argsort(distances, kind='stable')
+
+        return list(zip(self._ids[slots[order]].tolist(), distances[order].tolist()))
+
+    def nearest_segment(self, point: Tuple[float, float],
+                        k: int = 1) -> List[Tuple[int, float]]:
+        """
+        Find the k segments closest to a point.
+
+        Searches a growing radius around the point and falls back to a full
+        vectorized scan once the radius covers the indexed extent.
+
+        Returns:
+            list of (segment_id, distance), nearest first (at most k entries)
+        """
+
+        if self._count == 0 or k < 1:
+            return []
+
+        x, y = float(point[0]), float(point[1])
+        b = self._bounds
+        reach = np.hypot(max(abs(x - b[0]), abs(x - b[2])),
+                         max(abs(y - b[1]), abs(y - b[3])))
+
+        radius = self.cell_size
+        while radius < reach:
+            hits = self.segments_within((x, y), radius)
+            if len(hits) >= k:
+                return hits[:k]
+            radius *= 2.0
+
+        distances, _ = point_segment_distances((x, y), self._segments[:self._count])
+        distances = distances[0]
+        order = np.argsort(distances, kind='stable')[:k]
+
+        return list(zip(self._ids[order].tolist(), distances[order].tolist()))
+
+
+# ============================================================================
+# UNIFORM GRID BOX INDEX
+# ============================================================================
+
+class BoxIndex:
+    """
+    Static uniform-grid index over axis-aligned 2D boxes.
+
+    Built for mesh faces (Mesh.face_index: face bounds in XY), where both
+    the indexed items and the queries come in large batches. Cells are a
+    sorted key array with item runs, so queries use searchsorted instead
+    of dictionary lookups. Items are identified by their row.
+    """
+
+    def __init__(self, boxes: np.ndarray, cell_size: Optional[float] = None):
+        """
+        Args:
+            boxes: (N, 4) array of (x_min, y_min, x_max, y_max)
+            cell_size: grid cell size (estimated from the data if omitted)
+        """
+
+        self.boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        if cell_size is None:
+            # Box rows share the segment layout, so extents read the same
+            cell_size = SegmentIndex._estimate_cell_size(self.boxes)
+        if cell_size <= 0:
+            raise ValueError("Cell size must be positive")
+        self.cell_size = float(cell_size)
+
+        items, keys = _covered_cells(self.boxes, self.cell_size)
+        order = np.argsort(keys, kind='stable')
+        self._keys = keys[order]
+        self._items = items[order]
+
+    def __len__(self) -> int:
+        return len(self.boxes)
+
+    def query(self, boxes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find indexed boxes overlapping each query box.
+
+        Args:
+            boxes: (Q, 4) query boxes (x_min, y_min, x_max, y_max)
+
+        Returns:
+            (queries, items): overlapping pairs, each once, sorted by query
+            row then item row
+        """
+
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        empty = np.empty(0, dtype=np.int64)
+        if len(boxes) == 0 or len(self._keys) == 0:
+            return empty, empty
+
+        # Clip queries to the indexed extent so huge boxes stay cheap
+        lo = self.boxes[:, :2].min(axis=0)
+        hi = self.boxes[:, 2:].max(axis=0)
+        clipped = np.column_stack([np.maximum(boxes[:, :2], lo), np.minimum(boxes[:, 2:], hi)])
+        valid = np.flatnonzero((clipped[:, 0] <= clipped[:, 2]) & (clipped[:, 1] <= clipped[:, 3]))
+        if len(valid) == 0:
+            return empty, empty
+
+        owners, keys = _covered_cells(clipped[valid], self.cell_size)
+        first = np.searchsorted(self._keys, keys, side='left')
+        count = np.searchsorted(self._keys, keys, side='right') - first
+
+        # Expand every (query, cell) pair into the items of that cell
+        queries = np.repeat(valid[owners], count)
+        offsets = np.repeat(first - (np.cumsum(count) - count), count)
+        items = self._items[offsets + np.arange(len(queries), dtype=np.int64)]
+
+        a, b = boxes[queries], self.boxes[items]
+        hit = ((a[:, 0] <= b[:, 2]) & (b[:, 0] <= a[:, 2]) &
+               (a[:, 1] <= b[:, 3]) & (b[:, 1] <= a[:, 3]))
+        pairs = np.unique(queries[hit] * len(self.boxes) + items[hit])
+
+        return pairs // len(self.boxes), pairs % len(self.boxes)
@@ -16,11 +16,15 @@ From the skeleton, we extract vertices, edges, and topological relationships.
 
 import cv2
 import numpy as np
-from scipy import ndimage
 from typing import List, Dict, Tuple, Optional, Set
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
+from pipeline.spatial_index import BoxIndex, SegmentIndex
+from pipeline.coordinate_frames import FrameSet, PIXEL_FRAME
+
 log = logging.getLogger(__name__)
 
 # ============================================================================
@@ -59,6 +63,58 @@ class WallEdge:
         return self.id == other.id
 
 
+class DisjointSet:
+    """
+    Union-find over integer ids 0..n-1 (union by size, path halving).
+    
+    Connectivity queries and unions run in O(α(n)) amortized time.
+    """
+    
+    def __init__(self):
+        self.parent: List[int] = []
+        self.size: List[int] = []
+        self.count = 0  # number of disjoint sets
+    
+    def add(self) -> int:
+        """Add a singleton set and return its id"""
+        item = len(self.parent)
+        self.parent.append(item)
+        self.size.append(1)
+        self.count += 1
+        return item
+    
+    def find(self, item: int) -> int:
+        """Return the representative of item's set"""
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+    
+    def union(self, a: int, b: int) -> bool:
+        """Merge the sets of a and b; returns False if already merged"""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        self.count -= 1
+        return True
+    
+    def connected(self, a: int, b: int) -> bool:
+        """Check whether a and b are in the same set"""
+        return self.find(a) == self.find(b)
+    
+    def groups(self) -> List[List[int]]:
+        """All sets as lists of ids, largest first"""
+        groups: Dict[int, List[int]] = {}
+        for item in range(len(self.parent)):
+            groups.setdefault(self.find(item), []).append(item)
+        return sorted(groups.values(), key=len, reverse=True)
+
+
 class WallTopologyGraph:
     """
     Directed/undirected graph representing wall structure.
@@ -75,6 +131,9 @@ class WallTopologyGraph:
         self.vertex_counter = 0
         self.edge_counter = 0
         self.adjacency: Dict[int, Set[int]] = {}  # vertex_id -> set of adjacent vertex_ids
+        self._segment_index: Optional[SegmentIndex] = None  # built on first spatial query
+        self._components = DisjointSet()  # vertex connectivity, kept current by add_edge
+        self.frames = FrameSet()  # coordinate frames over the pixel-space geometry
     
     def add_vertex(self, position: Tuple[float, float],
                    is_junction: bool = False,
@@ -88,6 +147,8 @@ class WallTopologyGraph:
         )
         self.vertices[vertex.id] = vertex
         self.adjacency[vertex.id] = set()
+        self._components.add()
+        self.frames.invalidate()
         self.vertex_counter += 1
         return vertex
     
@@ -111,6 +172,14 @@ class WallTopologyGraph:
         vertex_a.degree += 1
         vertex_b.degree += 1
         
+        # Update connectivity
+        self._components.union(vertex_a.id, vertex_b.id)
+        self.frames.invalidate()
+        
+        # Keep spatial index current once it exists
+        if self._segment_index is not None:
+            self._segment_index.insert(edge.id, vertex_a.position, vertex_b.position)
+        
         self.edge_counter += 1
         return edge
     
@@ -119,6 +188,79 @@ class WallTopologyGraph:
         neighbor_ids = self.adjacency[vertex.id]
         return [self.vertices[vid] for vid in neighbor_ids]
     
+    def spatial_index(self) -> SegmentIndex:
+        """
+        Get the segment index over edge centerlines (vertex_a -> vertex_b).
+        
+        Bulk-loaded on first use; afterwards add_edge() updates it
+        incrementally. Query results are edge ids.
+        """
+        
+        if self._segment_index is None:
+            ids = np.fromiter(self.edges.keys(), dtype=np.int64, count=len(self.edges))
+            segments = np.array(
+                [(*e.vertex_a.position, *e.vertex_b.position) for e in self.edges.values()],
+                dtype=np.float64
+            ).reshape(-1, 4)
+            self._segment_index = SegmentIndex.bulk_load(segments, ids)
+        
+        return self._segment_index
+    
+    def vertex_ids(self) -> np.ndarray:
+        """Vertex ids in the row order of vertex_positions()"""
+        return np.fromiter(self.vertices.keys(), dtype=np.int64, count=len(self.vertices))
+    
+    def vertex_positions(self, frame: str = PIXEL_FRAME) -> np.ndarray:
+        """
+        (V, 2) vertex positions in a coordinate frame (read-only, cached).
+        
+        Rows follow vertex_ids().
+        """
+        return self.frames.resolve(
+            'vertex_positions', frame,
+            lambda: np.array([v.position for v in self.vertices.values()],
+                             dtype=np.float64).reshape(-1, 2)
+        )
+    
+    def edge_ids(self) -> np.ndarray:
+        """Edge ids in the row order of edge_segments()"""
+        return np.fromiter(self.edges.keys(), dtype=np.int64, count=len(self.edges))
+    
+    def edge_segments(self, frame: str = PIXEL_FRAME) -> np.ndarray:
+        """
+        (E, 2, 2) edge centerlines (vertex_a, vertex_b) in a coordinate
+        frame (read-only, cached). Rows follow edge_ids().
+        """
+        return self.frames.resolve(
+            'edge_segments', frame,
+            lambda: np.array([(e.vertex_a.position, e.vertex_b.position) for e in self.edges.values()],
+                             dtype=np.float64).reshape(-1, 2, 2)
+        )
+    
+    def edge_vertex_rows(self) -> np.ndarray:
+        """
+        (E, 2) rows of each edge's (vertex_a, vertex_b) in vertex_positions().
+        
+        Rows follow edge_ids().
+        """
+        row = {vertex_id: i for i, vertex_id in enumerate(self.vertices)}
+        return np.array([(row[e.vertex_a.id], row[e.vertex_b.id]) for e in self.edges.values()],
+                        dtype=np.int64).reshape(-1, 2)
+    
+    def edge_lengths(self, frame: str = PIXEL_FRAME) -> np.ndarray:
+        """(E,) traced edge lengths in a coordinate frame (read-only, cached)"""
+        return self.frames.resolve(
+            'edge_lengths', frame,
+            lambda: np.fromiter((e.length_px for e in self.edges.values()),
+                                dtype=np.float64, count=len(self.edges)),
+            kind='lengths'
+        )
+    
+    def edge_points(self, edge_id: int, frame: str = PIXEL_FRAME) -> np.ndarray:
+        """(K, 2) traced points of one edge in a coordinate frame"""
+        points = np.asarray(self.edges[edge_id].points, dtype=np.float64).reshape(-1, 2)
+        return self.frames.get(frame).apply(points)
+    
     def validate(self) -> Tuple[bool, str]:
         """
         Validate graph structure.
@@ -135,29 +277,57 @@ class WallTopologyGraph:
         
         # Check connectivity
         if not self._is_connected():
-            return False, "Graph is not connected (broken wall topology)"
+            return False, f"Graph is not connected (broken wall topology): {self._describe_fragments()}"
         
         return True, "Graph structure valid"
     
     def _is_connected(self) -> bool:
-        """Check if graph is fully connected (BFS)"""
+        """Check if graph is fully connected (union-find, O(1))"""
         if not self.vertices:
             return False
+        return self._components.count == 1
+    
+    def connected(self, vertex_a: WallVertex, vertex_b: WallVertex) -> bool:
+        """Check whether two vertices are joined by a chain of walls"""
+        return self._components.connected(vertex_a.id, vertex_b.id)
+    
+    def component_count(self) -> int:
+        """Number of connected components"""
+        return self._components.count
+    
+    def components(self) -> List[List[int]]:
+        """Connected components as lists of vertex ids, largest first"""
+        return self._components.groups()
+    
+    def component_sizes(self) -> List[int]:
+        """Vertex count of each connected component, largest first"""
+        return [len(c) for c in self.components()]
+    
+    def fragments(self, max_vertices: Optional[int] = None) -> List[List[int]]:
+        """
+        Components disconnected from the main (largest) wall structure.
         
-        visited = set()
-        start_vertex_id = next(iter(self.vertices.keys()))
-        queue = [start_vertex_id]
-        
-        while queue:
-            vid = queue.pop(0)
-            if vid in visited:
-                continue
-            visited.add(vid)
-            for neighbor_id in self.adjacency[vid]:
-                if neighbor_id not in visited:
-                    queue.append(neighbor_id)
+        Args:
+            max_vertices: only return fragments with at most this many vertices
         
-        return len(visited) == len(self.vertices)
+        Returns:
+            list of vertex id lists, largest first
+        """
+        fragments = self.components()[1:]
+        if max_vertices is not None:
+            fragments = [f for f in fragments if len(f) <= max_vertices]
+        return fragments
+    
+    def _describe_fragments(self, limit: int = 5) -> str:
+        """Human-readable summary of disconnected fragments"""
+        fragments = self.fragments()
+        parts = []
+        for fragment in fragments[:limit]:
+            x, y = self.vertices[fragment[0]].position
+            parts.append(f"{len(fragment)} vertices near ({x:.1f}, {y:.1f})")
+        if len(fragments) > limit:
+            parts.append(f"{len(fragments) - limit} more")
+        return f"{self.component_count()} components; fragments: " + ", ".join(parts)
     
     def summary(self) -> Dict:
         """Get summary statistics"""
@@ -166,7 +336,8 @@ class WallTopologyGraph:
             'edge_count': len(self.edges),
             'total_edge_length': sum(e.length_px for e in self.edges.values()),
             'junction_count': sum(1 for v in self.vertices.values() if v.is_junction),
-            'corner_count': sum(1 for v in self.vertices.values() if v.is_corner)
+            'corner_count': sum(1 for v in self.vertices.values() if v.is_corner),
+            'component_count': self.component_count()
         }
 
 # ============================================================================
@@ -184,12 +355,30 @@ class TopologyExtractor:
     4. Build wall topology graph
     """
     
-    def __init__(self, wall_mask: np.ndarray):
+    ENGINES = ('skeleton', 'segments')
+    
+    def __init__(self, wall_mask: np.ndarray, engine: str = 'skeleton',
+                 workers: Optional[int] = None,
+                 tile_size: int = 2048,
+                 tile_overlap: int = 64):
         """
         Args:
             wall_mask: Binary wall mask from Stage 2
+            engine: 'skeleton' (thinning + pixel tracing) or 'segments'
+                    (line-segment detection, for clean axis-aligned CAD plans)
+            workers: thinning threads for large masks (default: CPU count)
+            tile_size: masks larger than this are thinned in tiles (pixels)
+            tile_overlap: halo around each tile; should exceed the
+                          thickest wall so tiles agree at seams
         """
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown topology engine: {engine}")
+        
         self.wall_mask = wall_mask.astype(np.uint8)
+        self.engine = engine
+        self.workers = workers or os.cpu_count() or 1
+        self.tile_size = tile_size
+        self.tile_overlap = tile_overlap
         self.skeleton = None
         self.graph = None
     
@@ -201,7 +390,11 @@ class TopologyExtractor:
             WallTopologyGraph or None if failed
         """
         
-        log.info("[Topology] Extracting wall topology")
+        log.info(f"[Topology] Extracting wall topology (engine: {self.engine})")
+        
+        if self.engine == 'segments':
+            self.graph = LineSegmentTopology(self.wall_mask).extract()
+            return self.graph
         
         # Step 1: Skeletonize
         self.skeleton = self._skeletonize_wall_mask()
@@ -218,7 +411,11 @@ class TopologyExtractor:
     
     def _skeletonize_wall_mask(self) -> np.ndarray:
         """
-        Skeletonize wall mask using Zhang-Suen or Medial Axis Transform.
+        Skeletonize wall mask using Zhang-Suen thinning.
+        
+        Masks larger than tile_size are split into overlapping tiles that
+        are thinned in a thread pool (OpenCV releases the GIL); each tile
+        contributes only its core, and seams are stitched afterwards.
         
         Returns:
             Binary skeleton image
@@ -226,18 +423,85 @@ class TopologyExtractor:
         
         log.info("[Topology] Running skeletonization (Zhang-Suen)")
         
-        # Use scipy's binary_erosion to compute medial axis
-        from scipy.ndimage import binary_erosion, distance_transform_edt
+        h, w = self.wall_mask.shape
+        if max(h, w) <= self.tile_size:
+            return cv2.ximgproc.thinning(self.wall_mask).astype(np.uint8)
         
-        # Medial axis transform
-        _, skeleton = ndimage.distance_transform_edt(
-            255 - self.wall_mask, return_indices=True
-        )
+        tiles = [
+            (y0, min(y0 + self.tile_size, h), x0, min(x0 + self.tile_size, w))
+            for y0 in range(0, h, self.tile_size)
+            for x0 in range(0, w, self.tile_size)
+        ]
+        log.info(f"[Topology] Thinning {len(tiles)} tiles on {self.workers} threads")
+        
+        skeleton = np.zeros((h, w), dtype=np.uint8)
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for (y0, y1, x0, x1), core in zip(tiles, pool.map(self._thin_tile, tiles)):
+                skeleton[y0:y1, x0:x1] = core
+        
+        joined = self._stitch_seams(skeleton)
+        log.info(f"[Topology] Stitched {joined} seam crossings")
+        
+        return skeleton
+    
+    def _thin_tile(self, tile: Tuple[int, int, int, int]) -> np.ndarray:
+        """Thin one tile with its halo and return the core region"""
+        y0, y1, x0, x1 = tile
+        h, w = self.wall_mask.shape
+        hy0, hy1 = max(0, y0 - self.tile_overlap), min(h, y1 + self.tile_overlap)
+        hx0, hx1 = max(0, x0 - self.tile_overlap), min(w, x1 + self.tile_overlap)
+        thinned = cv2.ximgproc.thinning(self.wall_mask[hy0:hy1, hx0:hx1])
+        return thinned[y0 - hy0:y1 - hy0, x0 - hx0:x1 - hx0]
+    
+    def _stitch_seams(self, skeleton: np.ndarray) -> int:
+        """
+        Reconnect skeleton lines across tile seams.
+        
+        At each seam, runs of skeleton pixels on either side are the
+        boundary crossing points of the two tiles. Each crossing is matched
+        to the nearest one across the seam (within the tile overlap) and
+        joined with a short line if the two are not already 8-connected.
+        
+        Returns:
+            number of crossings that needed joining
+        """
+        
+        h, w = skeleton.shape
+        joined = 0
+        
+        for x in range(self.tile_size, w, self.tile_size):
+            joined += self._join_crossings(skeleton, skeleton[:, x - 1], skeleton[:, x],
+                                           lambda r: (x - 1, r), lambda r: (x, r))
+        for y in range(self.tile_size, h, self.tile_size):
+            joined += self._join_crossings(skeleton, skeleton[y - 1, :], skeleton[y, :],
+                                           lambda c: (c, y - 1), lambda c: (c, y))
+        
+        return joined
+    
+    def _join_crossings(self, skeleton: np.ndarray,
+                        before: np.ndarray, after: np.ndarray,
+                        point_before, point_after) -> int:
+        """Match crossing runs along a seam and draw any missing links"""
         
-        # Alternative: Thinning using Zhang-Suen
-        skeleton = cv2.ximgproc.thinning(self.wall_mask)
+        def run_centers(line: np.ndarray) -> np.ndarray:
+            on = np.concatenate([[0], (line > 0).astype(np.int8), [0]])
+            edges = np.diff(on)
+            starts, stops = np.nonzero(edges == 1)[0], np.nonzero(edges == -1)[0]
+            return (starts + stops - 1) // 2
         
-        return skeleton.astype(np.uint8)
+        a, b = run_centers(before), run_centers(after)
+        if len(a) == 0 or len(b) == 0:
+            return 0
+        
+        joined = 0
+        for pos in a:
+            nearest = b[np.argmin(np.abs(b - pos))]
+            gap = abs(int(nearest) - int(pos))
+            if 1 < gap <= self.tile_overlap:
+                cv2.line(skeleton, point_before(int(pos)), point_after(int(nearest)), 255, 1)
+                joined += 1
+        
+        return joined
     
     def _detect_key_points(self) -> Tuple[List, List, List]:
         """
@@ -370,11 +634,374 @@ class TopologyExtractor:
         # This is a placeholder - real implementation would trace skeleton
         return [(start[0], start[1]), (end[0], end[1])]
 
+# ============================================================================
+# LINE-SEGMENT TOPOLOGY ENGINE
+# ============================================================================
+
+class LineSegmentTopology:
+    """
+    Build the wall graph from straight wall borders instead of a skeleton.
+    
+    Intended for clean, mostly axis-aligned CAD plans where thinning and
+    pixel tracing are unnecessary.
+    
+    Algorithm:
+    1. Detect straight border segments of the wall mask (LSD, falling back
+       to probabilistic Hough)
+    2. Pair parallel borders with wall material between them into
+       centerlines (thickness = border distance)
+    3. Merge collinear overlapping centerlines
+    4. Snap endpoints into junctions with a spatial hash; each junction is
+       placed at the least-squares intersection of its walls
+    5. Split walls where another wall ends on them (T-junctions)
+    6. Emit a WallTopologyGraph
+    """
+    
+    def __init__(self, wall_mask: np.ndarray,
+                 min_segment_px: float = 4.0,
+                 max_thickness_px: float = 60.0,
+                 angle_tolerance_deg: float = 5.0):
+        """
+        Args:
+            wall_mask: Binary wall mask from Stage 2
+            min_segment_px: ignore border segments shorter than this
+            max_thickness_px: thickest wall to pair borders across
+            angle_tolerance_deg: borders within this angle count as parallel
+        """
+        self.wall_mask = (wall_mask > 0).astype(np.uint8)
+        self.min_segment_px = min_segment_px
+        self.max_thickness_px = max_thickness_px
+        self.parallel_sin = np.sin(np.radians(angle_tolerance_deg))
+    
+    def extract(self) -> WallTopologyGraph:
+        """
+        Extract the wall graph.
+        
+        Returns:
+            WallTopologyGraph (possibly empty)
+        """
+        
+        borders = self._detect_borders()
+        log.info(f"[Topology] Detected {len(borders)} wall border segments")
+        
+        centerlines, thickness = self._pair_borders(borders)
+        centerlines, thickness = self._merge_collinear(centerlines, thickness)
+        log.info(f"[Topology] Paired borders into {len(centerlines)} wall centerlines")
+        
+        return self._build_graph(centerlines, thickness)
+    
+    def _detect_borders(self) -> np.ndarray:
+        """
+        Straight border segments of the wall mask.
+        
+        Returns:
+            (N, 4) array of (x0, y0, x1, y1)
+        """
+        
+        # Pad so walls touching the image edge still get a border line
+        pad = 2
+        image = cv2.copyMakeBorder(self.wall_mask * 255, pad, pad, pad, pad,
+                                   cv2.BORDER_CONSTANT, value=0)
+        
+        try:
+            lsd = cv2.createLineSegmentDetector(cv2.LSD_REFINE_STD)
+            lines = lsd.detect(image)[0]
+        except (cv2.error, AttributeError):
+            log.warning("[Topology] LSD unavailable, using probabilistic Hough")
+            lines = cv2.HoughLinesP(cv2.Canny(image, 50, 150), 1, np.pi / 180, 20,
+                                    minLineLength=self.min_segment_px, maxLineGap=2)
+        
+        if lines is None:
+            return np.empty((0, 4))
+        
+        segments = lines.reshape(-1, 4).astype(np.float64) - pad
+        lengths = np.hypot(segments[:, 2] - segments[:, 0], segments[:, 3] - segments[:, 1])
+        return segments[lengths >= self.min_segment_px]
+    
+    def _candidate_pairs(self, segments: np.ndarray, reach: float,
+                         chunk: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Segment pairs (i < j) whose bounding boxes come within reach.
+        
+        Uses a BoxIndex over the segment bounds, so only nearby segments
+        are compared instead of all n^2 pairs.
+        
+        Returns:
+            (i, j) index arrays, sorted by i then j
+        """
+        
+        boxes = np.column_stack([np.minimum(segments[:, 0:2], segments[:, 2:4]),
+                                 np.maximum(segments[:, 0:2], segments[:, 2:4])])
+        index = BoxIndex(boxes)
+        padded = boxes + np.array([-reach, -reach, reach, reach])
+        
+        rows, cols = [], []
+        for start in range(0, len(segments), chunk):
+            i, j = index.query(padded[start:start + chunk])
+            i += start
+            upper = i < j
+            rows.append(i[upper])
+            cols.append(j[upper])
+        return np.concatenate(rows), np.concatenate(cols)
+    
+    def _pair_borders(self, borders: np.ndarray,
+                      chunk: int = 4096) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Pair facing parallel borders into wall centerlines.
+        
+        Two borders pair when they are parallel, overlap along their axis,
+        lie within max_thickness_px of each other, and the strip between
+        them is wall material. Only border pairs whose boxes come within
+        max_thickness_px are tested.
+        
+        Returns:
+            (centerlines (M, 4), thickness (M,))
+        """
+        
+        n = len(borders)
+        if n < 2:
+            return np.empty((0, 4)), np.empty(0)
+        
+        p0 = borders[:, 0:2]
+        vec = borders[:, 2:4] - p0
+        length = np.linalg.norm(vec, axis=1)
+        d = vec / length[:, None]
+        
+        centerlines, thickness = [], []
+        rows, cols = self._candidate_pairs(borders, self.max_thickness_px, chunk)
+        for start in range(0, len(rows), chunk):
+            i, j = rows[start:start + chunk], cols[start:start + chunk]
+            di, pi = d[i], p0[i]
+            
+            # Parallel within tolerance
+            parallel = np.abs(di[:, 0] * d[j, 1] - di[:, 1] * d[j, 0]) < self.parallel_sin
+            
+            # Signed offset of j's midpoint from i's line
+            mid_j = p0[j] + 0.5 * vec[j]
+            offset = di[:, 0] * (mid_j[:, 1] - pi[:, 1]) - di[:, 1] * (mid_j[:, 0] - pi[:, 0])
+            near = (np.abs(offset) >= 1.0) & (np.abs(offset) <= self.max_thickness_px)
+            
+            # Overlap of j's projection with i along i's axis
+            ta = np.einsum('pk,pk->p', p0[j] - pi, di)
+            tb = np.einsum('pk,pk->p', borders[j, 2:4] - pi, di)
+            lo = np.maximum(0.0, np.minimum(ta, tb))
+            hi = np.minimum(length[i], np.maximum(ta, tb))
+            overlapping = (hi - lo) >= self.min_segment_px
+            
+            keep = np.flatnonzero(parallel & near & overlapping)
+            if len(keep) == 0:
+                continue
+            
+            # Centerline along the overlap, halfway between the borders
+            ii = i[keep]
+            normal = np.stack([-d[ii, 1], d[ii, 0]], axis=1)
+            half = 0.5 * offset[keep][:, None]
+            a = p0[ii] + d[ii] * lo[keep][:, None] + normal * half
+            b = p0[ii] + d[ii] * hi[keep][:, None] + normal * half
+            
+            # Strip between borders must be wall: sample across it at 3 stations
+            solid = np.ones(len(keep), dtype=bool)
+            for frac in (0.25, 0.5, 0.75):
+                station = a + (b - a) * frac
+                for across in (-0.25, 0.0, 0.25):
+                    sample = station + normal * (2.0 * half * across)
+                    solid &= self._is_wall(sample)
+            
+            centerlines.append(np.hstack([a, b])[solid])
+            thickness.append(np.abs(2.0 * half[solid, 0]))
+        
+        if not centerlines:
+            return np.empty((0, 4)), np.empty(0)
+        return np.vstack(centerlines), np.concatenate(thickness)
+    
+    def _is_wall(self, points: np.ndarray) -> np.ndarray:
+        """Wall-mask lookup at (N, 2) sub-pixel points"""
+        h, w = self.wall_mask.shape
+        x = np.clip(np.round(points[:, 0]).astype(np.int64), 0, w - 1)
+        y = np.clip(np.round(points[:, 1]).astype(np.int64), 0, h - 1)
+        return self.wall_mask[y, x] > 0
+    
+    def _merge_collinear(self, centerlines: np.ndarray,
+                         thickness: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Merge centerlines that lie on the same line and overlap"""
+        
+        n = len(centerlines)
+        if n < 2:
+            return centerlines, thickness
+        
+        p0 = centerlines[:, 0:2]
+        vec = centerlines[:, 2:4] - p0
+        length = np.maximum(np.linalg.norm(vec, axis=1), 1e-9)
+        d = vec / length[:, None]
+        
+        # Parallel, within 1px of each other's line, and overlapping; only
+        # centerlines whose boxes come within 1px can qualify
+        i, j = self._candidate_pairs(centerlines, 1.0, chunk=4096)
+        cross = np.abs(d[i, 0] * d[j, 1] - d[i, 1] * d[j, 0])
+        rel = p0[j] - p0[i]
+        off = np.abs(d[i, 0] * rel[:, 1] - d[i, 1] * rel[:, 0])
+        ta = np.einsum('pk,pk->p', rel, d[i])
+        tb = np.einsum('pk,pk->p', centerlines[j, 2:4] - p0[i], d[i])
+        overlap = np.minimum(length[i], np.maximum(ta, tb)) - np.maximum(0.0, np.minimum(ta, tb))
+        same = (cross < self.parallel_sin) & (off <= 1.0) & (overlap > 0.5)
+        
+        groups = DisjointSet()
+        for _ in range(n):
+            groups.add()
+        for a, b in zip(i[same].tolist(), j[same].tolist()):
+            groups.union(a, b)
+        
+        merged, merged_thickness = [], []
+        for members in groups.groups():
+            anchor = members[0]
+            axis = d[anchor]
+            pts = np.vstack([p0[members], centerlines[members, 2:4]])
+            t = (pts - p0[anchor]) @ axis
+            perp = np.array([-axis[1], axis[0]])
+            offset = ((pts - p0[anchor]) @ perp).mean()
+            base = p0[anchor] + perp * offset
+            merged.append(np.hstack([base + axis * t.min(), base + axis * t.max()]))
+            merged_thickness.append(thickness[members].max())
+        
+        return np.array(merged), np.array(merged_thickness)
+    
+    def _build_graph(self, centerlines: np.ndarray,
+                     thickness: np.ndarray) -> WallTopologyGraph:
+        """Snap centerline endpoints into junctions and emit the graph"""
+        
+        graph = WallTopologyGraph()
+        n = len(centerlines)
+        if n == 0:
+            return graph
+        
+        ends = centerlines.reshape(-1, 2)          # endpoint 2k / 2k+1 of line k
+        end_line = np.repeat(np.arange(n), 2)
+        end_radius = np.repeat(thickness, 2)
+        directions = centerlines[:, 2:4] - centerlines[:, 0:2]
+        directions /= np.maximum(np.linalg.norm(directions, axis=1), 1e-9)[:, None]
+        
+        # Spatial hash: endpoints closer than their wall thickness join a junction
+        cell = max(float(end_radius.max()), 1.0)
+        keys = np.floor(ends / cell).astype(np.int64)
+        buckets: Dict[Tuple[int, int], List[int]] = {}
+        for k, key in enumerate(map(tuple, keys.tolist())):
+            buckets.setdefault(key, []).append(k)
+        
+        groups = DisjointSet()
+        for _ in range(len(ends)):
+            groups.add()
+        for (cx, cy), members in buckets.items():
+            near = [m for dx in (-1, 0, 1) for dy in (-1, 0, 1)
+                    for m in buckets.get((cx + dx, cy + dy), ())]
+            for a in members:
+                for b in near:
+                    if a < b and end_line[a] != end_line[b]:
+                        gap = np.hypot(*(ends[a] - ends[b]))
+                        if gap <= max(end_radius[a], end_radius[b]):
+                            groups.union(a, b)
+        
+        clusters = groups.groups()
+        end_cluster = np.empty(len(ends), dtype=np.int64)
+        for c, members in enumerate(clusters):
+            end_cluster[members] = c
+        junctions = np.array([self._junction_point(ends[m], directions[end_line[m]])
+                              for m in clusters])
+        
+        # T-junctions: free wall ends landing on another wall's interior
+        splits: Dict[int, List[Tuple[float, int]]] = {k: [] for k in range(n)}
+        free = np.array([c for c, members in enumerate(clusters) if len(members) == 1], dtype=np.int64)
+        if len(free):
+            # Only walls whose boxes lie within one wall thickness can host
+            bounds = np.column_stack([np.minimum(centerlines[:, 0:2], centerlines[:, 2:4]),
+                                      np.maximum(centerlines[:, 0:2], centerlines[:, 2:4])])
+            reach = float(thickness.max())
+            points = junctions[free]
+            rows, hosts = BoxIndex(bounds).query(np.hstack([points - reach, points + reach]))
+            
+            host_p0 = centerlines[hosts, 0:2]
+            vec = centerlines[hosts, 2:4] - host_p0
+            length_sq = np.einsum('pk,pk->p', vec, vec)
+            t = np.einsum('pk,pk->p', points[rows] - host_p0, vec) / np.maximum(length_sq, 1e-12)
+            t = np.clip(t, 0.0, 1.0)
+            distances = np.linalg.norm(points[rows] - (host_p0 + t[:, None] * vec), axis=1)
+            length = np.sqrt(length_sq)
+            
+            own = end_line[[clusters[c][0] for c in free]]
+            inside = (t * length > thickness[hosts]) & ((1 - t) * length > thickness[hosts])
+            hit = np.flatnonzero((distances <= thickness[hosts]) & inside & (hosts != own[rows]))
+            
+            # Nearest host per free end (stable sort keeps the lowest wall on ties)
+            hit = hit[np.lexsort((distances[hit], rows[hit]))]
+            first = np.ones(len(hit), dtype=bool)
+            first[1:] = rows[hit[1:]] != rows[hit[:-1]]
+            for k in hit[first].tolist():
+                c, host = int(free[rows[k]]), int(hosts[k])
+                junctions[c] = host_p0[k] + t[k] * vec[k]
+                splits[host].append((t[k], c))
+        
+        # Emit graph
+        degree = np.zeros(len(clusters), dtype=np.int64)
+        chains = []
+        for k in range(n):
+            chain = [end_cluster[2 * k]] + [c for _, c in sorted(splits[k])] + [end_cluster[2 * k + 1]]
+            chains.append(chain)
+            for a, b in zip(chain[:-1], chain[1:]):
+                if a != b:
+                    degree[a] += 1
+                    degree[b] += 1
+        
+        vertices = {}
+        for c in np.nonzero(degree)[0]:
+            vertices[c] = graph.add_vertex(
+                position=(float(junctions[c, 0]), float(junctions[c, 1])),
+                is_junction=bool(degree[c] >= 3),
+                is_corner=bool(degree[c] == 2 and self._is_corner_cluster(clusters[c], end_line, directions))
+            )
+        
+        seen = set()
+        for chain in chains:
+            for a, b in zip(chain[:-1], chain[1:]):
+                key = (min(a, b), max(a, b))
+                if a == b or key in seen:
+                    continue
+                seen.add(key)
+                va, vb = vertices[a], vertices[b]
+                length = float(np.hypot(va.position[0] - vb.position[0], va.position[1] - vb.position[1]))
+                graph.add_edge(va, vb, length, [
+                    (int(round(va.position[0])), int(round(va.position[1]))),
+                    (int(round(vb.position[0])), int(round(vb.position[1])))
+                ])
+        
+        log.info(f"[Topology] Segment engine: {len(graph.vertices)} vertices, {len(graph.edges)} edges")
+        return graph
+    
+    def _junction_point(self, points: np.ndarray, directions: np.ndarray) -> np.ndarray:
+        """Least-squares intersection of the walls meeting at a junction"""
+        
+        if len(points) == 1:
+            return points[0]
+        
+        # Minimize sum of squared distances to each wall's line
+        projector = np.eye(2)[None, :, :] - directions[:, :, None] * directions[:, None, :]
+        a = projector.sum(axis=0)
+        b = np.einsum('nij,nj->i', projector, points)
+        if np.linalg.cond(a) > 1.0 / self.parallel_sin ** 2:
+            return points.mean(axis=0)  # all walls parallel: no unique crossing
+        return np.linalg.solve(a, b)
+    
+    def _is_corner_cluster(self, members: List[int], end_line: np.ndarray,
+                           directions: np.ndarray) -> bool:
+        """Two walls meeting at a real angle (not a straight continuation)"""
+        lines = directions[end_line[members]]
+        return len(lines) == 2 and abs(lines[0, 0] * lines[1, 1] - lines[0, 1] * lines[1, 0]) >= self.parallel_sin
+
+
 # ============================================================================
 # STAGE 3 MAIN INTERFACE
 # ============================================================================
 
-def stage3_topology_extraction(refined_wall_mask: np.ndarray) -> Optional[WallTopologyGraph]:
+def stage3_topology_extraction(refined_wall_mask: np.ndarray,
+                               engine: str = 'skeleton') -> Optional[WallTopologyGraph]:
     """
     STAGE 3: Topology Extraction (CRITICAL)
     
@@ -385,6 +1012,7 @@ def stage3_topology_extraction(refined_wall_mask: np.ndarray) -> Optional[WallTo
     
     Args:
         refined_wall_mask: Binary wall mask from Stage 2
+        engine: 'skeleton' or 'segments' (see TopologyExtractor)
     
     Returns:
         WallTopologyGraph or None if failed
@@ -399,7 +1027,7 @@ def stage3_topology_extraction(refined_wall_mask: np.ndarray) -> Optional[WallTo
         return None
     
     # Extract topology
-    extractor = TopologyExtractor(refined_wall_mask)
+    extractor = TopologyExtractor(refined_wall_mask, engine=engine)
     graph = extractor.extract()
     
     if graph is None:
@@ -422,6 +1050,7 @@ def stage3_topology_extraction(refined_wall_mask: np.ndarray) -> Optional[WallTo
     log.info(f"  Total wall length: {summary['total_edge_length']:.1f} pixels")
     log.info(f"  Junctions: {summary['junction_count']}")
     log.info(f"  Corners: {summary['corner_count']}")
+    log.info(f"  Components: {summary['component_count']}")
     
     log.info("[Topology] ✓ STAGE 3 COMPLETE")
     return graph
@@ -20,23 +20,165 @@ import cv2
 import numpy as np
 from typing import List, Dict, Optional, Tuple, Set
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+from pipeline.coordinate_frames import FrameSet, PIXEL_FRAME
 
 log = logging.getLogger(__name__)
 
+# ============================================================================
+# POLYGON UTILITIES
+# ============================================================================
+
+def polygon_signed_area(polygon: np.ndarray) -> float:
+    """Shoelace area of a closed (N, 2) ring; positive when counter-clockwise"""
+    x, y = polygon[:, 0], polygon[:, 1]
+    return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y))
+
+
+def polygon_perimeter(polygon: np.ndarray) -> float:
+    """Length of a closed (N, 2) ring"""
+    return float(np.linalg.norm(np.roll(polygon, -1, axis=0) - polygon, axis=1).sum())
+
+
+def polygon_centroid(polygon: np.ndarray) -> Tuple[float, float]:
+    """Area centroid of a closed (N, 2) ring (vertex mean if degenerate)"""
+    x, y = polygon[:, 0], polygon[:, 1]
+    x_next, y_next = np.roll(x, -1), np.roll(y, -1)
+    cross = x * y_next - x_next * y
+    area = 0.5 * cross.sum()
+    if abs(area) < 1e-12:
+        return float(x.mean()), float(y.mean())
+    return (float(((x + x_next) * cross).sum() / (6.0 * area)),
+            float(((y + y_next) * cross).sum() / (6.0 * area)))
+
+
+def points_in_polygon(points: np.ndarray, polygon: np.ndarray) -> np.ndarray:
+    """Even-odd point-in-polygon test for (P, 2) points against one ring"""
+    x, y = points[:, 0:1], points[:, 1:2]
+    x0, y0 = polygon[:, 0], polygon[:, 1]
+    x1, y1 = np.roll(x0, -1), np.roll(y0, -1)
+    crosses = (y0 > y) != (y1 > y)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_hit = x0 + (y - y0) * (x1 - x0) / (y1 - y0)
+    return (crosses & (x < x_hit)).sum(axis=1) % 2 == 1
+
+
+def offset_ring(polygon: np.ndarray, distance: float) -> np.ndarray:
+    """Miter-offset a counter-clockwise ring outward by distance (inward if negative)"""
+    edges = np.roll(polygon, -1, axis=0) - polygon
+    lengths = np.maximum(np.linalg.norm(edges, axis=1, keepdims=True), 1e-12)
+    normals = np.column_stack([edges[:, 1], -edges[:, 0]]) / lengths
+    n_in, n_out = np.roll(normals, 1, axis=0), normals
+    # Clamp near-reversals so spikes cannot shoot off
+    denom = np.maximum(1.0 + np.einsum('ij,ij->i', n_in, n_out), 0.1)
+    return polygon + distance * (n_in + n_out) / denom[:, None]
+
+
+def trace_region_polygon(region: np.ndarray,
+                         origin: Tuple[float, float] = (0.0, 0.0),
+                         tolerance: float = 1.0) -> Tuple[np.ndarray, List[np.ndarray]]:
+    """
+    Outer ring and holes of a pixel region as simplified polygons.
+    
+    Contours run through boundary pixel centers; they are pushed out by half
+    a pixel so the rings follow pixel edges and the shoelace area matches
+    the pixel count for straight walls. Only the largest outer ring is kept.
+    
+    Args:
+        region: (H, W) mask of one region
+        origin: (x, y) image position of region[0, 0]
+        tolerance: approxPolyDP tolerance (pixels)
+    
+    Returns:
+        (outer, holes): counter-clockwise (N, 2) rings in image coordinates
+    """
+    
+    padded = cv2.copyMakeBorder(region.astype(np.uint8), 1, 1, 1, 1,
+                                cv2.BORDER_CONSTANT, value=0)
+    offset = np.array(origin, dtype=np.float64) - 1.0
+    
+    # Holes are traced as regions of their own (enclosed background), so
+    # their rings also run through pixel centers and grow by half a pixel
+    background = 1 - padded
+    cv2.floodFill(background, None, (0, 0), 0)
+    
+    def trace(mask: np.ndarray) -> List[np.ndarray]:
+        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        rings = []
+        for contour in contours:
+            ring = cv2.approxPolyDP(contour, tolerance, True).reshape(-1, 2).astype(np.float64)
+            if polygon_signed_area(ring) < 0:
+                ring = ring[::-1]
+            
+            if len(ring) < 3 or abs(polygon_signed_area(ring)) < 1e-9:
+                # Single-pixel-wide strip: the contour folds back on itself
+                (x0, y0), (x1, y1) = ring.min(axis=0) - 0.5, ring.max(axis=0) + 0.5
+                ring = np.array([(x0, y0), (x1, y0), (x1, y1), (x0, y1)], dtype=np.float64)
+            else:
+                ring = offset_ring(ring, 0.5)
+            rings.append(ring + offset)
+        return rings
+    
+    outer = max(trace(padded), key=lambda ring: polygon_signed_area(ring))
+    
+    return outer, trace(background)
+
 # ============================================================================
 # DATA STRUCTURES FOR ROOMS
 # ============================================================================
 
 @dataclass
 class Room:
-    """Represents an enclosed room/space in the blueprint"""
+    """
+    Represents an enclosed room/space in the blueprint.
+    
+    Raster rooms are a label in their room set's label image: only summary
+    stats are stored and pixels are read from the image on demand.
+    """
     id: int
-    pixels: Set[Tuple[int, int]]      # Set of (x, y) pixels in this room
     centroid: Tuple[float, float]     # Center of mass
-    area_px: int                       # Area in pixels
-    perimeter_px: int                  # Perimeter in pixels
+    area_px: float                     # Area in pixels
+    perimeter_px: float                # Perimeter in pixels
     bounds: Tuple[int, int, int, int] # (x_min, y_min, x_max, y_max)
+    polygon: Optional[np.ndarray] = None                   # (N, 2) outer ring, counter-clockwise
+    holes: List[np.ndarray] = field(default_factory=list)  # inner rings (islands)
+    label: int = 0                                         # value in label_image (id + 1)
+    label_image: Optional[np.ndarray] = field(default=None, repr=False)  # shared int32 label image
+    pixel_set: Optional[Set[Tuple[float, float]]] = field(default=None, repr=False)  # explicit pixels
+    
+    def region(self) -> Optional[np.ndarray]:
+        """View of the label image over this room's bounding box"""
+        if self.label_image is None:
+            return None
+        x_min, y_min, x_max, y_max = (int(b) for b in self.bounds)
+        return self.label_image[y_min:y_max + 1, x_min:x_max + 1]
+    
+    def mask(self) -> Optional[np.ndarray]:
+        """Boolean mask of this room over its bounding box (see region)"""
+        region = self.region()
+        return None if region is None else region == self.label
+    
+    def pixel_coords(self) -> Optional[np.ndarray]:
+        """(N, 2) array of (x, y) pixel coordinates, built on demand"""
+        
+        if self.label_image is not None:
+            x_min, y_min = int(self.bounds[0]), int(self.bounds[1])
+            ys, xs = np.nonzero(self.mask())
+            return np.column_stack([xs + x_min, ys + y_min])
+        
+        if self.pixel_set is not None:
+            return np.array(list(self.pixel_set)).reshape(-1, 2)
+        
+        return None
+    
+    @property
+    def pixels(self) -> Optional[Set[Tuple[float, float]]]:
+        """Set of (x, y) pixels (None for vector rooms); materialized per call"""
+        if self.pixel_set is not None:
+            return self.pixel_set
+        coords = self.pixel_coords()
+        return None if coords is None else set(map(tuple, coords.tolist()))
     
     def is_enclosed(self) -> bool:
         """Check if room is fully enclosed (not touching image boundary)"""
@@ -54,48 +196,195 @@ class Room:
 class RoomSet:
     """Collection of detected rooms with validation"""
     
-    def __init__(self, image_shape: Tuple[int, int]):
+    def __init__(self, image_shape: Tuple[int, int], simplify_tolerance: float = 1.0):
+        """
+        Args:
+            image_shape: (height, width) of the blueprint
+            simplify_tolerance: outline simplification tolerance (pixels)
+        """
         self.rooms: Dict[int, Room] = {}
         self.room_counter = 0
         self.height, self.width = image_shape
-        self.mask = None  # Labeled room mask
+        self.mask = None  # Labeled room mask: int32, room id + 1 per pixel, 0 elsewhere
+        self.adjacency: Optional['RoomAdjacencyGraph'] = None  # built by the raster detector
+        self.simplify_tolerance = simplify_tolerance
+        self.frames = FrameSet()  # coordinate frames over the pixel-space geometry
+    
+    def add_labeled_rooms(self, labels: np.ndarray, stats: np.ndarray,
+                          centroids: np.ndarray, keep: np.ndarray) -> List[Room]:
+        """
+        Add rooms straight from a connected-components labeling.
+        
+        The component labels are remapped once into the room set's label
+        image (room id + 1, 0 elsewhere); rooms keep their stats, a traced
+        outline polygon and a reference to that image.
+        
+        Args:
+            labels: int32 label image from cv2.connectedComponentsWithStats
+            stats: per-label stats (x, y, width, height, area)
+            centroids: per-label (x, y) centroids
+            keep: component labels to turn into rooms, in room id order
+        
+        Returns:
+            list of new rooms
+        """
+        
+        keep = np.asarray(keep, dtype=np.int64)
+        first_id = self.room_counter
+        
+        lut = np.zeros(len(stats), dtype=np.int32)
+        lut[keep] = np.arange(first_id + 1, first_id + 1 + len(keep), dtype=np.int32)
+        remapped = lut[labels]
+        if self.mask is None:
+            self.mask = remapped
+        else:
+            self.mask = np.where(remapped > 0, remapped, self.mask)
+        
+        new_rooms = []
+        for room_id, label_id in enumerate(keep.tolist(), start=first_id):
+            x, y, w, h = stats[label_id, :4].tolist()
+            region = self.mask[y:y + h, x:x + w] == room_id + 1
+            polygon, holes = trace_region_polygon(region, (x, y), self.simplify_tolerance)
+            room = Room(
+                id=room_id,
+                centroid=(float(centroids[label_id, 0]), float(centroids[label_id, 1])),
+                area_px=polygon_signed_area(polygon) - sum(polygon_signed_area(ring) for ring in holes),
+                perimeter_px=polygon_perimeter(polygon) + sum(polygon_perimeter(ring) for ring in holes),
+                bounds=(x, y, x + w - 1, y + h - 1),
+                polygon=polygon,
+                holes=holes,
+                label=room_id + 1,
+                label_image=self.mask
+            )
+            self.rooms[room.id] = room
+            new_rooms.append(room)
+        
+        self.room_counter = first_id + len(keep)
+        self.frames.invalidate()
+        
+        return new_rooms
     
     def add_room(self, pixels: Set[Tuple[int, int]]) -> Room:
-        """Add a detected room"""
+        """Add a room from an explicit pixel set (legacy; see add_labeled_rooms)"""
         
-        area = len(pixels)
+        coords = np.array(list(pixels), dtype=np.float64).reshape(-1, 2)
         
         # Compute centroid
-        xs = [p[0] for p in pixels]
-        ys = [p[1] for p in pixels]
-        centroid = (np.mean(xs), np.mean(ys))
+        centroid = (float(coords[:, 0].mean()), float(coords[:, 1].mean()))
         
         # Compute bounding box
-        x_min, x_max = min(xs), max(xs)
-        y_min, y_max = min(ys), max(ys)
-        
-        # Compute perimeter (number of boundary pixels)
-        perimeter = sum(
-            1 for x, y in pixels
-            if any((x+dx, y+dy) not in pixels
-                   for dx in [-1, 0, 1] for dy in [-1, 0, 1]
-                   if not (dx == 0 and dy == 0))
-        )
+        x_min, y_min = coords.min(axis=0)
+        x_max, y_max = coords.max(axis=0)
+        
+        # Rasterize locally and trace the outline: area and perimeter
+        # come from the polygon
+        cells = np.rint(coords - (x_min, y_min)).astype(np.int64)
+        region = np.zeros((cells[:, 1].max() + 1, cells[:, 0].max() + 1), dtype=np.uint8)
+        region[cells[:, 1], cells[:, 0]] = 1
+        polygon, holes = trace_region_polygon(region, (x_min, y_min), self.simplify_tolerance)
+        area = polygon_signed_area(polygon) - sum(polygon_signed_area(ring) for ring in holes)
+        perimeter = polygon_perimeter(polygon) + sum(polygon_perimeter(ring) for ring in holes)
         
         room = Room(
             id=self.room_counter,
-            pixels=pixels,
             centroid=centroid,
             area_px=area,
             perimeter_px=perimeter,
-            bounds=(x_min, y_min, x_max, y_max)
+            bounds=(x_min, y_min, x_max, y_max),
+            polygon=polygon,
+            holes=holes,
+            pixel_set=pixels
         )
         
         self.rooms[room.id] = room
         self.room_counter += 1
+        self.frames.invalidate()
         
         return room
     
+    def add_polygon_room(self, polygon: np.ndarray,
+                         holes: Optional[List[np.ndarray]] = None) -> Room:
+        """
+        Add a room described by its boundary polygon (no pixel storage).
+        
+        Area, perimeter and centroid are computed analytically.
+        
+        Args:
+            polygon: (N, 2) outer ring
+            holes: optional list of (M, 2) inner rings
+        """
+        
+        polygon = np.asarray(polygon, dtype=np.float64)
+        if polygon_signed_area(polygon) < 0:
+            polygon = polygon[::-1]
+        holes = [np.asarray(h, dtype=np.float64) for h in (holes or [])]
+        
+        hole_area = sum(abs(polygon_signed_area(h)) for h in holes)
+        area = polygon_signed_area(polygon) - hole_area
+        perimeter = polygon_perimeter(polygon) + sum(polygon_perimeter(h) for h in holes)
+        
+        x_min, y_min = polygon.min(axis=0)
+        x_max, y_max = polygon.max(axis=0)
+        
+        room = Room(
+            id=self.room_counter,
+            centroid=polygon_centroid(polygon),
+            area_px=area,
+            perimeter_px=perimeter,
+            bounds=(x_min, y_min, x_max, y_max),
+            polygon=polygon,
+            holes=holes
+        )
+        
+        self.rooms[room.id] = room
+        self.room_counter += 1
+        self.frames.invalidate()
+        
+        return room
+    
+    def room_ids(self) -> np.ndarray:
+        """Room ids in the row order of the per-room arrays below"""
+        return np.fromiter(self.rooms.keys(), dtype=np.int64, count=len(self.rooms))
+    
+    def centroids(self, frame: str = PIXEL_FRAME) -> np.ndarray:
+        """(R, 2) room centroids in a coordinate frame (read-only, cached)"""
+        return self.frames.resolve(
+            'centroids', frame,
+            lambda: np.array([r.centroid for r in self.rooms.values()], dtype=np.float64).reshape(-1, 2)
+        )
+    
+    def areas(self, frame: str = PIXEL_FRAME) -> np.ndarray:
+        """(R,) room areas in a coordinate frame (read-only, cached)"""
+        return self.frames.resolve(
+            'areas', frame,
+            lambda: np.fromiter((r.area_px for r in self.rooms.values()),
+                                dtype=np.float64, count=len(self.rooms)),
+            kind='areas'
+        )
+    
+    def perimeters(self, frame: str = PIXEL_FRAME) -> np.ndarray:
+        """(R,) room perimeters in a coordinate frame (read-only, cached)"""
+        return self.frames.resolve(
+            'perimeters', frame,
+            lambda: np.fromiter((r.perimeter_px for r in self.rooms.values()),
+                                dtype=np.float64, count=len(self.rooms)),
+            kind='lengths'
+        )
+    
+    def outline(self, room_id: int,
+                frame: str = PIXEL_FRAME) -> Tuple[Optional[np.ndarray], List[np.ndarray]]:
+        """
+        Outer ring and holes of one room in a coordinate frame.
+        
+        Returns:
+            (polygon, holes); polygon is None for rooms without an outline
+        """
+        room = self.rooms[room_id]
+        if room.polygon is None:
+            return None, []
+        to_frame = self.frames.get(frame)
+        return to_frame.apply(room.polygon), [to_frame.apply(h) for h in room.holes]
+    
     def check_overlap(self) -> Tuple[bool, str]:
         """
         Check that no two rooms share interior space.
@@ -104,11 +393,24 @@ class RoomSet:
             (no_overlap, message)
         """
         
-        for i, room1 in enumerate(self.rooms.values()):
-            for room2 in list(self.rooms.values())[i+1:]:
-                overlap = room1.pixels & room2.pixels
-                if overlap:
-                    return False, f"Rooms {room1.id} and {room2.id} overlap ({len(overlap)} pixels)"
+        # Labeled rooms hold one label per pixel and vector rooms are faces of
+        # one planar embedding: both are disjoint by construction
+        pixel_rooms = [r for r in self.rooms.values() if r.pixel_set]
+        if len(pixel_rooms) < 2:
+            return True, "No room overlaps detected"
+        
+        # Pixels claimed by more than one room, found in one sort
+        coords = np.concatenate([np.array(list(r.pixel_set)).reshape(-1, 2) for r in pixel_rooms])
+        owners = np.repeat(np.arange(len(pixel_rooms)), [len(r.pixel_set) for r in pixel_rooms])
+        _, inverse, counts = np.unique(coords, axis=0, return_inverse=True, return_counts=True)
+        inverse = inverse.ravel()
+        shared = np.nonzero(counts[inverse] > 1)[0]
+        
+        if len(shared):
+            first, second = np.unique(owners[inverse == inverse[shared[0]]])[:2]
+            room1, room2 = pixel_rooms[first], pixel_rooms[second]
+            overlap = room1.pixel_set & room2.pixel_set
+            return False, f"Rooms {room1.id} and {room2.id} overlap ({len(overlap)} pixels)"
         
         return True, "No room overlaps detected"
     
@@ -151,6 +453,163 @@ class RoomSet:
             'max_area': max(areas) if areas else 0
         }
 
+# ============================================================================
+# ROOM ADJACENCY GRAPH
+# ============================================================================
+
+# A wall between two adjacent rooms is too thin when it drops below this
+# many pixels, or below this fraction of the plan's median wall thickness,
+# anywhere along the shared boundary. (Adjacent rooms always measure at
+# least 1px: 8-connected free pixels of two rooms never touch.)
+MIN_WALL_THICKNESS_PX = 2.0
+THIN_WALL_FRACTION = 0.25
+
+
+@dataclass
+class RoomAdjacency:
+    """Two rooms facing each other across one wall"""
+    room_a: int
+    room_b: int
+    shared_px: int              # Length of the shared wall midline (pixel steps)
+    min_thickness_px: float     # Thinnest wall between the rooms (0 = touching)
+    mean_thickness_px: float    # Mean wall thickness along the shared midline
+
+
+class RoomAdjacencyGraph:
+    """
+    Region adjacency graph of rooms built from the room label image.
+    
+    Room labels are propagated into the walls by a distance transform, so
+    every wall pixel takes the label of its nearest room. Two rooms are
+    adjacent where their propagated labels meet (horizontally or
+    vertically); the distances on both sides of that midline add up to the
+    local wall thickness.
+    
+    All quantities are in label-image pixels.
+    """
+    
+    def __init__(self, pairs: np.ndarray, shared_px: np.ndarray,
+                 min_thickness_px: np.ndarray, mean_thickness_px: np.ndarray):
+        """
+        Args:
+            pairs: (K, 2) room id pairs, room_a < room_b
+            shared_px: (K,) shared midline length per pair
+            min_thickness_px: (K,) thinnest wall per pair
+            mean_thickness_px: (K,) mean wall thickness per pair
+        """
+        self.pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+        self.shared_px = np.asarray(shared_px, dtype=np.int64)
+        self.min_thickness_px = np.asarray(min_thickness_px, dtype=np.float64)
+        self.mean_thickness_px = np.asarray(mean_thickness_px, dtype=np.float64)
+        self._index = {(a, b): k for k, (a, b) in enumerate(self.pairs.tolist())}
+    
+    @classmethod
+    def from_label_image(cls, room_labels: np.ndarray,
+                         wall_mask: np.ndarray) -> 'RoomAdjacencyGraph':
+        """
+        Build the graph from a room label image.
+        
+        Args:
+            room_labels: int32 image, room id + 1 per room pixel, 0 elsewhere
+            wall_mask: binary wall mask (nonzero = wall)
+        
+        Returns:
+            RoomAdjacencyGraph
+        """
+        
+        free = wall_mask == 0
+        
+        # Nearest free pixel for every wall pixel; free components are
+        # mapped back to room labels (non-room free space maps to 0)
+        distance, nearest = cv2.distanceTransformWithLabels(
+            (~free).astype(np.uint8), cv2.DIST_L2, 5, labelType=cv2.DIST_LABEL_CCOMP
+        )
+        lut = np.zeros(int(nearest.max()) + 1, dtype=np.int32)
+        lut[nearest[free]] = room_labels[free]
+        propagated = lut[nearest]
+        
+        # Horizontally and vertically adjacent label pairs
+        keys, thickness = [], []
+        for a, b, da, db in ((propagated[:, :-1], propagated[:, 1:], distance[:, :-1], distance[:, 1:]),
+                             (propagated[:-1, :], propagated[1:, :], distance[:-1, :], distance[1:, :])):
+            meet = (a != b) & (a > 0) & (b > 0)
+            la, lb = a[meet].astype(np.int64), b[meet].astype(np.int64)
+            keys.append(np.minimum(la, lb) << 32 | np.maximum(la, lb))
+            thickness.append(da[meet] + db[meet])
+        keys = np.concatenate(keys)
+        thickness = np.concatenate(thickness).astype(np.float64)
+        
+        unique_keys, inverse, shared = np.unique(keys, return_inverse=True, return_counts=True)
+        min_thickness = np.full(len(unique_keys), np.inf)
+        np.minimum.at(min_thickness, inverse, thickness)
+        mean_thickness = np.bincount(inverse, weights=thickness,
+                                     minlength=len(unique_keys)) / np.maximum(shared, 1)
+        
+        # Labels are room id + 1
+        pairs = np.column_stack([unique_keys >> 32, unique_keys & 0xFFFFFFFF]) - 1
+        
+        return cls(pairs, shared, min_thickness, mean_thickness)
+    
+    def __len__(self) -> int:
+        return len(self.pairs)
+    
+    def adjacency(self, room_a: int, room_b: int) -> Optional[RoomAdjacency]:
+        """Adjacency record for a room pair (None if not adjacent)"""
+        k = self._index.get((min(room_a, room_b), max(room_a, room_b)))
+        if k is None:
+            return None
+        return RoomAdjacency(int(self.pairs[k, 0]), int(self.pairs[k, 1]), int(self.shared_px[k]),
+                             float(self.min_thickness_px[k]), float(self.mean_thickness_px[k]))
+    
+    def neighbors(self, room_id: int) -> List[int]:
+        """Rooms adjacent to a room"""
+        rows = np.nonzero((self.pairs == room_id).any(axis=1))[0]
+        return sorted(self.pairs[rows].ravel()[self.pairs[rows].ravel() != room_id].tolist())
+    
+    def thin_walls(self, min_thickness_px: float) -> List[RoomAdjacency]:
+        """Adjacent pairs whose separating wall is thinner than a limit somewhere"""
+        rows = np.nonzero(self.min_thickness_px < min_thickness_px)[0]
+        return [self.adjacency(*self.pairs[k].tolist()) for k in rows]
+    
+    def separation_threshold(self) -> float:
+        """Thinnest acceptable wall between adjacent rooms (pixels)"""
+        if not len(self):
+            return MIN_WALL_THICKNESS_PX
+        return max(MIN_WALL_THICKNESS_PX,
+                   THIN_WALL_FRACTION * float(np.median(self.mean_thickness_px)))
+    
+    def check_separation(self, min_thickness_px: Optional[float] = None) -> Tuple[bool, str]:
+        """
+        Check that every pair of adjacent rooms has a wall of at least
+        min_thickness_px between them along its whole shared boundary.
+        
+        Args:
+            min_thickness_px: limit in pixels (default: separation_threshold())
+        
+        Returns:
+            (is_separated, message)
+        """
+        
+        if min_thickness_px is None:
+            min_thickness_px = self.separation_threshold()
+        
+        thin = self.thin_walls(min_thickness_px)
+        if thin:
+            worst = min(thin, key=lambda a: a.min_thickness_px)
+            return False, (f"Rooms {worst.room_a} and {worst.room_b} not properly separated by walls "
+                           f"(wall {worst.min_thickness_px:.1f}px over {worst.shared_px}px, "
+                           f"{len(thin)} pairs below {min_thickness_px:.1f}px)")
+        
+        return True, f"All rooms properly separated by walls ({len(self)} adjacent pairs)"
+    
+    def summary(self) -> Dict:
+        """Get summary statistics"""
+        return {
+            'adjacent_pairs': len(self),
+            'min_wall_thickness_px': float(self.min_thickness_px.min()) if len(self) else 0.0,
+            'mean_wall_thickness_px': float(self.mean_thickness_px.mean()) if len(self) else 0.0
+        }
+
 # ============================================================================
 # ROOM DETECTION ALGORITHM
 # ============================================================================
@@ -185,52 +644,41 @@ class RoomDetector:
         log.info("[RoomDetection] Starting room detection")
         
         # Create inverted mask (rooms are non-wall regions)
-        non_wall_mask = 1 - self.wall_mask
+        non_wall_mask = (self.wall_mask == 0).astype(np.uint8)
         
-        # Label connected components (each component = potential room)
-        num_labels, labeled = cv2.connectedComponents(non_wall_mask)
+        # Label connected components (each component = potential room);
+        # per-label stats replace per-pixel scans of every region
+        num_labels, labeled, stats, centroids = cv2.connectedComponentsWithStats(
+            non_wall_mask, connectivity=8, ltype=cv2.CV_32S
+        )
         
         log.info(f"[RoomDetection] Found {num_labels} connected regions")
         
-        # Create room set
+        # Filter very small regions (noise) and regions touching the image
+        # boundary (open spaces): labels present on the 2-pixel border frame
+        large = stats[:, cv2.CC_STAT_AREA] >= 20
+        large[0] = False  # Skip background (0)
+        border = np.concatenate([labeled[:2, :].ravel(), labeled[-2:, :].ravel(),
+                                 labeled[:, :2].ravel(), labeled[:, -2:].ravel()])
+        touches_boundary = np.zeros(num_labels, dtype=bool)
+        touches_boundary[np.unique(border)] = True
+        
+        for label_id in np.nonzero(large & touches_boundary)[0].tolist():
+            log.info(f"[RoomDetection] Skipping region {label_id} (touches boundary)")
+        
+        # Create room set; the label image doubles as the room mask
         room_set = RoomSet(self.wall_mask.shape)
+        keep = np.nonzero(large & ~touches_boundary)[0]
+        for room in room_set.add_labeled_rooms(labeled, stats, centroids, keep):
+            log.info(f"[RoomDetection] Room {room.id}: area={room.area_px:.0f}px, bounds={room.bounds}")
         
-        # Extract rooms from labeled regions
-        room_id_to_pixels = {}
-        for label_id in range(1, num_labels):  # Skip background (0)
-            region_mask = (labeled == label_id)
-            pixels_in_region = set(zip(*np.argwhere(region_mask)[:, [1, 0]]))
-            
-            area = len(pixels_in_region)
-            
-            # Filter very small regions (noise)
-            if area < 20:
-                continue
-            
-            # Filter regions touching image boundary (open spaces)
-            touches_boundary = False
-            for x, y in pixels_in_region:
-                if x <= 1 or x >= self.wall_mask.shape[1]-2 or \
-                   y <= 1 or y >= self.wall_mask.shape[0]-2:
-                    touches_boundary = True
-                    break
-            
-            if touches_boundary:
-                log.info(f"[RoomDetection] Skipping region {label_id} (touches boundary)")
-                continue
-            
-            # Add as room
-            room = room_set.add_room(pixels_in_region)
-            room_id_to_pixels[label_id] = room
-            log.info(f"[RoomDetection] Room {room.id}: area={room.area_px}px, bounds={room.bounds}")
-        
-        # Create labeled room mask for visualization
-        room_mask = np.zeros(self.wall_mask.shape, dtype=np.uint8)
-        for label_id, room in room_id_to_pixels.items():
-            for x, y in room.pixels:
-                room_mask[y, x] = room.id + 1
-        
-        self.room_mask = room_mask
+        if room_set.mask is None:
+            room_set.mask = np.zeros(self.wall_mask.shape, dtype=np.int32)
+        
+        room_set.adjacency = RoomAdjacencyGraph.from_label_image(room_set.mask, self.wall_mask)
+        log.info(f"[RoomDetection] Room adjacency: {room_set.adjacency.summary()}")
+        
+        self.room_mask = room_set.mask
         self.rooms = room_set
         
         return room_set
@@ -256,41 +704,211 @@ class RoomDetector:
         if not is_valid:
             return False, message
         
-        # Check that rooms are separated by walls
-        for i, room1 in enumerate(self.rooms.rooms.values()):
-            for room2 in list(self.rooms.rooms.values())[i+1:]:
-                # Check if rooms are adjacent
-                x1_min, y1_min, x1_max, y1_max = room1.bounds
-                x2_min, y2_min, x2_max, y2_max = room2.bounds
-                
-                # Find gap between rooms
-                gap_exists = False
-                
-                # Check vertical gap
-                if x1_max < x2_min:
-                    # Rooms are horizontally separated
-                    gap_pixels = self.wall_mask[y1_min:y1_max, x1_max:x2_min].sum()
-                    if gap_pixels > 0:
-                        gap_exists = True
-                
-                # Check horizontal gap
-                if y1_max < y2_min:
-                    # Rooms are vertically separated
-                    gap_pixels = self.wall_mask[y1_max:y2_min, x1_min:x1_max].sum()
-                    if gap_pixels > 0:
-                        gap_exists = True
-                
-                if not gap_exists:
-                    return False, f"Rooms {room1.id} and {room2.id} not properly separated by walls"
-        
-        return True, "All rooms properly separated by walls"
+        # Check that adjacent rooms are separated by walls
+        if self.rooms.adjacency is None:
+            self.rooms.adjacency = RoomAdjacencyGraph.from_label_image(self.rooms.mask, self.wall_mask)
+        
+        return self.rooms.adjacency.check_separation()
+
+class PlanarRoomDetector:
+    """
+    Detect rooms as the bounded faces of the wall graph's planar embedding.
+    
+    Vector alternative to the flood-fill detector: rooms come straight from
+    the Stage 3 wall graph as polygons, so cost scales with edge count
+    rather than image area and no pixels are stored.
+    
+    Algorithm:
+    1. Simplify graph (snap near-coincident vertices, drop duplicate edges,
+       prune dangling walls that cannot bound a room)
+    2. Sort half-edges by angle around each vertex
+    3. Walk faces (next = clockwise successor of the twin)
+    4. Counter-clockwise faces are rooms; clockwise faces are outer
+       boundaries of connected components (islands become room holes)
+    
+    Assumes walls do not cross without a shared vertex.
+    """
+    
+    def __init__(self, wall_graph, image_shape: Tuple[int, int],
+                 snap_tolerance: float = 1.0,
+                 min_area_px: float = 20.0):
+        """
+        Args:
+            wall_graph: WallTopologyGraph from Stage 3
+            image_shape: (height, width) of the blueprint
+            snap_tolerance: merge vertices closer than this (pixels)
+            min_area_px: drop faces smaller than this (noise)
+        """
+        self.wall_graph = wall_graph
+        self.image_shape = image_shape[:2]
+        self.snap_tolerance = snap_tolerance
+        self.min_area_px = min_area_px
+        self.rooms = None
+        self.room_mask = None  # no raster output
+    
+    def detect(self) -> Optional[RoomSet]:
+        """
+        Detect rooms as graph faces.
+        
+        Returns:
+            RoomSet of polygon rooms or None if no graph is available
+        """
+        
+        log.info("[RoomDetection] Starting planar face room detection")
+        
+        if self.wall_graph is None or not self.wall_graph.edges:
+            log.error("[RoomDetection] Planar detection requires a wall graph")
+            return None
+        
+        positions, edges = self._simplified_graph()
+        log.info(f"[RoomDetection] Simplified graph: {len(positions)} vertices, {len(edges)} edges")
+        
+        room_set = RoomSet(self.image_shape)
+        self.rooms = room_set
+        
+        if len(edges) < 3:
+            return room_set
+        
+        faces = self._enumerate_faces(positions, edges)
+        polygons = [positions[f] for f in faces]
+        areas = np.array([polygon_signed_area(p) for p in polygons])
+        
+        rooms = [i for i in range(len(faces)) if areas[i] >= self.min_area_px]
+        outers = [i for i in range(len(faces)) if areas[i] < 0]
+        log.info(f"[RoomDetection] Found {len(faces)} faces ({len(rooms)} rooms, "
+                 f"{len(outers)} component boundaries)")
+        
+        # Each component boundary lying inside a room is a hole of that room
+        holes: Dict[int, List[np.ndarray]] = {i: [] for i in rooms}
+        by_area = sorted(rooms, key=lambda i: areas[i])
+        for j in outers:
+            probe = polygons[j][:1]
+            for i in by_area:
+                if areas[i] > -areas[j] and points_in_polygon(probe, polygons[i])[0]:
+                    holes[i].append(polygons[j][::-1])
+                    break
+        
+        for i in rooms:
+            room = room_set.add_polygon_room(polygons[i], holes[i])
+            log.info(f"[RoomDetection] Room {room.id}: area={room.area_px:.0f}px, "
+                     f"{len(polygons[i])} corners")
+        
+        return room_set
+    
+    def _simplified_graph(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Wall graph as (V, 2) positions and (E, 2) vertex index pairs,
+        with snapped vertices, no duplicate edges and no dangling walls.
+        """
+        
+        from pipeline.stage3_topology_extraction import DisjointSet
+        
+        graph = self.wall_graph
+        row = {vid: i for i, vid in enumerate(graph.vertices)}
+        positions = np.array([v.position for v in graph.vertices.values()], dtype=np.float64)
+        edges = np.array([(row[e.vertex_a.id], row[e.vertex_b.id]) for e in graph.edges.values()],
+                         dtype=np.int64).reshape(-1, 2)
+        
+        # Snap vertices within tolerance (spatial hash on tolerance-sized cells)
+        tol = self.snap_tolerance
+        if tol > 0:
+            groups = DisjointSet()
+            for _ in range(len(positions)):
+                groups.add()
+            cells: Dict[Tuple[int, int], List[int]] = {}
+            keys = np.floor(positions / tol).astype(np.int64)
+            for i, (cx, cy) in enumerate(keys.tolist()):
+                for dx in (-1, 0, 1):
+                    for dy in (-1, 0, 1):
+                        for j in cells.get((cx + dx, cy + dy), ()):
+                            if np.hypot(*(positions[i] - positions[j])) <= tol:
+                                groups.union(i, j)
+                cells.setdefault((cx, cy), []).append(i)
+            
+            roots = np.array([groups.find(i) for i in range(len(positions))], dtype=np.int64)
+            _, labels = np.unique(roots, return_inverse=True)
+            merged = np.zeros((labels.max() + 1, 2))
+            np.add.at(merged, labels, positions)
+            positions = merged / np.bincount(labels)[:, None]
+            edges = labels[edges]
+        
+        # Drop self-loops and duplicate edges
+        edges = edges[edges[:, 0] != edges[:, 1]]
+        edges = np.unique(np.sort(edges, axis=1), axis=0)
+        
+        # Prune dangling walls: they bound no face
+        while len(edges):
+            degree = np.bincount(edges.ravel(), minlength=len(positions))
+            keep = (degree[edges[:, 0]] > 1) & (degree[edges[:, 1]] > 1)
+            if keep.all():
+                break
+            edges = edges[keep]
+        
+        used, edges = np.unique(edges, return_inverse=True)
+        return positions[used], edges.reshape(-1, 2)
+    
+    @staticmethod
+    def _enumerate_faces(positions: np.ndarray, edges: np.ndarray) -> List[np.ndarray]:
+        """
+        Walk all faces of a planar embedding.
+        
+        Half-edge 2k runs edges[k, 0] -> edges[k, 1]; 2k+1 is its twin.
+        
+        Returns:
+            list of vertex index arrays, one per face
+        """
+        
+        n_half = 2 * len(edges)
+        origin = edges.ravel()
+        dest = edges[:, ::-1].ravel()
+        
+        vec = positions[dest] - positions[origin]
+        angle = np.arctan2(vec[:, 1], vec[:, 0])
+        
+        # Half-edges grouped by origin, counter-clockwise within each group
+        order = np.lexsort((angle, origin))
+        rank = np.empty(n_half, dtype=np.int64)
+        rank[order] = np.arange(n_half)
+        degree = np.bincount(origin, minlength=len(positions))
+        first = np.cumsum(degree) - degree
+        
+        # next(u->v) = half-edge leaving v just clockwise of v->u
+        twin = np.arange(n_half) ^ 1
+        local = rank[twin] - first[dest]
+        next_half = order[first[dest] + (local - 1) % degree[dest]]
+        
+        faces = []
+        visited = np.zeros(n_half, dtype=bool)
+        next_list = next_half.tolist()
+        for start in range(n_half):
+            if visited[start]:
+                continue
+            cycle = []
+            h = start
+            while not visited[h]:
+                visited[h] = True
+                cycle.append(h)
+                h = next_list[h]
+            faces.append(origin[cycle])
+        
+        return faces
+    
+    def validate_room_separation(self) -> Tuple[bool, str]:
+        """Faces of a planar wall graph are separated by walls by construction"""
+        
+        if self.rooms is None:
+            return False, "Rooms not yet detected"
+        
+        return True, "All rooms bounded by wall graph edges"
+
 
 # ============================================================================
 # STAGE 4 MAIN INTERFACE
 # ============================================================================
 
 def stage4_room_detection(refined_wall_mask: np.ndarray,
-                         wall_graph=None) -> Optional[RoomSet]:
+                         wall_graph=None,
+                         engine: str = 'raster') -> Optional[RoomSet]:
     """
     STAGE 4: Room Detection (NO MERGING ALLOWED)
     
@@ -301,7 +919,9 @@ def stage4_room_detection(refined_wall_mask: np.ndarray,
     
     Args:
         refined_wall_mask: Binary wall mask from Stage 2
-        wall_graph: Wall topology graph from Stage 3 (optional)
+        wall_graph: Wall topology graph from Stage 3 (optional for 'raster')
+        engine: 'raster' (flood-fill the wall mask) or 'planar'
+                (faces of the wall graph, no per-pixel work)
     
     Returns:
         RoomSet or None if detection fails
@@ -316,7 +936,13 @@ def stage4_room_detection(refined_wall_mask: np.ndarray,
         return None
     
     # Detect rooms
-    detector = RoomDetector(refined_wall_mask, wall_graph)
+    if engine == 'planar':
+        detector = PlanarRoomDetector(wall_graph, refined_wall_mask.shape)
+    elif engine == 'raster':
+        detector = RoomDetector(refined_wall_mask, wall_graph)
+    else:
+        log.error(f"[RoomDetection] Unknown engine: {engine}")
+        return None
     rooms = detector.detect()
     
     if rooms is None:
@@ -11,7 +11,8 @@ Algorithm:
 1. Measure reference dimension from image (usually building width)
 2. Define reference width target (12 m for residential)
 3. Compute scale factor: REFERENCE_WIDTH ÷ detected_width
-4. Apply scale transform to all geometry
+4. Attach the scale transform to all geometry as a 'metric' frame
+   (coordinates are converted lazily, when a later stage asks for them)
 5. Verify normalized dimensions are realistic
 
 This step ensures spatial correctness for all subsequent 3D geometry.
@@ -22,6 +23,8 @@ from typing import Tuple, Dict, Optional
 import logging
 from dataclasses import dataclass
 
+from pipeline.coordinate_frames import AffineFrame, METRIC_FRAME
+
 log = logging.getLogger(__name__)
 
 # ============================================================================
@@ -130,11 +133,15 @@ class MetricNormalizer:
         log.info(f"[MetricNorm] Scale factor: {self.context.scale_factor:.2f} px/m")
         log.info(f"[MetricNorm] Normalized width: {self.context.target_width_m:.2f} m")
         
-        # Step 4: Transform wall graph
-        self.normalized_wall_graph = self._transform_wall_graph()
+        # Step 4: Attach the metric frame to the wall graph and room set.
+        # Geometry stays in pixels; stages 6-9 read metric arrays through
+        # the frame, so nothing is copied here.
+        metric = AffineFrame(scale=1.0 / self.context.scale_factor)
+        self.wall_graph.frames.register(METRIC_FRAME, metric)
+        self.room_set.frames.register(METRIC_FRAME, metric)
         
-        # Step 5: Transform room set
-        self.normalized_room_set = self._transform_room_set()
+        self.normalized_wall_graph = self.wall_graph
+        self.normalized_room_set = self.room_set
         
         log.info("[MetricNorm] ✓ Metric normalization complete")
         
@@ -152,17 +159,15 @@ class MetricNormalizer:
             log.warning("[MetricNorm] No wall vertices to estimate width")
             return self.image_width
         
-        xs = [v.position[0] for v in self.wall_graph.vertices.values()]
-        ys = [v.position[1] for v in self.wall_graph.vertices.values()]
-        
-        x_min, x_max = min(xs), max(xs)
-        y_min, y_max = min(ys), max(ys)
+        positions = self.wall_graph.vertex_positions()
+        x_min, y_min = positions.min(axis=0)
+        x_max, y_max = positions.max(axis=0)
         
         width = x_max - x_min
         height = y_max - y_min
         
         # Use maximum dimension (assuming building is roughly square)
-        return max(width, height)
+        return float(max(width, height))
     
     def _estimate_building_height(self) -> int:
         """
@@ -175,8 +180,8 @@ class MetricNormalizer:
         if not self.wall_graph or not self.wall_graph.vertices:
             return self.image_height
         
-        ys = [v.position[1] for v in self.wall_graph.vertices.values()]
-        return max(ys) - min(ys) if ys else self.image_height
+        ys = self.wall_graph.vertex_positions()[:, 1]
+        return float(ys.max() - ys.min())
     
     def _validate_context(self) -> Tuple[bool, str]:
         """
@@ -206,94 +211,6 @@ class MetricNormalizer:
         
         return True, "Context valid"
     
-    def _transform_wall_graph(self):
-        """
-        Transform wall graph vertices to metric coordinates.
-        
-        Returns:
-            transformed_wall_graph (same structure, different coordinates)
-        """
-        
-        log.info("[MetricNorm] Transforming wall graph to metric space")
-        
-        # Create new graph (reuse structure)
-        from pipeline.stage3_topology_extraction import WallTopologyGraph
-        
-        new_graph = WallTopologyGraph()
-        
-        # Transform vertices
-        vertex_mapping = {}  # old_vertex_id -> new_vertex
-        
-        for old_id, old_vertex in self.wall_graph.vertices.items():
-            # Convert from pixels to meters
-            x_m = old_vertex.position[0] / self.context.scale_factor
-            y_m = old_vertex.position[1] / self.context.scale_factor
-            
-            new_vertex = new_graph.add_vertex(
-                position=(x_m, y_m),
-                is_junction=old_vertex.is_junction,
-                is_corner=old_vertex.is_corner
-            )
-            vertex_mapping[old_id] = new_vertex
-        
-        # Transform edges
-        for old_edge in self.wall_graph.edges.values():
-            new_va = vertex_mapping[old_edge.vertex_a.id]
-            new_vb = vertex_mapping[old_edge.vertex_b.id]
-            
-            # Scale length
-            new_length_m = old_edge.length_px / self.context.scale_factor
-            
-            # Transform points
-            new_points = [
-                (p[0] / self.context.scale_factor, p[1] / self.context.scale_factor)
-                for p in old_edge.points
-            ]
-            
-            new_graph.add_edge(new_va, new_vb, new_length_m, new_points)
-        
-        log.info(f"[MetricNorm] Transformed {len(new_graph.vertices)} vertices, "
-                 f"{len(new_graph.edges)} edges")
-        
-        return new_graph
-    
-    def _transform_room_set(self):
-        """
-        Transform room set to metric space.
-        
-        Returns:
-            transformed_room_set
-        """
-        
-        log.info("[MetricNorm] Transforming room set to metric space")
-        
-        from pipeline.stage4_room_detection import RoomSet
-        
-        new_room_set = RoomSet((self.room_set.height, self.room_set.width))
-        
-        # Transform each room
-        for old_room in self.room_set.rooms.values():
-            # Transform pixel set to metric coordinates
-            new_pixels = set()
-            for x_px, y_px in old_room.pixels:
-                x_m = x_px / self.context.scale_factor
-                y_m = y_px / self.context.scale_factor
-                new_pixels.add((x_m, y_m))
-            
-            # Create new room with transformed pixels
-            new_room = new_room_set.add_room(new_pixels)
-            
-            # Update derived properties
-            xs = [p[0] for p in new_pixels]
-            ys = [p[1] for p in new_pixels]
-            new_room.centroid = (np.mean(xs), np.mean(ys))
-            new_room.bounds = (min(xs), min(ys), max(xs), max(ys))
-            new_room.area_px = len(new_pixels)  # Now in m² approximately
-        
-        log.info(f"[MetricNorm] Transformed {len(new_room_set.rooms)} rooms")
-        
-        return new_room_set
-    
     def _context_to_dict(self) -> Dict:
         """Convert context to dict for serialization"""
         
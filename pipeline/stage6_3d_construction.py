@@ -11,8 +11,8 @@ Key Principles:
 - All geometry must be watertight and manifold
 
 Algorithm:
-1. Create floor slab (ground plane)
-2. Extrude walls to cutaway height
+1. Create floor slabs (one per room polygon, triangulated)
+2. Union wall footprints (mitered joins), extrude to cutaway height
 3. Ensure wall continuity at junctions
 4. Build room meshes for interior visibility
 5. Validate watertight topology
@@ -21,10 +21,16 @@ Output: Parametric 3D model (vertices, faces, normals)
 """
 
 import numpy as np
-from typing import List, Tuple, Dict, Optional, Set
+from typing import Iterator, List, Tuple, Dict, Optional, Set
 import logging
 from dataclasses import dataclass, field
 
+from pipeline.coordinate_frames import METRIC_FRAME
+from pipeline.half_edge import HalfEdgeMesh
+from pipeline.spatial_index import BoxIndex
+from pipeline.stage4_room_detection import offset_ring, points_in_polygon, polygon_signed_area
+from pipeline.triangulation import triangulate_polygon, triangulate_polygons
+
 log = logging.getLogger(__name__)
 
 # ============================================================================
@@ -38,6 +44,13 @@ FLOOR_SLAB_THICKNESS = 0.12  # meters (structural slab)
 # Tolerance for junction validation
 JUNCTION_TOLERANCE = 0.05  # meters
 
+# Longest reflex miter at a wall joint, in half wall thicknesses
+MITER_LIMIT = 4.0
+
+# Room floors stop this far short of the wall centerlines, so slabs of
+# neighbouring rooms never share edges (the walls cover the seam)
+FLOOR_SEAM = 0.02  # meters
+
 
 # ============================================================================
 # GEOMETRY DATA STRUCTURES
@@ -45,7 +58,7 @@ JUNCTION_TOLERANCE = 0.05  # meters
 
 @dataclass
 class Vertex:
-    """3D vertex with position and normal"""
+    """3D vertex with position and normal (row views into a Mesh's arrays)"""
     position: np.ndarray  # (x, y, z) in meters
     normal: np.ndarray = field(default_factory=lambda: np.array([0., 0., 1.]))
     
@@ -66,88 +79,406 @@ class Face:
         return hash(self.vertex_indices)
 
 
+class _VertexView:
+    """Sequence of Vertex views over a Mesh's position/normal arrays"""
+    
+    def __init__(self, mesh: 'Mesh'):
+        self._mesh = mesh
+    
+    def __len__(self) -> int:
+        return self._mesh.vertex_count
+    
+    def __getitem__(self, i: int) -> Vertex:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("vertex index out of range")
+        return Vertex(position=self._mesh._positions[i], normal=self._mesh._normals[i])
+    
+    def __iter__(self) -> Iterator[Vertex]:
+        positions, normals = self._mesh.positions, self._mesh.normals
+        for i in range(len(self)):
+            yield Vertex(position=positions[i], normal=normals[i])
+
+
+class _FaceView:
+    """Sequence of Face records over a Mesh's index array"""
+    
+    def __init__(self, mesh: 'Mesh'):
+        self._mesh = mesh
+    
+    def __len__(self) -> int:
+        return self._mesh.face_count
+    
+    def __getitem__(self, i: int) -> Face:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("face index out of range")
+        return Face(vertex_indices=tuple(self._mesh._indices[i].tolist()),
+                    normal=self._mesh._face_normals[i])
+    
+    def __iter__(self) -> Iterator[Face]:
+        indices, normals = self._mesh.indices.tolist(), self._mesh.face_normals
+        for i, tri in enumerate(indices):
+            yield Face(vertex_indices=tuple(tri), normal=normals[i])
+    
+    def pop(self, i: int = -1) -> Face:
+        """Remove and return one face"""
+        face = self[i]
+        keep = np.ones(len(self), dtype=bool)
+        keep[i] = False
+        self._mesh.keep_faces(keep)
+        return face
+
+
 class Mesh:
-    """3D mesh: collection of vertices and faces"""
+    """
+    3D mesh: growable float32 vertex arrays and a uint32 triangle array.
+    
+    Geometry is appended in bulk (add_vertices/add_faces) without
+    deduplication; weld() merges coincident vertices in one pass. The
+    vertices/faces attributes are sequence views kept for callers that
+    iterate Vertex/Face records.
+    
+    Every face belongs to a named group ('walls', 'room_3', ...); exporters
+    emit one primitive per group over the shared vertex arrays. A group
+    may also be described as instances of one prototype (instances dict);
+    any later face edit in that group drops the description.
+    """
     
     def __init__(self, name: str = "mesh"):
         self.name = name
-        self.vertices: List[Vertex] = []
-        self.faces: List[Face] = []
-        self.vertex_hash_map: Dict = {}  # position -> index (for deduplication)
+        self._positions = np.empty((64, 3), dtype=np.float32)
+        self._normals = np.empty((64, 3), dtype=np.float32)
+        self._indices = np.empty((64, 3), dtype=np.uint32)
+        self._face_normals = np.empty((64, 3), dtype=np.float32)
+        self._face_groups = np.empty(64, dtype=np.int32)
+        self.groups: List[str] = []  # group names, indexed by face_groups
+        self._group_ids: Dict[str, int] = {}
+        self.instances: Dict[str, 'InstanceSet'] = {}  # group -> instanced form
+        self.vertex_count = 0
+        self.face_count = 0
+        self.vertices = _VertexView(self)
+        self.faces = _FaceView(self)
+        self._edge_uses = None  # (edges, counts), rebuilt after face changes
+        self._half_edges = None  # HalfEdgeMesh, rebuilt after face changes
+        self._face_index = None  # BoxIndex over face bounds, likewise
     
-    def add_vertex(self, position: np.ndarray, normal: Optional[np.ndarray] = None) -> int:
-        """Add vertex (with deduplication) and return index"""
+    @property
+    def positions(self) -> np.ndarray:
+        """(N, 3) float32 vertex positions (view)"""
+        return self._positions[:self.vertex_count]
+    
+    @property
+    def normals(self) -> np.ndarray:
+        """(N, 3) float32 vertex normals (view)"""
+        return self._normals[:self.vertex_count]
+    
+    @property
+    def indices(self) -> np.ndarray:
+        """(M, 3) uint32 triangle vertex indices (view)"""
+        return self._indices[:self.face_count]
+    
+    @property
+    def face_normals(self) -> np.ndarray:
+        """(M, 3) float32 face normals (view; zero until recalculated)"""
+        return self._face_normals[:self.face_count]
+    
+    @property
+    def face_groups(self) -> np.ndarray:
+        """(M,) int32 group of each face, indexing groups (view)"""
+        return self._face_groups[:self.face_count]
+    
+    def group_index(self, name: str) -> int:
+        """Index of a face group (registered on first use)"""
+        group = self._group_ids.get(name)
+        if group is None:
+            group = self._group_ids[name] = len(self.groups)
+            self.groups.append(name)
+        return group
+    
+    def group_faces(self, name: str) -> np.ndarray:
+        """Indices of the faces in a group (empty for unknown groups)"""
+        if name not in self._group_ids:
+            return np.empty(0, dtype=np.intp)
+        return np.flatnonzero(self.face_groups == self._group_ids[name])
+    
+    @staticmethod
+    def _reserve(array: np.ndarray, size: int) -> np.ndarray:
+        """Array with capacity for at least size rows (doubling growth)"""
+        if size <= len(array):
+            return array
+        grown = np.empty((max(size, 2 * len(array)),) + array.shape[1:], dtype=array.dtype)
+        grown[:len(array)] = array
+        return grown
+    
+    def add_vertices(self, positions: np.ndarray,
+                     normals: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Append vertices.
+        
+        Args:
+            positions: (N, 3) positions
+            normals: optional (N, 3) normals (default +Z)
+        
+        Returns:
+            (N,) indices of the new vertices
+        """
+        
+        positions = np.asarray(positions, dtype=np.float32).reshape(-1, 3)
+        start, end = self.vertex_count, self.vertex_count + len(positions)
+        self._positions = self._reserve(self._positions, end)
+        self._normals = self._reserve(self._normals, end)
+        
+        self._positions[start:end] = positions
+        self._normals[start:end] = (0.0, 0.0, 1.0) if normals is None else normals
+        self.vertex_count = end
+        
+        return np.arange(start, end, dtype=np.uint32)
+    
+    def add_faces(self, indices: np.ndarray,
+                  normals: Optional[np.ndarray] = None,
+                  group: str = 'default') -> np.ndarray:
+        """
+        Append triangles.
         
-        # Check if vertex already exists
-        key = tuple(np.round(position, decimals=6))
-        if key in self.vertex_hash_map:
-            return self.vertex_hash_map[key]
+        Args:
+            indices: (M, 3) vertex indices
+            normals: optional (M, 3) face normals
+            group: face group name
         
-        idx = len(self.vertices)
-        vertex = Vertex(position=position.copy())
-        if normal is not None:
-            vertex.normal = normal.copy()
+        Returns:
+            (M,) indices of the new faces
+        """
         
-        self.vertices.append(vertex)
-        self.vertex_hash_map[key] = idx
-        return idx
+        indices = np.asarray(indices, dtype=np.uint32).reshape(-1, 3)
+        start, end = self.face_count, self.face_count + len(indices)
+        self._indices = self._reserve(self._indices, end)
+        self._face_normals = self._reserve(self._face_normals, end)
+        self._face_groups = self._reserve(self._face_groups, end)
+        
+        self._indices[start:end] = indices
+        self._face_normals[start:end] = 0.0 if normals is None else normals
+        self._face_groups[start:end] = self.group_index(group)
+        self._drop_instances([group])
+        self.face_count = end
+        self._edge_uses = None
+        self._half_edges = None
+        self._face_index = None
+        
+        return np.arange(start, end, dtype=np.uint32)
+    
+    def add_vertex(self, position: np.ndarray, normal: Optional[np.ndarray] = None) -> int:
+        """Append one vertex and return its index (no deduplication; see weld)"""
+        return int(self.add_vertices(position, None if normal is None else [normal])[0])
     
     def add_face(self, vi0: int, vi1: int, vi2: int, 
                  normal: Optional[np.ndarray] = None) -> int:
         """Add triangle face and return index"""
+        return int(self.add_faces((vi0, vi1, vi2), None if normal is None else [normal])[0])
+    
+    def weld(self, tolerance: float = 1e-5) -> int:
+        """
+        Merge vertices whose positions agree on a tolerance grid.
+        
+        Keeps the first occurrence of each position (and its normal), so
+        vertex order is otherwise preserved. Vertices of instanced groups
+        are left alone: each instance stays a closed copy of its prototype
+        instead of sharing corners with the boxes it abuts.
         
-        face = Face(vertex_indices=(vi0, vi1, vi2), normal=normal)
-        idx = len(self.faces)
-        self.faces.append(face)
-        return idx
+        Args:
+            tolerance: quantization step (meters); float32 positions only
+                       carry ~7 significant digits
+        
+        Returns:
+            number of vertices removed
+        """
+        
+        count = self.vertex_count
+        if count == 0:
+            return 0
+        
+        keys = np.floor(self.positions.astype(np.float64) / tolerance + 0.5).astype(np.int64)
+        if self.instances:
+            instanced = np.isin(self.face_groups,
+                                [self._group_ids[g] for g in self.instances if g in self._group_ids])
+            owner = np.zeros((count, 1), dtype=np.int64)
+            used = np.unique(self.indices[instanced])
+            owner[used, 0] = used.astype(np.int64) + 1
+            keys = np.hstack([keys, owner])
+        _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+        
+        # Renumber unique positions in order of first occurrence
+        order = np.argsort(first, kind='stable')
+        rank = np.empty(len(first), dtype=np.uint32)
+        rank[order] = np.arange(len(first), dtype=np.uint32)
+        remap = rank[inverse.ravel()]
+        
+        kept = first[order]
+        self._positions[:len(kept)] = self._positions[kept]
+        self._normals[:len(kept)] = self._normals[kept]
+        self.vertex_count = len(kept)
+        self._indices[:self.face_count] = remap[self.indices]
+        self._edge_uses = None
+        self._half_edges = None
+        self._face_index = None
+        
+        removed = count - len(kept)
+        if removed:
+            log.info(f"[Mesh] Welded {removed} duplicate vertices ({len(kept)} remain)")
+        return removed
     
-    def recalculate_normals(self):
-        """Recalculate vertex normals from faces (optimized)"""
+    def keep_faces(self, keep: np.ndarray):
+        """Drop faces where keep is False (vertices stay; see drop_unused_vertices)"""
+        keep = np.asarray(keep, dtype=bool)
+        if self.instances:
+            edited = np.unique(self.face_groups[~keep])
+            self._drop_instances([self.groups[g] for g in edited.tolist()])
+        kept = int(keep.sum())
+        self._indices[:kept] = self.indices[keep]
+        self._face_normals[:kept] = self.face_normals[keep]
+        self._face_groups[:kept] = self.face_groups[keep]
+        self.face_count = kept
+        self._edge_uses = None
+        self._half_edges = None
+        self._face_index = None
+    
+    def drop_unused_vertices(self) -> int:
+        """
+        Remove vertices no face references (e.g. after keep_faces).
+        
+        Returns:
+            number of vertices removed
+        """
+        
+        used = np.zeros(self.vertex_count, dtype=bool)
+        used[self.indices.ravel()] = True
+        kept = np.flatnonzero(used)
+        removed = self.vertex_count - len(kept)
+        if removed == 0:
+            return 0
+        
+        remap = np.cumsum(used, dtype=np.int64).astype(np.uint32) - 1
+        self._positions[:len(kept)] = self._positions[kept]
+        self._normals[:len(kept)] = self._normals[kept]
+        self.vertex_count = len(kept)
+        self._indices[:self.face_count] = remap[self.indices]
+        self._edge_uses = None
+        self._half_edges = None
+        self._face_index = None
+        
+        return removed
+    
+    def _drop_instances(self, groups: List[str]):
+        """Forget the instanced form of groups whose faces changed"""
+        for group in groups:
+            if self.instances.pop(group, None) is not None:
+                log.debug(f"[Mesh] Group '{group}' edited, no longer instanced")
+    
+    def recalculate_normals(self) -> np.ndarray:
+        """
+        Recalculate face normals and vertex normals.
+        
+        Face normals come from one batched cross product; each vertex normal
+        is the normalized sum of the unit normals of the faces using it.
+        Vertices touched only by degenerate faces keep their previous normal.
+        
+        Returns:
+            indices of degenerate (zero-area) faces; their normals are zero
+        """
         
         # Skip if no faces
-        if not self.faces:
-            return
+        if not self.face_count:
+            return np.empty(0, dtype=np.int64)
+        
+        positions = self.positions.astype(np.float64)
+        triangles = self.indices
+        
+        v0 = positions[triangles[:, 0]]
+        face_normals = np.cross(positions[triangles[:, 1]] - v0,
+                                positions[triangles[:, 2]] - v0)
+        length = np.linalg.norm(face_normals, axis=1)
+        valid = length > 1e-6
+        face_normals[valid] /= length[valid, None]
+        face_normals[~valid] = 0.0
+        self._face_normals[:self.face_count] = face_normals
+        
+        # Scatter-add each face normal onto its three corners
+        vertex_normals = np.zeros((self.vertex_count, 3), dtype=np.float64)
+        np.add.at(vertex_normals, triangles, face_normals[:, None, :])
+        
+        length = np.linalg.norm(vertex_normals, axis=1)
+        valid_vertices = length > 1e-6
+        self._normals[:self.vertex_count][valid_vertices] = \
+            vertex_normals[valid_vertices] / length[valid_vertices, None]
+        
+        return np.flatnonzero(~valid)
+    
+    def edge_uses(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Undirected edges of the triangle list and the faces using each.
         
-        # Initialize vertex normals
-        vertex_normals = {}
-        for i in range(len(self.vertices)):
-            vertex_normals[i] = np.array([0., 0., 0.], dtype=np.float32)
+        Cached until faces change (add_faces, keep_faces, weld).
         
-        # Accumulate face normals to vertex normals
-        for face in self.faces:
-            if len(face.vertex_indices) < 3:
-                continue
+        Returns:
+            (edges, counts): (E, 2) uint32 vertex pairs (low, high) in
+            lexicographic order, and (E,) face counts
+        """
+        
+        if self._edge_uses is None:
+            triangles = self.indices
+            pairs = np.concatenate([triangles[:, [0, 1]],
+                                    triangles[:, [1, 2]],
+                                    triangles[:, [2, 0]]])
+            pairs.sort(axis=1)
             
-            try:
-                # Only compute for first 3 vertices (triangles)
-                vi0, vi1, vi2 = face.vertex_indices[0], face.vertex_indices[1], face.vertex_indices[2]
-                v0 = self.vertices[vi0].position
-                v1 = self.vertices[vi1].position
-                v2 = self.vertices[vi2].position
-                
-                # Compute face normal efficiently
-                edge1 = v1 - v0
-                edge2 = v2 - v0
-                face_normal = np.cross(edge1, edge2, dtype=np.float32)
-                
-                norm_sq = np.dot(face_normal, face_normal)
-                if norm_sq > 1e-12:
-                    face_normal = face_normal / np.sqrt(norm_sq)
-                    face.normal = face_normal
-                    
-                    # Add to vertex normals
-                    vertex_normals[vi0] += face_normal
-                    vertex_normals[vi1] += face_normal
-                    vertex_normals[vi2] += face_normal
-            except Exception:
-                continue
+            # One int64 key per pair so np.unique runs on a flat array
+            keys = (pairs[:, 0].astype(np.int64) << 32) | pairs[:, 1].astype(np.int64)
+            keys, counts = np.unique(keys, return_counts=True)
+            edges = np.column_stack([keys >> 32, keys & 0xFFFFFFFF]).astype(np.uint32)
+            
+            self._edge_uses = (edges, counts)
         
-        # Normalize vertex normals
-        for i in range(len(self.vertices)):
-            normal = vertex_normals[i]
-            norm_sq = np.dot(normal, normal)
-            if norm_sq > 1e-12:
-                self.vertices[i].normal = normal / np.sqrt(norm_sq)
+        return self._edge_uses
+    
+    def half_edges(self) -> HalfEdgeMesh:
+        """
+        Half-edge connectivity of the faces (twin/next/face arrays).
+        
+        Cached until faces change (add_faces, keep_faces, weld).
+        """
+        
+        if self._half_edges is None:
+            self._half_edges = HalfEdgeMesh(self.indices, self.vertex_count)
+        return self._half_edges
+    
+    def face_index(self) -> BoxIndex:
+        """
+        Uniform-grid index over the faces' XY bounds (items are face rows).
+        
+        Built in one vectorized pass and cached until faces change, so
+        batches of local edits query it instead of scanning every face.
+        """
+        
+        if self._face_index is None:
+            corners = self.positions[self.indices][:, :, :2]
+            self._face_index = BoxIndex(np.concatenate([corners.min(axis=1), corners.max(axis=1)], axis=1))
+        return self._face_index
+    
+    def check_manifold(self) -> Tuple[bool, np.ndarray]:
+        """
+        Manifold test: each edge is shared by exactly 2 faces.
+        
+        Returns:
+            (is_manifold, bad_edges): bad_edges indexes the edges returned by
+            edge_uses() that are used by 1 face (open) or 3+ faces
+        """
+        
+        _, counts = self.edge_uses()
+        bad_edges = np.flatnonzero(counts != 2)
+        
+        return len(bad_edges) == 0, bad_edges
     
     def validate_manifold(self) -> Tuple[bool, str]:
         """
@@ -159,26 +490,13 @@ class Mesh:
             (is_manifold, message)
         """
         
-        edge_count: Dict[Tuple, int] = {}
+        is_manifold, bad_edges = self.check_manifold()
         
-        for face in self.faces:
-            vi0, vi1, vi2 = face.vertex_indices
-            
-            # Add edges (normalize to avoid duplicates)
-            edges = [
-                tuple(sorted([vi0, vi1])),
-                tuple(sorted([vi1, vi2])),
-                tuple(sorted([vi2, vi0]))
-            ]
-            
-            for edge in edges:
-                edge_count[edge] = edge_count.get(edge, 0) + 1
-        
-        # Check each edge appears exactly twice
-        non_manifold_edges = sum(1 for count in edge_count.values() if count != 2)
-        
-        if non_manifold_edges > 0:
-            return False, f"Non-manifold edges: {non_manifold_edges}"
+        if not is_manifold:
+            _, counts = self.edge_uses()
+            open_edges = int(np.count_nonzero(counts[bad_edges] == 1))
+            return False, (f"Non-manifold edges: {len(bad_edges)} "
+                           f"({open_edges} open, {len(bad_edges) - open_edges} shared by 3+ faces)")
         
         return True, "Mesh is manifold"
     
@@ -192,111 +510,526 @@ class Mesh:
         }
 
 
+@dataclass
+class InstanceSet:
+    """
+    A face group described as copies of one prototype mesh.
+    
+    Instance i is the prototype scaled, rotated, then translated
+    (glTF TRS order), so exporters can write the prototype once.
+    """
+    prototype: Mesh
+    translation: np.ndarray  # (N, 3) float32
+    rotation: np.ndarray     # (N, 4) float32 unit quaternions (x, y, z, w)
+    scale: np.ndarray        # (N, 3) float32
+    
+    def __len__(self) -> int:
+        return len(self.translation)
+    
+    def matrices(self) -> np.ndarray:
+        """(N, 4, 4) instance transforms"""
+        
+        x, y, z, w = self.rotation.astype(np.float64).T
+        rot = np.stack([
+            1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w),
+            2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w),
+            2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)
+        ], axis=1).reshape(-1, 3, 3)
+        
+        m = np.zeros((len(self), 4, 4))
+        m[:, :3, :3] = rot * self.scale.astype(np.float64)[:, None, :]
+        m[:, :3, 3] = self.translation
+        m[:, 3, 3] = 1.0
+        return m
+    
+    def expand(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        De-instanced geometry.
+        
+        Returns:
+            (positions, indices): (N * P, 3) float32 positions and
+            (N * T, 3) uint32 triangles
+        """
+        
+        m = self.matrices()
+        points = self.prototype.positions.astype(np.float64)
+        positions = np.einsum('nij,pj->npi', m[:, :3, :3], points) + m[:, None, :3, 3]
+        
+        count = self.prototype.vertex_count
+        offsets = count * np.arange(len(self), dtype=np.uint32)
+        indices = self.prototype.indices[None] + offsets[:, None, None]
+        return positions.reshape(-1, 3).astype(np.float32), indices.reshape(-1, 3)
+
+
+# ============================================================================
+# WALL FOOTPRINT
+# ============================================================================
+
+def _cross2(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Row-wise z component of the cross product of (N, 2) vectors"""
+    return a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]
+
+
+class WallFootprint:
+    """
+    2D union of the wall strips around a planar wall graph.
+    
+    Every centerline is offset by half the wall thickness on both sides.
+    At each graph vertex the incident edges are sorted by angle, and each
+    counter-clockwise pair is joined where their facing offset lines meet
+    (miter). Reflex joins longer than MITER_LIMIT half thicknesses are
+    bevelled, and dead ends (degree 1) get a butt cap.
+    
+    The union is tiled without overlaps by one quadrilateral per edge and
+    one triangle fan per junction. Pieces share corner indices, so the
+    outline comes out directly and no polygon clipping is needed. Edges
+    that cross without a shared vertex are not merged.
+    
+    Attributes:
+        points: (P, 2) footprint corners (and junction fan centers)
+        triangles: (T, 3) counter-clockwise triangles into points
+        boundary: (B, 2) directed outline segments into points, walls on
+                  the left
+        edge_mask: (E,) input edges that contributed (self-loops,
+                   zero-length and repeated edges are dropped)
+        quads: (K, 4) corners of each contributing edge's strip, counter-
+               clockwise: right side at a, right side at b, left side at b,
+               left side at a. Strip k is triangles k and K + k; its two
+               sides are boundary rows k and K + k.
+    """
+    
+    def __init__(self, vertices: np.ndarray, edges: np.ndarray, thickness,
+                 miter_limit: float = MITER_LIMIT):
+        """
+        Args:
+            vertices: (V, 2) graph vertex positions
+            edges: (E, 2) vertex rows of each wall centerline
+            thickness: wall thickness, scalar or (E,)
+            miter_limit: longest reflex miter, in half thicknesses
+        """
+        
+        vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 2)
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        half = np.broadcast_to(np.asarray(thickness, dtype=np.float64) / 2.0, (len(edges),))
+        
+        # Keep one edge per vertex pair, skipping loops and zero lengths
+        lo, hi = edges.min(axis=1), edges.max(axis=1)
+        delta = vertices[edges[:, 1]] - vertices[edges[:, 0]]
+        keys = np.where((lo != hi) & (np.hypot(delta[:, 0], delta[:, 1]) >= 1e-6),
+                        lo * len(vertices) + hi, -1)
+        _, first = np.unique(keys, return_index=True)
+        self.edge_mask = np.zeros(len(edges), dtype=bool)
+        self.edge_mask[first] = True
+        self.edge_mask &= keys >= 0
+        
+        edges, half = edges[self.edge_mask], half[self.edge_mask]
+        self._build(vertices, edges, half, miter_limit)
+    
+    def _build(self, vertices: np.ndarray, edges: np.ndarray,
+               half: np.ndarray, miter_limit: float):
+        """Compute joints, then the edge quads, junction fans and outline"""
+        
+        count = len(edges)
+        if count == 0:
+            self.points = np.empty((0, 2))
+            self.triangles = np.empty((0, 3), dtype=np.int64)
+            self.boundary = np.empty((0, 2), dtype=np.int64)
+            self.quads = np.empty((0, 4), dtype=np.int64)
+            return
+        
+        # Half-edges: 0..E-1 run a->b, E..2E-1 run b->a
+        origin = np.concatenate([edges[:, 0], edges[:, 1]])
+        target = np.concatenate([edges[:, 1], edges[:, 0]])
+        half = np.concatenate([half, half])
+        direction = vertices[target] - vertices[origin]
+        direction /= np.hypot(direction[:, 0], direction[:, 1])[:, None]
+        normal = np.column_stack([-direction[:, 1], direction[:, 0]])  # left side
+        
+        # Next half-edge counter-clockwise around the same origin
+        order = np.lexsort((np.arctan2(direction[:, 1], direction[:, 0]), origin))
+        sorted_origin = origin[order]
+        group_start = np.flatnonzero(np.r_[True, sorted_origin[1:] != sorted_origin[:-1]])
+        group_len = np.diff(np.r_[group_start, len(order)])
+        start = np.repeat(group_start, group_len)
+        size = np.repeat(group_len, group_len)
+        ccw = np.empty_like(order)
+        ccw[order] = order[start + (np.arange(len(order)) - start + 1) % size]
+        
+        # Join each half-edge's left offset line with the next one's right
+        # offset line: v + h_i n_i + t d_i = v - h_j n_j + s d_j
+        i, j = np.arange(len(order)), ccw
+        v = vertices[origin]
+        sin = _cross2(direction[i], direction[j])
+        cos = np.einsum('ij,ij->i', direction[i], direction[j])
+        parallel = np.abs(sin) < 1e-9
+        w = -(half[i, None] * normal[i] + half[j, None] * normal[j])
+        t = _cross2(w, direction[j]) / np.where(parallel, 1.0, sin)
+        miter = v + half[i, None] * normal[i] + t[:, None] * direction[i]
+        
+        # Straight continuation of equal walls: offset lines coincide
+        straight = parallel & (cos < 0) & (np.abs(half[i] - half[j]) < 1e-9)
+        miter[straight] = v[straight] + half[straight, None] * normal[straight]
+        
+        reach = np.hypot(*(miter - v).T)
+        use_miter = straight | (~parallel & ((sin > 0) |
+                                             (reach <= miter_limit * np.maximum(half[i], half[j]))))
+        bevel = ~use_miter
+        
+        # Corner indices: left[h] / right[h] are the ends of half-edge h's
+        # offset lines at its origin; a miter shares one point between them
+        left_points = np.where(use_miter[:, None], miter, v + half[:, None] * normal)
+        right_points = v[bevel] - half[j[bevel], None] * normal[j[bevel]]
+        points = [left_points, right_points]
+        left = np.arange(len(order))
+        right = np.empty_like(left)
+        right[j] = np.where(use_miter, left, len(order) + np.cumsum(bevel) - 1)
+        
+        # One quad per edge: right side a->b, then left side b->a
+        quads = np.column_stack([right[:count], left[count:], right[count:], left[:count]])
+        corners = np.concatenate(points)
+        
+        def area2(a, b, c):
+            return _cross2(corners[b] - corners[a], corners[c] - corners[a])
+        
+        q0, q1, q2, q3 = quads.T
+        split_02 = (area2(q0, q1, q2) > 0) & (area2(q0, q2, q3) > 0)
+        triangles = [
+            np.where(split_02[:, None], np.column_stack([q0, q1, q2]), np.column_stack([q0, q1, q3])),
+            np.where(split_02[:, None], np.column_stack([q0, q2, q3]), np.column_stack([q1, q2, q3]))
+        ]
+        
+        # Junction rings: right[h], left[h] for each half-edge in CCW order.
+        # Rings with 3+ distinct sides are filled: convex ones by a fan from
+        # their first corner, others by a fan from the graph vertex.
+        ring = np.column_stack([right[order], left[order]]).ravel()
+        ring_start = np.repeat(2 * group_start, 2 * group_len)
+        ring_size = np.repeat(2 * group_len, 2 * group_len)
+        ring_next = ring[ring_start + (np.arange(len(ring)) - ring_start + 1) % ring_size]
+        sides = ring != ring_next
+        sides_per_group = np.add.reduceat(sides.astype(np.int64), 2 * group_start)
+        filled = sides_per_group >= 3
+        
+        keep = sides & np.repeat(filled, 2 * group_len)
+        side_a, side_b = ring[keep], ring_next[keep]
+        side_count = sides_per_group[filled]
+        side_start = np.cumsum(side_count) - side_count
+        start = np.repeat(side_start, side_count)
+        position = np.arange(len(side_a)) - start
+        following = start + (position + 1) % np.repeat(side_count, side_count)
+        
+        turn = _cross2(corners[side_b] - corners[side_a],
+                       corners[side_b[following]] - corners[side_a[following]])
+        convex = np.minimum.reduceat(turn, side_start) > 1e-12 if len(side_start) else np.empty(0, bool)
+        side_convex = np.repeat(convex, side_count)
+        
+        inner = side_convex & (position >= 1) & (position < np.repeat(side_count, side_count) - 1)
+        triangles.append(np.column_stack([side_a[start[inner]], side_a[inner], side_b[inner]]))
+        
+        fan_vertices = sorted_origin[group_start[filled][~convex]]
+        centers = len(corners) + np.arange(len(fan_vertices))
+        points.append(vertices[fan_vertices])
+        triangles.append(np.column_stack([np.repeat(centers, side_count[~convex]),
+                                          side_a[~side_convex], side_b[~side_convex]]))
+        
+        self.points = np.concatenate(points)
+        self.triangles = np.concatenate(triangles)
+        self.quads = quads
+        self.boundary = np.concatenate([
+            quads[:, [0, 1]], quads[:, [2, 3]],
+            np.column_stack([left[bevel], right[j[bevel]]])
+        ])
+    
+    def area(self) -> float:
+        """Footprint area (sum of cap triangle areas)"""
+        a, b, c = self.triangles.T
+        p = self.points
+        return float(_cross2(p[b] - p[a], p[c] - p[a]).sum() / 2.0)
+    
+    def loops(self) -> List[np.ndarray]:
+        """
+        Outline segments chained into closed loops.
+        
+        Returns:
+            list of point index arrays: outer outlines counter-clockwise,
+            outlines of enclosed spaces clockwise
+        """
+        
+        successors: Dict[int, List[int]] = {}
+        for a, b in self.boundary.tolist():
+            successors.setdefault(a, []).append(b)
+        
+        loops = []
+        while successors:
+            start = next(iter(successors))
+            loop, a = [start], start
+            while a in successors:
+                b = successors[a].pop()
+                if not successors[a]:
+                    del successors[a]
+                if b == start:
+                    break
+                loop.append(b)
+                a = b
+            loops.append(np.asarray(loop, dtype=np.int64))
+        
+        return loops
+
+
 # ============================================================================
 # WALL EXTRUSION
 # ============================================================================
 
+# Triangles of a box given as 4 bottom corners (0-3) then 4 top corners
+# (4-7), both in the same winding: bottom (normal down), top (normal up),
+# then the four sides
+BOX_FACES = np.array([
+    [0, 2, 1], [0, 3, 2],
+    [4, 5, 6], [4, 6, 7],
+    [0, 1, 4], [1, 5, 4],
+    [1, 2, 5], [2, 6, 5],
+    [2, 3, 6], [3, 7, 6],
+    [3, 0, 7], [0, 4, 7]
+], dtype=np.intp)
+
+
+def add_boxes(mesh: Mesh, footprints: np.ndarray,
+              z_bottom: float, z_top: float,
+              group: str = 'default') -> np.ndarray:
+    """
+    Append B prisms over quadrilateral footprints in one operation.
+    
+    Args:
+        mesh: target mesh
+        footprints: (B, 4, 2) footprint corners, counter-clockwise
+        z_bottom: bottom face height
+        z_top: top face height
+        group: face group name
+    
+    Returns:
+        (B, 8) vertex indices: bottom corners 0-3, top corners 4-7
+    """
+    
+    footprints = np.asarray(footprints, dtype=np.float64).reshape(-1, 4, 2)
+    count = len(footprints)
+    
+    corners = np.empty((count, 8, 3), dtype=np.float64)
+    corners[:, :4, :2] = footprints
+    corners[:, 4:, :2] = footprints
+    corners[:, :4, 2] = z_bottom
+    corners[:, 4:, 2] = z_top
+    
+    vi = mesh.add_vertices(corners.reshape(-1, 3)).reshape(count, 8)
+    mesh.add_faces((vi[:, BOX_FACES]).reshape(-1, 3), group=group)
+    
+    return vi
+
+
+def ring_boundary(sizes: List[int]) -> np.ndarray:
+    """
+    Outline segments of concatenated counter-clockwise rings (outer ring
+    first, then holes), directed so the region lies on their left.
+    
+    Args:
+        sizes: vertex count of each ring
+    
+    Returns:
+        (B, 2) point index pairs: outer ring forward, holes backward
+    """
+    
+    starts = np.cumsum([0] + list(sizes[:-1]))
+    boundary = []
+    for i, (start, size) in enumerate(zip(starts, sizes)):
+        ring = start + np.arange(size)
+        pair = (ring, np.roll(ring, -1)) if i == 0 else (np.roll(ring, -1), ring)
+        boundary.append(np.column_stack(pair))
+    return np.concatenate(boundary)
+
+
+def add_prism(mesh: Mesh, points: np.ndarray, triangles: np.ndarray,
+              boundary: np.ndarray, z_bottom: float, z_top: float,
+              group: str = 'default') -> np.ndarray:
+    """
+    Append one closed prism over a triangulated 2D region.
+    
+    Caps reuse the triangulation (top facing up, bottom facing down); each
+    boundary segment becomes one vertical quad.
+    
+    Args:
+        mesh: target mesh
+        points: (P, 2) region vertices
+        triangles: (T, 3) counter-clockwise triangles over points
+        boundary: (B, 2) directed outline segments, interior on the left
+        z_bottom: bottom face height
+        z_top: top face height
+        group: face group name
+    
+    Returns:
+        (2, P) vertex indices of the bottom and top copies of the points
+    """
+    
+    count = len(points)
+    corners = np.empty((2, count, 3), dtype=np.float64)
+    corners[:, :, :2] = points
+    corners[0, :, 2] = z_bottom
+    corners[1, :, 2] = z_top
+    
+    bottom, top = mesh.add_vertices(corners.reshape(-1, 3)).reshape(2, count)
+    a, b = np.asarray(boundary, dtype=np.intp).reshape(-1, 2).T
+    
+    mesh.add_faces(np.concatenate([
+        top[triangles],
+        bottom[triangles[:, ::-1]],
+        np.column_stack([bottom[a], bottom[b], top[b]]),
+        np.column_stack([bottom[a], top[b], top[a]])
+    ]), group=group)
+    
+    return np.stack([bottom, top])
+
+
 class WallExtrusion:
     """Extrude wall centerlines to 3D volumetric geometry"""
     
     @staticmethod
-    def extrude_wall_edge(p_start: np.ndarray,
-                         p_end: np.ndarray,
-                         thickness: float,
-                         height: float,
-                         mesh: Mesh) -> List[int]:
+    def extrude_wall_edges(segments: np.ndarray,
+                           thickness,
+                           height: float,
+                           mesh: Mesh,
+                           group: str = 'walls',
+                           z_bottom: float = 0.0) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Extrude a single wall edge to 3D geometry.
+        Extrude many wall edges to 3D boxes in one pass.
         
-        Creates a box with dimensions:
-        - width: thickness
-        - length: distance from p_start to p_end
-        - height: wall_height
+        Each edge becomes a box of its length, the given thickness
+        (centered on the edge) and height, standing on z = z_bottom.
         
         Args:
-            p_start: (x, y) start point of wall centerline (meters)
-            p_end: (x, y) end point of wall centerline (meters)
-            thickness: wall thickness (meters)
+            segments: (E, 2, 2) start/end points of wall centerlines (meters)
+            thickness: wall thickness (meters), scalar or (E,)
             height: wall height (meters)
             mesh: target mesh to add vertices/faces to
+            group: face group name
+            z_bottom: height of the box bottoms (meters)
         
         Returns:
-            list of vertex indices created
+            (vertex_indices, extruded): (K, 8) vertex indices of the boxes
+            and an (E,) mask of edges that were extruded (degenerate
+            zero-length edges are skipped)
         """
         
-        # Compute wall direction and perpendicular
-        wall_vec = p_end - p_start
-        wall_len = np.linalg.norm(wall_vec)
-        
-        if wall_len < 1e-6:
-            return []  # Degenerate edge
+        segments = np.asarray(segments, dtype=np.float64).reshape(-1, 2, 2)
+        half_thick = np.broadcast_to(np.asarray(thickness, dtype=np.float64) / 2.0,
+                                     (len(segments),))
         
-        wall_dir = wall_vec / wall_len
+        # Wall directions and lengths
+        wall_vec = segments[:, 1] - segments[:, 0]
+        wall_len = np.hypot(wall_vec[:, 0], wall_vec[:, 1])
+        extruded = wall_len >= 1e-6
         
-        # Perpendicular in XY plane
-        perp_dir = np.array([-wall_dir[1], wall_dir[0]])
+        p_start, p_end = segments[extruded, 0], segments[extruded, 1]
+        wall_dir = wall_vec[extruded] / wall_len[extruded, None]
         
-        # Half-thickness perpendiculars
-        half_thick = thickness / 2.0
-        perp_offset = perp_dir * half_thick
+        # Perpendicular in XY plane, scaled to half the thickness
+        perp_offset = np.column_stack([-wall_dir[:, 1], wall_dir[:, 0]]) * half_thick[extruded, None]
         
-        # Bottom four corners (z = 0)
-        p0_bottom = np.array([p_start[0] - perp_offset[0], p_start[1] - perp_offset[1], 0.0])
-        p1_bottom = np.array([p_start[0] + perp_offset[0], p_start[1] + perp_offset[1], 0.0])
-        p2_bottom = np.array([p_end[0] + perp_offset[0], p_end[1] + perp_offset[1], 0.0])
-        p3_bottom = np.array([p_end[0] - perp_offset[0], p_end[1] - perp_offset[1], 0.0])
+        # Counter-clockwise footprint, as add_boxes expects
+        footprints = np.stack([p_start + perp_offset, p_start - perp_offset,
+                               p_end - perp_offset, p_end + perp_offset], axis=1)
         
-        # Top four corners (z = height)
-        p0_top = np.array([p_start[0] - perp_offset[0], p_start[1] - perp_offset[1], height])
-        p1_top = np.array([p_start[0] + perp_offset[0], p_start[1] + perp_offset[1], height])
-        p2_top = np.array([p_end[0] + perp_offset[0], p_end[1] + perp_offset[1], height])
-        p3_top = np.array([p_end[0] - perp_offset[0], p_end[1] - perp_offset[1], height])
-        
-        # Add vertices
-        vi_bottom = [
-            mesh.add_vertex(p0_bottom),
-            mesh.add_vertex(p1_bottom),
-            mesh.add_vertex(p2_bottom),
-            mesh.add_vertex(p3_bottom)
-        ]
+        return add_boxes(mesh, footprints, z_bottom, z_bottom + height, group=group), extruded
+    
+    @staticmethod
+    def box_instances(segments: np.ndarray,
+                      thickness,
+                      height: float,
+                      z_bottom: float = 0.0) -> InstanceSet:
+        """
+        Describe extrude_wall_edges boxes as instances of one unit box.
         
-        vi_top = [
-            mesh.add_vertex(p0_top),
-            mesh.add_vertex(p1_top),
-            mesh.add_vertex(p2_top),
-            mesh.add_vertex(p3_top)
-        ]
+        The prototype is the box of the edge (0, 0)-(1, 0) with thickness
+        and height 1; each wall scales it to (length, thickness, height),
+        turns it about Z to the edge direction and moves it to the edge
+        start. Zero-length edges are skipped, as in extrude_wall_edges.
         
-        all_vertices = vi_bottom + vi_top
+        Args:
+            segments: (E, 2, 2) start/end points of wall centerlines (meters)
+            thickness: wall thickness (meters), scalar or (E,)
+            height: wall height (meters)
+            z_bottom: height of the box bottoms (meters)
         
-        # Create faces (bottom, top, sides)
+        Returns:
+            InstanceSet with one instance per extruded edge
+        """
         
-        # Bottom (z=0, normal pointing down)
-        mesh.add_face(vi_bottom[0], vi_bottom[2], vi_bottom[1])
-        mesh.add_face(vi_bottom[0], vi_bottom[3], vi_bottom[2])
+        prototype = Mesh(name="unit_wall")
+        WallExtrusion.extrude_wall_edges(np.array([[[0.0, 0.0], [1.0, 0.0]]]), 1.0, 1.0, prototype)
+        prototype.recalculate_normals()
+        
+        segments = np.asarray(segments, dtype=np.float64).reshape(-1, 2, 2)
+        thickness = np.broadcast_to(np.asarray(thickness, dtype=np.float64), (len(segments),))
+        wall_vec = segments[:, 1] - segments[:, 0]
+        wall_len = np.hypot(wall_vec[:, 0], wall_vec[:, 1])
+        extruded = wall_len >= 1e-6
+        
+        half_angle = 0.5 * np.arctan2(wall_vec[extruded, 1], wall_vec[extruded, 0])
+        count = int(np.count_nonzero(extruded))
+        
+        translation = np.zeros((count, 3), dtype=np.float32)
+        translation[:, :2] = segments[extruded, 0]
+        translation[:, 2] = z_bottom
+        rotation = np.zeros((count, 4), dtype=np.float32)
+        rotation[:, 2] = np.sin(half_angle)
+        rotation[:, 3] = np.cos(half_angle)
+        scale = np.column_stack([wall_len[extruded], thickness[extruded],
+                                 np.full(count, height)]).astype(np.float32)
+        
+        return InstanceSet(prototype, translation, rotation, scale)
+    
+    @staticmethod
+    def extrude_footprint(footprint: WallFootprint,
+                          height: float,
+                          mesh: Mesh,
+                          group: str = 'walls') -> np.ndarray:
+        """
+        Extrude a wall footprint to one closed solid standing on z = 0.
         
-        # Top (z=height, normal pointing up)
-        mesh.add_face(vi_top[0], vi_top[1], vi_top[2])
-        mesh.add_face(vi_top[0], vi_top[2], vi_top[3])
+        Args:
+            footprint: WallFootprint (meters)
+            height: wall height (meters)
+            mesh: target mesh to add vertices/faces to
+            group: face group name
         
-        # Sides
-        # Side 1: p0-p1
-        mesh.add_face(vi_bottom[0], vi_bottom[1], vi_top[0])
-        mesh.add_face(vi_bottom[1], vi_top[1], vi_top[0])
+        Returns:
+            (2, P) vertex indices of the bottom and top copies of the
+            footprint points
+        """
         
-        # Side 2: p1-p2
-        mesh.add_face(vi_bottom[1], vi_bottom[2], vi_top[1])
-        mesh.add_face(vi_bottom[2], vi_top[2], vi_top[1])
+        return add_prism(mesh, footprint.points, footprint.triangles, footprint.boundary,
+                         0.0, height, group=group)
+    
+    @staticmethod
+    def extrude_wall_edge(p_start: np.ndarray,
+                         p_end: np.ndarray,
+                         thickness: float,
+                         height: float,
+                         mesh: Mesh) -> List[int]:
+        """
+        Extrude a single wall edge to 3D geometry.
         
-        # Side 3: p2-p3
-        mesh.add_face(vi_bottom[2], vi_bottom[3], vi_top[2])
-        mesh.add_face(vi_bottom[3], vi_top[3], vi_top[2])
+        Args:
+            p_start: (x, y) start point of wall centerline (meters)
+            p_end: (x, y) end point of wall centerline (meters)
+            thickness: wall thickness (meters)
+            height: wall height (meters)
+            mesh: target mesh to add vertices/faces to
         
-        # Side 4: p3-p0
-        mesh.add_face(vi_bottom[3], vi_bottom[0], vi_top[3])
-        mesh.add_face(vi_bottom[0], vi_top[0], vi_top[3])
+        Returns:
+            list of vertex indices created
+        """
         
-        return all_vertices
+        vi, _ = WallExtrusion.extrude_wall_edges(
+            np.stack([p_start, p_end])[None], thickness, height, mesh
+        )
+        return vi.ravel().tolist()
 
 
 # ============================================================================
@@ -306,17 +1039,28 @@ class WallExtrusion:
 class CutawayBuilder:
     """Build complete 3D cutaway model from normalized geometry"""
     
-    def __init__(self, wall_graph, room_set, normalization_context):
+    WALL_MODES = ('footprint', 'boxes')
+    
+    def __init__(self, wall_graph, room_set, normalization_context,
+                 wall_mode: str = 'footprint'):
         """
         Args:
             wall_graph: normalized WallTopologyGraph
             room_set: normalized RoomSet
             normalization_context: NormalizationContext from Stage 5
+            wall_mode: 'footprint' (mitered union of all walls, extruded
+                       once; watertight) or 'boxes' (one overlapping box
+                       per edge)
         """
+        if wall_mode not in self.WALL_MODES:
+            raise ValueError(f"Unknown wall mode: {wall_mode}")
+        
         self.wall_graph = wall_graph
         self.room_set = room_set
         self.context = normalization_context
+        self.wall_mode = wall_mode
         
+        self.wall_footprint = None  # WallFootprint (footprint mode)
         self.wall_mesh = None
         self.floor_mesh = None
         self.room_mesh = None
@@ -349,10 +1093,13 @@ class CutawayBuilder:
             # Step 3: Ensure wall continuity at junctions
             self._validate_wall_continuity()
             
-            # Step 4: Recalculate normals for smooth rendering
+            # Step 4: Weld coincident vertices (shared corners at junctions)
+            combined_mesh.weld()
+            
+            # Step 5: Recalculate normals for smooth rendering
             combined_mesh.recalculate_normals()
             
-            # Step 5: Validate topology
+            # Step 6: Validate topology
             is_manifold, msg = combined_mesh.validate_manifold()
             if not is_manifold:
                 log.warning(f"[CutawayBuilder] Manifold check: {msg}")
@@ -369,23 +1116,24 @@ class CutawayBuilder:
     
     def _build_floor_slab(self, mesh: Mesh) -> Optional[Mesh]:
         """
-        Build floor slab as rectangular base.
-        
-        Floor bounds are computed from wall bounding box.
+        Build the floor: one slab per room (face group 'room_<id>'), or a
+        padded rectangle (group 'floor') when no room outlines exist.
         """
         
         log.info("[CutawayBuilder] Building floor slab")
         
+        if self.room_set and self._build_room_floors(mesh):
+            return mesh
+        
         if not self.wall_graph or not self.wall_graph.vertices:
             log.warning("[CutawayBuilder] No walls to compute floor bounds")
             return mesh
         
-        # Get bounding box from wall vertices
-        xs = [v.position[0] for v in self.wall_graph.vertices.values()]
-        ys = [v.position[1] for v in self.wall_graph.vertices.values()]
+        # Get bounding box from wall vertices (metric frame)
+        points = self.wall_graph.vertex_positions(METRIC_FRAME)
         
-        x_min, x_max = min(xs), max(xs)
-        y_min, y_max = min(ys), max(ys)
+        x_min, y_min = points.min(axis=0)
+        x_max, y_max = points.max(axis=0)
         
         # Add padding to floor
         padding = 0.5  # meters
@@ -394,50 +1142,70 @@ class CutawayBuilder:
         y_min -= padding
         y_max += padding
         
-        # Create floor slab (thin rectangular box at z=0)
-        z_top = 0.0
-        z_bottom = -FLOOR_SLAB_THICKNESS
-        
-        # Bottom corners
-        p0 = np.array([x_min, y_min, z_bottom])
-        p1 = np.array([x_max, y_min, z_bottom])
-        p2 = np.array([x_max, y_max, z_bottom])
-        p3 = np.array([x_min, y_max, z_bottom])
-        
-        # Top corners
-        p4 = np.array([x_min, y_min, z_top])
-        p5 = np.array([x_max, y_min, z_top])
-        p6 = np.array([x_max, y_max, z_top])
-        p7 = np.array([x_min, y_max, z_top])
+        # Create floor slab (thin rectangular box with its top at z=0)
+        footprint = np.array([[x_min, y_min], [x_max, y_min], [x_max, y_max], [x_min, y_max]])
+        add_boxes(mesh, footprint, -FLOOR_SLAB_THICKNESS, 0.0, group='floor')
         
-        # Add vertices
-        vi_bottom = [mesh.add_vertex(p) for p in [p0, p1, p2, p3]]
-        vi_top = [mesh.add_vertex(p) for p in [p4, p5, p6, p7]]
-        
-        # Add faces (bottom, top, sides)
-        # Bottom (z_bottom, normal down)
-        mesh.add_face(vi_bottom[0], vi_bottom[2], vi_bottom[1])
-        mesh.add_face(vi_bottom[0], vi_bottom[3], vi_bottom[2])
-        
-        # Top (z_top, normal up)
-        mesh.add_face(vi_top[0], vi_top[1], vi_top[2])
-        mesh.add_face(vi_top[0], vi_top[2], vi_top[3])
-        
-        # Sides
-        mesh.add_face(vi_bottom[0], vi_bottom[1], vi_top[0])
-        mesh.add_face(vi_bottom[1], vi_top[1], vi_top[0])
+        log.info("[CutawayBuilder] Floor slab created (8 vertices, 12 faces)")
+        return mesh
+    
+    def _build_room_floors(self, mesh: Mesh) -> int:
+        """
+        Build one floor slab per room from its outline and holes.
         
-        mesh.add_face(vi_bottom[1], vi_bottom[2], vi_top[1])
-        mesh.add_face(vi_bottom[2], vi_top[2], vi_top[1])
+        Outlines are moved to FLOOR_SEAM short of the wall centerlines:
+        raster rooms (traced along wall faces) grow by half the measured
+        wall thickness, planar rooms (graph faces on the centerlines)
+        shrink by the seam. All rooms are triangulated in one batch.
         
-        mesh.add_face(vi_bottom[2], vi_bottom[3], vi_top[2])
-        mesh.add_face(vi_bottom[3], vi_top[3], vi_top[2])
+        Returns:
+            number of room slabs built
+        """
         
-        mesh.add_face(vi_bottom[3], vi_bottom[0], vi_top[3])
-        mesh.add_face(vi_bottom[0], vi_top[0], vi_top[3])
+        frame = self.room_set.frames.get(METRIC_FRAME)
+        seam_px = FLOOR_SEAM / frame.scale
+        
+        adjacency = self.room_set.adjacency
+        if adjacency is None:
+            grow = -seam_px
+        else:
+            if len(adjacency):
+                half_wall_px = 0.5 * float(np.median(adjacency.mean_thickness_px))
+            else:
+                half_wall_px = 0.5 * WALL_THICKNESS / frame.scale
+            grow = half_wall_px - seam_px
+        
+        room_ids, polygons = [], []
+        for room_id in self.room_set.rooms:
+            outer, holes = self.room_set.outline(room_id)
+            if outer is None:
+                continue
+            
+            # Offsets work on counter-clockwise rings (pixel frame)
+            outer = offset_ring(outer if polygon_signed_area(outer) > 0 else outer[::-1], grow)
+            if polygon_signed_area(outer) <= 0:
+                continue
+            holes = [offset_ring(h if polygon_signed_area(h) > 0 else h[::-1], -grow) for h in holes]
+            holes = [h for h in holes if polygon_signed_area(h) > 0]
+            
+            room_ids.append(room_id)
+            polygons.append((frame.apply(outer), [frame.apply(h) for h in holes]))
         
-        log.info("[CutawayBuilder] Floor slab created (8 vertices, 12 faces)")
-        return mesh
+        built = 0
+        for room_id, (outer, holes), (points, triangles) in zip(
+                room_ids, polygons, triangulate_polygons(polygons)):
+            if len(triangles) == 0:
+                continue
+            
+            # Hole rings are counter-clockwise too
+            boundary = ring_boundary([len(outer)] + [len(h) for h in holes])
+            add_prism(mesh, points, triangles, boundary,
+                      -FLOOR_SLAB_THICKNESS, 0.0, group=f"room_{room_id}")
+            built += 1
+        
+        if built:
+            log.info(f"[CutawayBuilder] Room floors created: {built} slabs")
+        return built
     
     def _build_walls(self, mesh: Mesh) -> Optional[Mesh]:
         """
@@ -452,25 +1220,38 @@ class CutawayBuilder:
             log.error("[CutawayBuilder] No wall edges to extrude")
             return None
         
-        wall_count = 0
-        total_wall_length = 0.0
+        segments = self.wall_graph.edge_segments(METRIC_FRAME)
         
-        for edge in self.wall_graph.edges.values():
-            # Get wall centerline endpoints
-            p_start = np.array(edge.vertex_a.position)
-            p_end = np.array(edge.vertex_b.position)
-            
-            # Extrude to 3D
-            WallExtrusion.extrude_wall_edge(
-                p_start, p_end,
+        if self.wall_mode == 'footprint':
+            # Union of all wall strips (metric frame), extruded once
+            footprint = WallFootprint(
+                self.wall_graph.vertex_positions(METRIC_FRAME),
+                self.wall_graph.edge_vertex_rows(),
+                thickness=WALL_THICKNESS
+            )
+            WallExtrusion.extrude_footprint(footprint, WALL_HEIGHT, mesh, group='walls')
+            self.wall_footprint = footprint
+            extruded = footprint.edge_mask
+            log.info(f"[CutawayBuilder] Wall footprint: {footprint.area():.2f} m², "
+                     f"{len(footprint.boundary)} outline segments")
+        else:
+            # Extrude every wall centerline (metric frame) to 3D at once
+            _, extruded = WallExtrusion.extrude_wall_edges(
+                segments,
                 thickness=WALL_THICKNESS,
                 height=WALL_HEIGHT,
-                mesh=mesh
+                mesh=mesh,
+                group='walls'
             )
             
-            wall_count += 1
-            edge_length = np.linalg.norm(p_end - p_start)
-            total_wall_length += edge_length
+            # Every box is the same unit box moved into place: keep that
+            # form for instanced export
+            mesh.instances['walls'] = WallExtrusion.box_instances(
+                segments, WALL_THICKNESS, WALL_HEIGHT
+            )
+        
+        wall_count = int(np.count_nonzero(extruded))
+        total_wall_length = float(np.linalg.norm(segments[:, 1] - segments[:, 0], axis=1).sum())
         
         log.info(f"[CutawayBuilder] Extruded {wall_count} walls, total length {total_wall_length:.2f}m")
         return mesh
@@ -486,7 +1267,170 @@ class CutawayBuilder:
         log.info(f"[CutawayBuilder] Wall junctions verified: {junctions}")
 
 
-def create_cutaway_mesh(wall_graph, room_set, normalization_context) -> Optional[Mesh]:
+# ============================================================================
+# LEVELS OF DETAIL
+# ============================================================================
+
+# Smallest screen coverage (fraction of the viewport height spanned by
+# the model) at which each level is shown; the last level covers the rest
+LOD_SCREEN_COVERAGE = (0.3, 0.1, 0.0)
+
+# Sine of the smallest outline corner kept in the coarsest level
+OUTLINE_MIN_TURN = 0.01
+
+
+def outline_rings(footprint: WallFootprint) -> List[np.ndarray]:
+    """
+    Building outline: the outermost loops of a wall footprint.
+    
+    Loops nested in another one (slivers left between overlapping wall
+    pieces sit inside the building outline) are dropped, as are (nearly)
+    collinear corners that junctions leave along straight outer walls.
+    
+    Args:
+        footprint: WallFootprint (meters)
+    
+    Returns:
+        list of (K, 2) counter-clockwise rings
+    """
+    
+    rings = [footprint.points[loop] for loop in footprint.loops()]
+    rings = [ring for ring in rings if polygon_signed_area(ring) > 0]
+    firsts = np.array([ring[0] for ring in rings]).reshape(-1, 2)
+    nested = np.zeros(len(rings), dtype=bool)
+    for j, other in enumerate(rings):
+        inside = points_in_polygon(firsts, other)
+        inside[j] = False
+        nested |= inside
+    
+    outline = []
+    for ring in (ring for ring, skip in zip(rings, nested) if not skip):
+        # Drop turns under ~0.5 degrees
+        before, after = np.roll(ring, 1, axis=0), np.roll(ring, -1, axis=0)
+        turn = _cross2(ring - before, after - ring)
+        scale = np.linalg.norm(ring - before, axis=1) * np.linalg.norm(after - ring, axis=1)
+        ring = ring[np.abs(turn) > OUTLINE_MIN_TURN * np.maximum(scale, 1e-12)]
+        if len(ring) >= 3:
+            outline.append(ring)
+    return outline
+
+
+def add_floor_plates(mesh: Mesh, rings: List[np.ndarray], group: str = 'floor'):
+    """Append one floor slab (top at z = 0) per outline ring"""
+    for ring in rings:
+        points, triangles = triangulate_polygon(ring)
+        add_prism(mesh, points, triangles, ring_boundary([len(ring)]),
+                  -FLOOR_SLAB_THICKNESS, 0.0, group=group)
+
+
+def build_outline_shell(footprint: WallFootprint, name: str = "outline") -> Mesh:
+    """
+    Coarsest level of detail: the building outline only.
+    
+    Every outermost loop of the wall footprint becomes a floor plate plus one
+    perimeter wall band (the loop and its inward offset by the wall
+    thickness), extruded as closed prisms. Interior walls, room floors and
+    openings are dropped; the top stays open.
+    
+    Args:
+        footprint: WallFootprint of the full plan (meters)
+        name: mesh name
+    
+    Returns:
+        Mesh with 'floor' and 'walls' face groups
+    """
+    
+    mesh = Mesh(name=name)
+    rings = outline_rings(footprint)
+    add_floor_plates(mesh, rings)
+    
+    for ring in rings:
+        inner = offset_ring(ring, -WALL_THICKNESS)
+        holes = [inner] if polygon_signed_area(inner) > 0 else []
+        points, triangles = triangulate_polygon(ring, holes)
+        add_prism(mesh, points, triangles, ring_boundary([len(ring)] + [len(h) for h in holes]),
+                  0.0, WALL_HEIGHT, group='walls')
+    
+    mesh.recalculate_normals()
+    return mesh
+
+
+def build_merged_walls(footprint: WallFootprint, name: str = "merged") -> Mesh:
+    """
+    Middle level of detail: all walls as one mitered footprint solid.
+    
+    The floor is the outline floor plate of build_outline_shell (not the
+    per-room slabs), so it covers exactly the building; openings are
+    dropped and the top stays open.
+    
+    Args:
+        footprint: WallFootprint of the full plan (meters)
+        name: mesh name
+    
+    Returns:
+        Mesh with 'floor' and 'walls' face groups
+    """
+    
+    mesh = Mesh(name=name)
+    add_floor_plates(mesh, outline_rings(footprint))
+    WallExtrusion.extrude_footprint(footprint, WALL_HEIGHT, mesh, group='walls')
+    mesh.recalculate_normals()
+    return mesh
+
+
+def build_lod_chain(full_mesh: Mesh, wall_graph, room_set) -> Tuple[List[Mesh], List[float]]:
+    """
+    Level-of-detail chain for a cutaway model.
+    
+    Levels (one per LOD_SCREEN_COVERAGE entry):
+        0. full_mesh as given (Stage 6/7 output, openings included)
+        1. walls merged into one mitered footprint solid on the outline
+           floor plate (no room floors, no openings)
+        2. outline shell (floor plate and perimeter walls only)
+    
+    A level that does not have fewer triangles than the previous kept
+    level is dropped; the previous level is then shown down to the
+    dropped level's coverage threshold.
+    
+    Args:
+        full_mesh: finest level
+        wall_graph: normalized WallTopologyGraph
+        room_set: normalized RoomSet (may be None; room floors are not
+                  used by the coarser levels)
+    
+    Returns:
+        (meshes finest first, screen coverage threshold per mesh); just
+        [full_mesh] if the coarser levels cannot be built
+    """
+    
+    if not wall_graph or not wall_graph.edges:
+        log.warning("[LOD] Could not build coarser levels, exporting full detail only")
+        return [full_mesh], [LOD_SCREEN_COVERAGE[-1]]
+    
+    footprint = WallFootprint(
+        wall_graph.vertex_positions(METRIC_FRAME),
+        wall_graph.edge_vertex_rows(),
+        thickness=WALL_THICKNESS
+    )
+    merged = build_merged_walls(footprint, name=f"{full_mesh.name}_lod1")
+    outline = build_outline_shell(footprint, name=f"{full_mesh.name}_lod2")
+    
+    chain, coverage = [full_mesh], [LOD_SCREEN_COVERAGE[0]]
+    for level, (mesh, threshold) in enumerate(zip([merged, outline], LOD_SCREEN_COVERAGE[1:]), start=1):
+        if mesh.face_count < chain[-1].face_count:
+            chain.append(mesh)
+            coverage.append(threshold)
+        else:
+            log.info(f"[LOD] Dropping level {level}: {mesh.face_count} triangles, "
+                     f"previous level has {chain[-1].face_count}")
+            coverage[-1] = threshold
+    
+    log.info("[LOD] Triangles per level: " + ", ".join(str(m.face_count) for m in chain))
+    return chain, coverage
+
+
+def create_cutaway_mesh(wall_graph, room_set, normalization_context,
+                        wall_mode: str = 'footprint') -> Optional[Mesh]:
     """
     High-level function to create 3D cutaway mesh.
     
@@ -494,10 +1438,11 @@ def create_cutaway_mesh(wall_graph, room_set, normalization_context) -> Optional
         wall_graph: normalized WallTopologyGraph
         room_set: normalized RoomSet
         normalization_context: NormalizationContext
+        wall_mode: 'footprint' or 'boxes' (see CutawayBuilder)
     
     Returns:
         Mesh object or None
     """
     
-    builder = CutawayBuilder(wall_graph, room_set, normalization_context)
+    builder = CutawayBuilder(wall_graph, room_set, normalization_context, wall_mode=wall_mode)
     return builder.build()
@@ -8,14 +8,15 @@ Key Specifications:
 - Doors: width 0.9 m, height clipped to wall height
 - Windows: width 0.8 m, height 0.5 m, sill 0.65–0.80 m
 - No decorative meshes (clean rectangular cuts)
-- Boolean operations on manifold geometry
+- No mesh booleans: host walls are rebuilt around their openings
 
 Algorithm:
 1. Extract door/window locations from semantic masks
-2. Map 2D positions to 3D wall locations
-3. Create rectangular cutout volumes
-4. Apply boolean subtraction (manifold-safe)
-5. Validate resulting geometry remains watertight
+2. Map each opening onto its host wall edge (position along the
+   centerline, width, sill and head heights)
+3. Split each host wall along its edge into solid pieces, with sill and
+   lintel blocks across each opening
+4. Re-extrude the walls (watertight; O(walls + openings), no face scans)
 
 This is a critical step for interior visibility and realism.
 """
@@ -25,7 +26,11 @@ from typing import List, Tuple, Optional, Dict, Set
 import logging
 from dataclasses import dataclass
 
-from pipeline.stage6_3d_construction import Mesh, Vertex, Face
+from pipeline.coordinate_frames import METRIC_FRAME
+from pipeline.stage6_3d_construction import (
+    Mesh, Vertex, Face, InstanceSet, WallExtrusion, WallFootprint,
+    WALL_HEIGHT, WALL_THICKNESS
+)
 
 log = logging.getLogger(__name__)
 
@@ -165,96 +170,540 @@ class OpeningDetector:
 
 
 # ============================================================================
-# MANIFOLD-SAFE BOOLEAN OPERATIONS
+# ANALYTIC WALL SPLITTING
 # ============================================================================
 
-class ManifoldBoolean:
+# Shortest solid wall piece kept between openings and at wall ends, and
+# the narrowest opening still cut after clipping
+MIN_WALL_PIECE = 0.05     # meters
+MIN_OPENING_WIDTH = 0.2   # meters
+
+# Heights closer than this count as equal
+Z_EPSILON = 1e-6  # meters
+
+
+@dataclass
+class WallOpening:
+    """An opening mapped onto its host wall edge"""
+    edge_id: int      # host edge id in the wall graph
+    t: float          # center along the edge: 0 at vertex_a, 1 at vertex_b
+    width: float      # meters
+    z_bottom: float   # meters (sill; 0 for doors)
+    z_top: float      # meters (head)
+    kind: str = 'door'
+    edge_row: int = -1         # row in wall_graph.edge_segments()
+    edge_length: float = 0.0   # host centerline length (meters)
+    angle: float = 0.0         # host wall direction (radians, CCW from +X)
+    distance: float = 0.0      # center to host centerline (meters)
+    
+    @property
+    def center(self) -> float:
+        """Meters along the centerline from vertex_a"""
+        return self.t * self.edge_length
+    
+    @property
+    def start(self) -> float:
+        return self.center - self.width / 2.0
+    
+    @property
+    def end(self) -> float:
+        return self.center + self.width / 2.0
+
+
+def _zipper(p: Dict[float, int], q: Dict[float, int],
+            z_bottom: float, z_top: float) -> List[Tuple[int, int, int]]:
     """
-    Manifold-safe boolean operations on meshes.
+    Triangulate the vertical strip between two vertex columns.
     
-    Strategy: Create cutting volumes and remove vertices/faces within them
-    rather than using complex boolean libraries.
+    The face runs from column p to column q with the solid on its left
+    (add_prism side orientation). Every vertex either column has between
+    z_bottom and z_top is used, so no T-junctions remain.
+    
+    Args:
+        p, q: height -> vertex index of each column, in height order
+        z_bottom, z_top: strip height range
+    
+    Returns:
+        list of triangles
     """
     
+    # Columns are built bottom-up, so items come in height order
+    a = [item for item in p.items() if z_bottom - Z_EPSILON <= item[0] <= z_top + Z_EPSILON]
+    b = [item for item in q.items() if z_bottom - Z_EPSILON <= item[0] <= z_top + Z_EPSILON]
+    
+    # Walk both columns upwards, always advancing the lower next vertex
+    triangles = []
+    i = j = 0
+    while i < len(a) - 1 or j < len(b) - 1:
+        if j == len(b) - 1 or (i < len(a) - 1 and a[i + 1][0] <= b[j + 1][0]):
+            triangles.append((a[i][1], b[j][1], a[i + 1][1]))
+            i += 1
+        else:
+            triangles.append((a[i][1], b[j][1], b[j + 1][1]))
+            j += 1
+    return triangles
+
+
+class WallSplitter:
+    """
+    Rebuild walls with openings as solid pieces plus sill/lintel blocks.
+    
+    Along a host edge the wall is cut into columns: solid columns span the
+    full wall height, an opening column keeps only the block under its
+    sill and the lintel above its head. Columns share their cut vertices,
+    so the result is watertight without any mesh boolean.
+    """
+    
+    def __init__(self, thickness: float = WALL_THICKNESS, height: float = WALL_HEIGHT):
+        self.thickness = thickness
+        self.height = height
+    
+    def _intervals(self, opening: WallOpening) -> List[Tuple[float, float]]:
+        """Height ranges where an opening column keeps wall"""
+        intervals = []
+        if opening.z_bottom > Z_EPSILON:
+            intervals.append((0.0, min(opening.z_bottom, self.height)))
+        if opening.z_top < self.height - Z_EPSILON:
+            intervals.append((max(opening.z_top, 0.0), self.height))
+        return intervals
+    
     @staticmethod
-    def cut_rectangular_hole(mesh: Mesh,
-                            center_x: float,
-                            center_y: float,
-                            width: float,
-                            height: float,
-                            z_bottom: float,
-                            z_top: float) -> bool:
+    def _present(intervals: List[Tuple[float, float]], z: float) -> bool:
+        return any(z0 < z < z1 for z0, z1 in intervals)
+    
+    def _fit(self, openings: List[WallOpening],
+             lo: float, hi: float) -> List[Tuple[float, float, WallOpening]]:
         """
-        Cut a rectangular hole in the mesh (simplified approach).
+        Clip openings to [lo, hi] along their edge, in order.
+        
+        Openings that end up narrower than MIN_OPENING_WIDTH, overlap an
+        earlier one or leave no head room are skipped.
         
-        This removes faces that lie within the cutting volume.
-        For production, consider using PyOpenVDB or similar.
+        Returns:
+            list of (start, end, opening)
+        """
+        
+        fitted = []
+        previous_end = lo - MIN_WALL_PIECE
+        for opening in sorted(openings, key=lambda o: o.start):
+            start, end = max(opening.start, lo), min(opening.end, hi)
+            if (end - start < MIN_OPENING_WIDTH or start < previous_end + MIN_WALL_PIECE or
+                    opening.z_top <= opening.z_bottom + Z_EPSILON):
+                log.warning(f"[WallSplitter] Skipping {opening.kind} at {opening.center:.2f}m "
+                            f"on wall row {opening.edge_row}: does not fit")
+                continue
+            fitted.append((start, end, opening))
+            previous_end = end
+        return fitted
+    
+    def split_footprint(self, vertices: np.ndarray, edges: np.ndarray,
+                        openings: List[WallOpening], mesh: Mesh,
+                        group: str = 'walls') -> int:
+        """
+        Cut openings into walls Stage 6 extruded from the wall footprint.
+        
+        Only host strips change: their faces are looked up in the mesh
+        face index and dropped in one keep-mask pass, then each strip is
+        rebuilt column by column on its old corner vertices, which the
+        untouched walls share.
         
         Args:
-            mesh: Mesh to modify
-            center_x, center_y: center of hole in XY plane
-            width, height: hole dimensions
-            z_bottom, z_top: Z range of hole
+            vertices: (V, 2) wall graph vertex positions (meters)
+            edges: (E, 2) vertex rows of each wall centerline
+            openings: placed openings (edge_row indexes edges)
+            mesh: mesh holding the extruded footprint
+            group: wall face group name
         
         Returns:
-            success
+            number of openings cut
+        """
+        
+        footprint = WallFootprint(vertices, edges, thickness=self.thickness)
+        rows = np.flatnonzero(footprint.edge_mask)
+        quad_of_row = np.full(len(edges), -1, dtype=np.int64)
+        quad_of_row[rows] = np.arange(len(rows))
+        
+        by_quad: Dict[int, List[WallOpening]] = {}
+        for opening in openings:
+            k = int(quad_of_row[opening.edge_row])
+            if k < 0:
+                log.warning(f"[WallSplitter] Wall row {opening.edge_row} has no footprint strip")
+                continue
+            by_quad.setdefault(k, []).append(opening)
+        if not by_quad:
+            return 0
+        
+        hosts = np.fromiter(by_quad, dtype=np.int64, count=len(by_quad))
+        quads = footprint.points[footprint.quads[hosts]]
+        owners, faces = self._strip_faces(mesh, quads, group)
+        
+        # Strip faces only use the strip's corner vertices (4 corners at
+        # the bottom and top): recover them for the rebuilt strip
+        used = mesh.indices[faces].ravel().astype(np.int64)
+        used_owner = np.repeat(owners, 3)
+        used_positions = mesh.positions[used].astype(np.float64)
+        corner = np.argmin(np.linalg.norm(quads[used_owner] - used_positions[:, None, :2], axis=2), axis=1)
+        level = (used_positions[:, 2] > 0.5 * self.height).astype(np.int64)
+        corner_vertices = np.full((len(hosts), 4, 2), -1, dtype=np.int64)
+        corner_vertices[used_owner, corner, level] = used
+        found = (corner_vertices >= 0).all(axis=(1, 2))
+        
+        keep = np.ones(mesh.face_count, dtype=bool)
+        keep[faces[found[owners]]] = False
+        mesh.keep_faces(keep)
+        
+        # Strips are collected first and appended to the mesh in one batch
+        positions: List[Tuple[float, float, float]] = []
+        triangles: List[Tuple[int, int, int]] = []
+        cut = 0
+        for h, k in enumerate(hosts.tolist()):
+            if not found[h]:
+                log.warning(f"[WallSplitter] Wall row {rows[k]} not found in the mesh, skipping its openings")
+                continue
+            a, b = vertices[edges[rows[k], 0]], vertices[edges[rows[k], 1]]
+            cut += self._split_strip(footprint, k, a, b, by_quad[k], corner_vertices[h],
+                                     mesh.vertex_count, positions, triangles)
+        
+        mesh.add_vertices(np.asarray(positions, dtype=np.float64).reshape(-1, 3))
+        mesh.add_faces(np.asarray(triangles, dtype=np.uint32).reshape(-1, 3), group=group)
+        return cut
+    
+    @staticmethod
+    def _strip_faces(mesh: Mesh, quads: np.ndarray,
+                     group: str) -> Tuple[np.ndarray, np.ndarray]:
         """
+        Faces of a group that belong to wall strips.
         
-        # Half-dimensions
-        hw = width / 2.0
-        hh = height / 2.0
+        A face belongs to a strip when all its corners lie within the
+        strip quad and its centroid lies strictly between the strip ends
+        (so butt caps and junction fans stay).
         
-        # Bounding box of hole
-        x_min, x_max = center_x - hw, center_x + hw
-        y_min, y_max = center_y - hh, center_y + hh
+        Args:
+            mesh: mesh to search
+            quads: (H, 4, 2) strip corners (WallFootprint.quads order)
+            group: face group name
+        
+        Returns:
+            (owners, faces): strip row and face index of every match
+        """
+        
+        # Mesh positions are float32: allow for their rounding far from the origin
+        eps = max(1e-4, 1e-6 * float(np.abs(quads).max(initial=0.0)))
+        bounds = np.concatenate([quads.min(axis=1) - eps, quads.max(axis=1) + eps], axis=1)
+        owners, faces = mesh.face_index().query(bounds)
+        in_group = mesh.face_groups[faces] == mesh.group_index(group)
+        owners, faces = owners[in_group], faces[in_group]
+        
+        corners = mesh.positions[mesh.indices[faces]][:, :, :2].astype(np.float64)
+        q = quads[owners]
+        sides = np.roll(q, -1, axis=1) - q
+        lengths = np.maximum(np.linalg.norm(sides, axis=2), 1e-12)
+        
+        def inward(points):
+            # Signed distance of (P, C, 2) points from each quad side
+            rel = points[:, :, None, :] - q[:, None, :, :]
+            cross = sides[:, None, :, 0] * rel[..., 1] - sides[:, None, :, 1] * rel[..., 0]
+            return cross / lengths[:, None, :]
+        
+        inside = ((inward(corners) >= -eps).all(axis=(1, 2)) &
+                  (inward(corners.mean(axis=1, keepdims=True))[:, 0, [1, 3]] > eps).all(axis=1))
+        return owners[inside], faces[inside]
+    
+    def _split_strip(self, footprint: WallFootprint, k: int,
+                     a: np.ndarray, b: np.ndarray,
+                     openings: List[WallOpening], corner_vertices: np.ndarray,
+                     first_vertex: int,
+                     positions: List[Tuple[float, float, float]],
+                     triangles: List[Tuple[int, int, int]]) -> int:
+        """
+        Rebuild footprint strip k (edge a -> b) around its openings.
         
-        # Identify faces to remove (those contained in cutting volume)
-        faces_to_remove = []
+        corner_vertices holds the (4, 2) existing bottom/top vertex of each
+        strip corner. New vertices are appended to positions, numbered from
+        first_vertex, and faces to triangles.
         
-        for face_idx, face in enumerate(mesh.faces):
-            vi0, vi1, vi2 = face.vertex_indices
-            v0 = mesh.vertices[vi0].position
-            v1 = mesh.vertices[vi1].position
-            v2 = mesh.vertices[vi2].position
+        Returns:
+            number of openings cut
+        """
+        
+        q = footprint.points[footprint.quads[k]]
+        direction = (b - a) / np.hypot(*(b - a))
+        normal = np.array([-direction[1], direction[0]])
+        
+        # Cuts stay clear of the (possibly mitered) strip ends
+        along = (q - a) @ direction
+        fitted = self._fit(openings,
+                           max(along[0], along[3]) + MIN_WALL_PIECE,
+                           min(along[1], along[2]) - MIN_WALL_PIECE)
+        
+        solid = [(0.0, self.height)]
+        columns = [solid]
+        for _, _, opening in fitted:
+            columns += [self._intervals(opening), solid]
+        
+        # Vertex columns (height -> index) along the right and left sides
+        corner_xy = q.tolist()
+        
+        def corner(i):
+            return {0.0: int(corner_vertices[i, 0]), self.height: int(corner_vertices[i, 1])}
+        
+        right, left = [corner(0)], [corner(3)]
+        right_xy, left_xy = [corner_xy[0]], [corner_xy[3]]
+        offsets = ((q[0] - a) @ normal, (q[3] - a) @ normal)
+        cuts = [s for start, end, _ in fitted for s in (start, end)]
+        for j, s in enumerate(cuts):
+            levels = sorted({z for interval in columns[j] + columns[j + 1] for z in interval})
+            for offset, chain, chain_xy in zip(offsets, (right, left), (right_xy, left_xy)):
+                x, y = (a + s * direction + offset * normal).tolist()
+                start = first_vertex + len(positions)
+                positions.extend((x, y, z) for z in levels)
+                chain.append({z: start + i for i, z in enumerate(levels)})
+                chain_xy.append((x, y))
+        right.append(corner(1))
+        left.append(corner(2))
+        right_xy.append(corner_xy[1])
+        left_xy.append(corner_xy[2])
+        
+        for i, intervals in enumerate(columns):
+            quad = (right[i], right[i + 1], left[i + 1], left[i])
+            (x0, y0), (x1, y1), (x2, y2), (x3, y3) = right_xy[i], right_xy[i + 1], left_xy[i + 1], left_xy[i]
             
-            # Check if all vertices of face are within cutting volume
-            in_x_range = all(x_min <= v[0] <= x_max for v in [v0, v1, v2])
-            in_y_range = all(y_min <= v[1] <= y_max for v in [v0, v1, v2])
-            in_z_range = all(z_bottom <= v[2] <= z_top for v in [v0, v1, v2])
+            # Caps: split along the diagonal that keeps both halves positive
+            if ((x1 - x0) * (y2 - y0) - (y1 - y0) * (x2 - x0) > 0 and
+                    (x2 - x0) * (y3 - y0) - (y2 - y0) * (x3 - x0) > 0):
+                cap = ((0, 1, 2), (0, 2, 3))
+            else:
+                cap = ((0, 1, 3), (1, 2, 3))
             
-            if in_x_range and in_y_range and in_z_range:
-                faces_to_remove.append(face_idx)
+            for z0, z1 in intervals:
+                for c in cap:
+                    triangles.append(tuple(quad[n][z1] for n in c))
+                    triangles.append(tuple(quad[n][z0] for n in c[::-1]))
+                triangles += _zipper(right[i], right[i + 1], z0, z1)
+                triangles += _zipper(left[i + 1], left[i], z0, z1)
+            
+            # Jamb faces where only one side of the cut has wall
+            if i == 0:
+                continue
+            levels = list(right[i])
+            for z0, z1 in zip(levels[:-1], levels[1:]):
+                mid = 0.5 * (z0 + z1)
+                behind, ahead = self._present(columns[i - 1], mid), self._present(intervals, mid)
+                if behind and not ahead:
+                    triangles += _zipper(right[i], left[i], z0, z1)
+                elif ahead and not behind:
+                    triangles += _zipper(left[i], right[i], z0, z1)
+        
+        return len(fitted)
+    
+    def split_boxes(self, segments: np.ndarray, openings: List[WallOpening],
+                    mesh: Mesh, group: str = 'walls') -> int:
+        """
+        Extrude one box per wall piece (Stage 6 'boxes' mode).
         
-        # Remove marked faces
-        for idx in sorted(faces_to_remove, reverse=True):
-            mesh.faces.pop(idx)
+        Host edges become solid boxes between their openings plus sill and
+        lintel boxes across them; the group keeps an instanced form.
         
-        log.info(f"[ManifoldBoolean] Removed {len(faces_to_remove)} faces for hole")
+        Args:
+            segments: (E, 2, 2) wall centerlines (meters)
+            openings: placed openings (edge_row indexes segments)
+            mesh: target mesh
+            group: face group name
         
-        return True
+        Returns:
+            number of openings cut
+        """
+        
+        segments = np.asarray(segments, dtype=np.float64).reshape(-1, 2, 2)
+        by_row: Dict[int, List[WallOpening]] = {}
+        for opening in openings:
+            by_row.setdefault(opening.edge_row, []).append(opening)
+        
+        # Wall pieces by height range
+        plain = np.ones(len(segments), dtype=bool)
+        plain[list(by_row)] = False
+        pieces: Dict[Tuple[float, float], List[np.ndarray]] = {(0.0, self.height): list(segments[plain])}
+        
+        cut = 0
+        for row, row_openings in by_row.items():
+            p0, p1 = segments[row]
+            length = float(np.hypot(*(p1 - p0)))
+            if length < 1e-6:
+                continue
+            direction = (p1 - p0) / length
+            
+            s = 0.0
+            for start, end, opening in self._fit(row_openings, MIN_WALL_PIECE, length - MIN_WALL_PIECE):
+                pieces[(0.0, self.height)].append(np.stack([p0 + s * direction, p0 + start * direction]))
+                for interval in self._intervals(opening):
+                    pieces.setdefault(interval, []).append(
+                        np.stack([p0 + start * direction, p0 + end * direction]))
+                s = end
+                cut += 1
+            pieces[(0.0, self.height)].append(np.stack([p0 + s * direction, p1]))
+        
+        instance_sets = []
+        for (z0, z1), group_segments in pieces.items():
+            group_segments = np.asarray(group_segments).reshape(-1, 2, 2)
+            WallExtrusion.extrude_wall_edges(group_segments, self.thickness, z1 - z0, mesh,
+                                             group=group, z_bottom=z0)
+            instance_sets.append(WallExtrusion.box_instances(group_segments, self.thickness,
+                                                             z1 - z0, z_bottom=z0))
+        
+        mesh.instances[group] = InstanceSet(
+            prototype=instance_sets[0].prototype,
+            translation=np.concatenate([i.translation for i in instance_sets]),
+            rotation=np.concatenate([i.rotation for i in instance_sets]),
+            scale=np.concatenate([i.scale for i in instance_sets])
+        )
+        return cut
 
 
 # ============================================================================
 # OPENING PLACEMENT & GENERATION
 # ============================================================================
 
+# Largest distance from an opening's center to its host wall centerline
+OPENING_SNAP_DISTANCE = 0.5  # meters
+
+# Opening x segment pairs projected per broadcast chunk (bounds memory)
+ASSOCIATION_CHUNK_PAIRS = 1 << 18
+
+
+def associate_openings(centers: np.ndarray, segments: np.ndarray,
+                       max_distance: float = OPENING_SNAP_DISTANCE
+                       ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Find the host wall of every opening center in one broadcast.
+    
+    All centers are projected onto all segments at once (in chunks of
+    centers so the (P, S) planes stay cache-sized) and each takes its
+    nearest segment. Zero-length segments never host an opening.
+    
+    Args:
+        centers: (P, 2) opening centers
+        segments: (S, 2, 2) wall centerlines, same units
+        max_distance: centers farther than this from every wall are rejected
+    
+    Returns:
+        (rows, t, distances): (P,) host segment rows (-1 when rejected),
+        clamped projection parameters along the host, and distances to it
+    """
+    
+    centers = np.asarray(centers, dtype=np.float64).reshape(-1, 2)
+    segments = np.asarray(segments, dtype=np.float64).reshape(-1, 4)
+    count = len(centers)
+    rows = np.full(count, -1, dtype=np.int64)
+    t = np.zeros(count)
+    distances = np.full(count, np.inf)
+    if count == 0 or len(segments) == 0:
+        return rows, t, distances
+    
+    x0, y0 = segments[:, 0], segments[:, 1]
+    dx, dy = segments[:, 2] - x0, segments[:, 3] - y0
+    length_sq = dx * dx + dy * dy
+    degenerate = length_sq < 1e-12
+    inv_length_sq = np.where(degenerate, 0.0, 1.0 / np.where(degenerate, 1.0, length_sq))
+    
+    # Squared distances in (P, S) scalar planes, updated in place; the
+    # square root is only taken for the winners
+    chunk = max(1, ASSOCIATION_CHUNK_PAIRS // len(segments))
+    for start in range(0, count, chunk):
+        block = slice(start, start + chunk)
+        rx = centers[block, 0:1] - x0
+        ry = centers[block, 1:2] - y0
+        param = rx * dx
+        param += ry * dy
+        param *= inv_length_sq
+        np.clip(param, 0.0, 1.0, out=param)
+        rx -= param * dx
+        ry -= param * dy
+        rx *= rx
+        ry *= ry
+        rx += ry
+        rx[:, degenerate] = np.inf
+        
+        nearest = np.argmin(rx, axis=1)
+        picked = np.arange(len(nearest))
+        rows[block] = nearest
+        t[block] = param[picked, nearest]
+        distances[block] = np.sqrt(rx[picked, nearest])
+    
+    rows[distances > max_distance] = -1
+    return rows, t, distances
+
+
 class OpeningGenerator:
     """Generate door and window openings in mesh"""
     
-    def __init__(self, mesh: Mesh, wall_graph, scale_factor: float):
+    def __init__(self, mesh: Mesh, wall_graph, scale_factor: float,
+                 wall_mode: str = 'footprint'):
         """
         Args:
             mesh: 3D mesh to cut openings into
             wall_graph: normalized WallTopologyGraph (for locating walls)
             scale_factor: pixels per meter (for coordinate conversion)
+            wall_mode: how Stage 6 built the walls ('footprint' or 'boxes')
         """
         self.mesh = mesh
         self.wall_graph = wall_graph
         self.scale_factor = scale_factor
+        self.wall_mode = wall_mode
+        self.openings: List[WallOpening] = []  # placed, cut by split_walls()
+    
+    def place_openings(self, opening_list: List[Dict], width: float,
+                       z_bottom: float, z_top: float, kind: str) -> List[WallOpening]:
+        """
+        Map openings onto their host wall edges.
+        
+        Every opening center is projected onto every wall centerline in one
+        broadcast (associate_openings); each opening goes to its nearest
+        wall at that projection.
+        
+        Args:
+            opening_list: dictionaries from OpeningDetector ('position' in meters)
+            width: opening width along the wall (meters)
+            z_bottom, z_top: opening height range (meters)
+            kind: 'door' or 'window'
+        
+        Returns:
+            placed openings (those farther than OPENING_SNAP_DISTANCE from
+            any wall are dropped)
+        """
+        
+        if not self.wall_graph or not self.wall_graph.edges or not opening_list:
+            return []
+        
+        frame = self.wall_graph.frames.get(METRIC_FRAME)
+        segments = self.wall_graph.edge_segments(METRIC_FRAME)
+        edge_ids = self.wall_graph.edge_ids()
+        z_top = min(z_top, WALL_HEIGHT)  # clipped to wall height
+        
+        positions = np.array([info['position'] for info in opening_list], dtype=np.float64).reshape(-1, 2)
+        centers = frame.apply(positions * self.scale_factor)
+        rows, t, distances = associate_openings(centers, segments)
+        
+        direction = segments[:, 1] - segments[:, 0]
+        lengths = np.hypot(direction[:, 0], direction[:, 1])
+        angles = np.arctan2(direction[:, 1], direction[:, 0])
+        
+        placed = []
+        for info, row, param, distance in zip(opening_list, rows.tolist(), t.tolist(), distances.tolist()):
+            if row < 0:
+                log.warning(f"[OpeningGenerator] No wall near {kind} at {info['position']}, skipping")
+                continue
+            placed.append(WallOpening(
+                edge_id=int(edge_ids[row]), t=param, width=width,
+                z_bottom=z_bottom, z_top=z_top, kind=kind,
+                edge_row=row, edge_length=float(lengths[row]),
+                angle=float(angles[row]), distance=distance
+            ))
+        
+        return placed
     
     def generate_doors(self, door_list: List[Dict]) -> bool:
         """
-        Generate door openings.
+        Place door openings (cut by split_walls).
         
         Args:
             door_list: list of door dictionaries from OpeningDetector
@@ -265,31 +714,15 @@ class OpeningGenerator:
         
         log.info(f"[OpeningGenerator] Generating {len(door_list)} doors")
         
-        for i, door_info in enumerate(door_list):
-            x, y = door_info['position']
-            
-            # Use standard door spec
-            spec = DEFAULT_DOOR_SPEC
-            
-            # Cut door hole (from floor to standard door height)
-            success = ManifoldBoolean.cut_rectangular_hole(
-                self.mesh,
-                center_x=x,
-                center_y=y,
-                width=spec.width,
-                height=spec.height,
-                z_bottom=spec.z_bottom,
-                z_top=spec.height
-            )
-            
-            if not success:
-                log.warning(f"[OpeningGenerator] Failed to cut door {i}")
-        
+        # Standard door spec, from the floor up
+        spec = DEFAULT_DOOR_SPEC
+        self.openings += self.place_openings(door_list, spec.width, spec.z_bottom,
+                                             spec.z_bottom + spec.height, 'door')
         return True
     
     def generate_windows(self, window_list: List[Dict]) -> bool:
         """
-        Generate window openings.
+        Place window openings (cut by split_walls).
         
         Args:
             window_list: list of window dictionaries from OpeningDetector
@@ -300,26 +733,44 @@ class OpeningGenerator:
         
         log.info(f"[OpeningGenerator] Generating {len(window_list)} windows")
         
-        for i, window_info in enumerate(window_list):
-            x, y = window_info['position']
-            
-            # Use standard window spec
-            spec = DEFAULT_WINDOW_SPEC
-            
-            # Cut window hole (at sill height)
-            success = ManifoldBoolean.cut_rectangular_hole(
-                self.mesh,
-                center_x=x,
-                center_y=y,
-                width=spec.width,
-                height=spec.height,
-                z_bottom=spec.sill_height,
-                z_top=spec.sill_height + spec.height
-            )
-            
-            if not success:
-                log.warning(f"[OpeningGenerator] Failed to cut window {i}")
+        # Standard window spec, at sill height
+        spec = DEFAULT_WINDOW_SPEC
+        self.openings += self.place_openings(window_list, spec.width, spec.sill_height,
+                                             spec.sill_height + spec.height, 'window')
+        return True
+    
+    def split_walls(self) -> bool:
+        """
+        Cut all placed openings into the 'walls' group (host walls only in
+        footprint mode; the whole group in boxes mode).
+        
+        Returns:
+            success
+        """
         
+        if not self.openings:
+            return True
+        
+        walls = self.mesh.group_faces('walls')
+        if len(walls) == 0:
+            log.error("[OpeningGenerator] Mesh has no 'walls' group to cut")
+            return False
+        
+        splitter = WallSplitter()
+        if self.wall_mode == 'boxes':
+            # The instanced form covers the whole group: rebuild it
+            keep = np.ones(self.mesh.face_count, dtype=bool)
+            keep[walls] = False
+            self.mesh.keep_faces(keep)
+            self.mesh.drop_unused_vertices()
+            cut = splitter.split_boxes(self.wall_graph.edge_segments(METRIC_FRAME),
+                                       self.openings, self.mesh)
+        else:
+            cut = splitter.split_footprint(self.wall_graph.vertex_positions(METRIC_FRAME),
+                                           self.wall_graph.edge_vertex_rows(),
+                                           self.openings, self.mesh)
+        
+        log.info(f"[OpeningGenerator] Cut {cut} of {len(self.openings)} openings into the walls")
         return True
     
     def generate_all(self, doors: List[Dict], windows: List[Dict]) -> bool:
@@ -335,6 +786,8 @@ class OpeningGenerator:
         if windows:
             success &= self.generate_windows(windows)
         
+        success &= self.split_walls()
+        
         # Recalculate normals after modifications
         self.mesh.recalculate_normals()
         
@@ -352,7 +805,8 @@ def stage7_openings_generation(mesh: Mesh,
                                window_mask: np.ndarray,
                                wall_mask: np.ndarray,
                                wall_graph,
-                               scale_factor: float) -> Tuple[bool, Optional[Mesh]]:
+                               scale_factor: float,
+                               wall_mode: str = 'footprint') -> Tuple[bool, Optional[Mesh]]:
     """
     Execute Stage 7: Openings Generation
     
@@ -363,6 +817,7 @@ def stage7_openings_generation(mesh: Mesh,
         wall_mask: binary wall mask from Stage 2
         wall_graph: normalized wall topology graph
         scale_factor: pixels per meter
+        wall_mode: Stage 6 wall mode ('footprint' or 'boxes')
     
     Returns:
         (success, mesh_with_openings)
@@ -376,7 +831,7 @@ def stage7_openings_generation(mesh: Mesh,
         doors, windows = detector.detect()
         
         # Step 2: Generate openings
-        generator = OpeningGenerator(mesh, wall_graph, scale_factor)
+        generator = OpeningGenerator(mesh, wall_graph, scale_factor, wall_mode=wall_mode)
         success = generator.generate_all(doors, windows)
         
         if not success:
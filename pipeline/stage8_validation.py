@@ -8,20 +8,30 @@ Validation Checks:
 1. Model geometry (wall count, room count)
 2. Topology (no single-solid enclosure)
 3. Interior visibility from top
-4. Manifold and watertight requirements
+4. Manifold and watertight requirements (boundary loops, outward
+   orientation, self-intersections)
 5. Dimensional sanity checks
 6. No roofs or closed boxes
 
 FAIL FAST principle: If validation fails, return explicit error immediately.
 Do NOT attempt to fix or continue.
 
+The mesh, architecture and cutaway validators run concurrently (NumPy
+releases the GIL); a failed critical check cancels the checks not yet
+run. Each check's wall time is kept in ValidationResult.timings.
+
 This is a critical quality gate before export.
 """
 
 import numpy as np
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, FrozenSet, List, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
 import logging
 
+from pipeline.bvh import TriangleBVH
+
 log = logging.getLogger(__name__)
 
 # ============================================================================
@@ -37,6 +47,75 @@ MIN_MESH_HEIGHT = 0.5       # At least 0.5m tall
 MAX_SCALE_FACTOR = 1000.0   # Max pixels per meter
 MIN_SCALE_FACTOR = 0.01     # Min pixels per meter
 
+DEGENERATE_FACE_AREA = 1e-12  # m^2; smaller triangles are degenerate
+SELF_INTERSECTION_SAMPLES = 5  # intersecting pairs to find before stopping
+
+# Checks whose failure cancels everything not yet run (FAIL FAST)
+CRITICAL_CHECKS = ('Mesh: Geometry Count', 'Architecture: Wall Count')
+
+
+# ============================================================================
+# GEOMETRY STATS
+# ============================================================================
+
+class GeometryStats:
+    """
+    Mesh quantities shared by the validators, computed in one pass.
+    
+    Built once per mesh (ComprehensiveValidator passes the same instance to
+    every validator) so Stage 8 reads each array a fixed number of times
+    whatever the number of checks.
+    """
+    
+    def __init__(self, mesh):
+        self.vertex_count = len(mesh.vertices)
+        self.face_count = len(mesh.faces)
+        positions = mesh.positions
+        self.positions = positions
+        
+        # NaN/Inf flags per vertex; bounds cover the finite vertices only
+        nan_rows = np.isnan(positions).any(axis=1)
+        self.finite = np.isfinite(positions).all(axis=1)
+        self.nan_count = int(np.count_nonzero(nan_rows))
+        self.inf_count = int(np.count_nonzero(~self.finite & ~nan_rows))
+        finite_positions = positions[self.finite]
+        if len(finite_positions):
+            self.bounds_min = finite_positions.min(axis=0).astype(np.float64)
+            self.bounds_max = finite_positions.max(axis=0).astype(np.float64)
+        else:
+            self.bounds_min = self.bounds_max = np.zeros(3)
+        self.extent = self.bounds_max - self.bounds_min
+        
+        # Sorted heights act as a cumulative z histogram: any band count is
+        # two binary searches
+        self._z_sorted = np.sort(finite_positions[:, 2])
+        
+        self.invalid_normals = np.flatnonzero(~np.isfinite(mesh.normals).all(axis=1))
+        
+        # Degenerate faces: repeated corners or (near) zero area
+        triangles = mesh.indices
+        corners = positions[triangles].astype(np.float64)
+        with np.errstate(invalid='ignore', over='ignore'):  # NaN/Inf corners
+            cross = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+            area = 0.5 * np.sqrt(np.einsum('ij,ij->i', cross, cross))
+        repeated = ((triangles[:, 0] == triangles[:, 1]) | (triangles[:, 1] == triangles[:, 2]) |
+                    (triangles[:, 2] == triangles[:, 0]))
+        self.degenerate_faces = int(np.count_nonzero(repeated | ~(area > DEGENERATE_FACE_AREA)))
+        
+        # Edge uses (cached on the mesh, shared with Stage 7)
+        self.edges, self.edge_counts = mesh.edge_uses()
+        self.bad_edges = np.flatnonzero(self.edge_counts != 2)
+        self.open_edges = int(np.count_nonzero(self.edge_counts[self.bad_edges] == 1))
+    
+    @property
+    def is_manifold(self) -> bool:
+        return len(self.bad_edges) == 0
+    
+    def count_z(self, low: float = -np.inf, high: float = np.inf) -> int:
+        """Number of finite vertices with low < z < high"""
+        z = self._z_sorted
+        return int(max(0, np.searchsorted(z, high, side='left') - np.searchsorted(z, low, side='right')))
+
 
 # ============================================================================
 # VALIDATION RESULTS
@@ -48,16 +127,57 @@ class ValidationResult:
     def __init__(self):
         self.passed = True
         self.checks: List[Tuple[str, bool, str]] = []  # (check_name, passed, message)
+        self.timings: Dict[str, float] = {}  # check_name -> wall seconds
         self.warnings: List[str] = []
         self.errors: List[str] = []
+        self.skipped = 0  # checks cancelled after a critical failure
+        self._mark: Optional[float] = None
+        self._timed_from = 0
     
-    def add_check(self, name: str, passed: bool, message: str):
-        """Record validation check result"""
+    def add_check(self, name: str, passed: bool, message: str,
+                  seconds: Optional[float] = None):
+        """
+        Record validation check result.
+        
+        Inside start_timing()/stop_timing() the check is charged the time
+        since the previous check (or the start), unless seconds is given.
+        """
         self.checks.append((name, passed, message))
+        if seconds is not None:
+            self.timings[name] = seconds
+        elif self._mark is not None:
+            now = time.perf_counter()
+            self.timings[name] = now - self._mark
+            self._mark = now
         if not passed:
             self.passed = False
             self.errors.append(message)
     
+    def start_timing(self):
+        """Start timing the checks recorded from now on"""
+        self._mark = time.perf_counter()
+        self._timed_from = len(self.checks)
+    
+    def stop_timing(self):
+        """Charge time spent after the last check (diagnostics) to that check"""
+        if self._mark is not None and len(self.checks) > self._timed_from:
+            last = self.checks[-1][0]
+            self.timings[last] = self.timings.get(last, 0.0) + time.perf_counter() - self._mark
+        self._mark = None
+    
+    def merge(self, other: 'ValidationResult', prefix: str = ""):
+        """Append another result's checks, timings and warnings"""
+        for name, passed, msg in other.checks:
+            seconds = other.timings.get(name)
+            self.add_check(f"{prefix}{name}", passed, msg, seconds)
+        for w in other.warnings:
+            self.add_warning(f"{prefix}{w}")
+        self.skipped += other.skipped
+    
+    def slowest(self, count: int = 3) -> List[Tuple[str, float]]:
+        """(check_name, seconds) of the slowest checks, slowest first"""
+        return sorted(self.timings.items(), key=lambda item: item[1], reverse=True)[:count]
+    
     def add_warning(self, message: str):
         """Record warning"""
         self.warnings.append(message)
@@ -75,9 +195,14 @@ class ValidationResult:
         lines.append("\nChecks:")
         for name, passed, message in self.checks:
             status = "✓ PASS" if passed else "✗ FAIL"
-            lines.append(f"  [{status}] {name}")
+            seconds = self.timings.get(name)
+            timing = f" ({seconds * 1000:.1f} ms)" if seconds is not None else ""
+            lines.append(f"  [{status}] {name}{timing}")
             lines.append(f"         {message}")
         
+        if self.skipped:
+            lines.append(f"\nSkipped: {self.skipped} checks (critical check failed)")
+        
         # Warnings
         if self.warnings:
             lines.append("\nWarnings:")
@@ -99,40 +224,70 @@ class ValidationResult:
 # VALIDATOR CLASSES
 # ============================================================================
 
+def run_checks(result: ValidationResult, checks: List[Callable[[], None]],
+               cancel: Optional[threading.Event] = None,
+               critical: FrozenSet[str] = frozenset()) -> ValidationResult:
+    """
+    Run check methods in order, timing each.
+    
+    Args:
+        result: result the checks record into
+        checks: bound check methods
+        cancel: shared event; once set, the remaining checks are skipped
+        critical: check names whose failure sets cancel
+    
+    Returns:
+        result
+    """
+    
+    for position, check in enumerate(checks):
+        if cancel is not None and cancel.is_set():
+            result.skipped += len(checks) - position
+            break
+        
+        first = len(result.checks)
+        result.start_timing()
+        check()
+        result.stop_timing()
+        
+        if cancel is not None and any(not passed and name in critical
+                                      for name, passed, _ in result.checks[first:]):
+            log.error("[Validator] Critical check failed, cancelling remaining checks")
+            cancel.set()
+    
+    return result
+
+
 class MeshValidator:
     """Validate 3D mesh properties"""
     
-    def __init__(self, mesh):
+    def __init__(self, mesh, stats: Optional[GeometryStats] = None):
         self.mesh = mesh
+        self.stats = stats if stats is not None else GeometryStats(mesh)
         self.result = ValidationResult()
     
-    def validate(self) -> ValidationResult:
-        """Execute all mesh validation checks"""
+    def validate(self, cancel: Optional[threading.Event] = None,
+                 critical: FrozenSet[str] = frozenset()) -> ValidationResult:
+        """Execute all mesh validation checks (see run_checks)"""
         
         log.info("[Validator] Validating mesh geometry")
         
-        # Check vertex/face counts
-        self._check_geometry_count()
-        
-        # Check manifold property
-        self._check_manifold()
-        
-        # Check dimensions
-        self._check_dimensions()
-        
-        # Check vertex positions are reasonable
-        self._check_vertex_positions()
-        
-        # Check no NaN or Inf
-        self._check_numerical_validity()
-        
-        return self.result
+        return run_checks(self.result, [
+            self._check_geometry_count,      # vertex/face counts
+            self._check_manifold,            # manifold property
+            self._check_watertight,          # holes (boundary loops)
+            self._check_orientation,         # solids wound outward
+            self._check_self_intersection,   # faces cutting through each other
+            self._check_dimensions,
+            self._check_vertex_positions,    # no NaN or Inf
+            self._check_numerical_validity
+        ], cancel, critical)
     
     def _check_geometry_count(self):
         """Validate mesh has sufficient geometry"""
         
-        vertex_count = len(self.mesh.vertices)
-        face_count = len(self.mesh.faces)
+        vertex_count = self.stats.vertex_count
+        face_count = self.stats.face_count
         
         passed = vertex_count >= MIN_VERTEX_COUNT and face_count >= MIN_FACE_COUNT
         
@@ -145,26 +300,119 @@ class MeshValidator:
     def _check_manifold(self):
         """Validate mesh is manifold"""
         
-        is_manifold, msg = self.mesh.validate_manifold()
+        stats = self.stats
+        is_manifold = stats.is_manifold
+        bad_edges = stats.bad_edges
+        if is_manifold:
+            msg = "Mesh is manifold"
+        else:
+            msg = (f"Non-manifold edges: {len(bad_edges)} ({stats.open_edges} open, "
+                   f"{len(bad_edges) - stats.open_edges} shared by 3+ faces)")
         
         self.result.add_check(
             "Manifold Topology",
             is_manifold,
             msg
         )
+        
+        if not is_manifold:
+            edges, counts = stats.edges, stats.edge_counts
+            sample = ", ".join(f"{a}-{b} ({c} faces)" for (a, b), c in
+                               zip(edges[bad_edges[:5]].tolist(), counts[bad_edges[:5]].tolist()))
+            self.result.add_warning(f"Non-manifold edges (vertex pairs): {sample}")
+    
+    def _check_watertight(self):
+        """Validate the surface is closed (no holes)"""
+        
+        if self.stats.open_edges == 0:
+            self.result.add_check("Watertight", True, "No boundary loops")
+            return
+        
+        # Open edges chain into holes; report them as loops
+        loops = self.mesh.half_edges().boundary_loops()
+        sizes = ", ".join(str(len(loop)) for loop in loops[:5])
+        self.result.add_check(
+            "Watertight",
+            False,
+            f"{self.stats.open_edges} open edges in {len(loops)} boundary loops"
+        )
+        if loops:
+            self.result.add_warning(f"Open boundary loops: {len(loops)} (edges per loop: {sizes})")
+    
+    def _check_orientation(self):
+        """Validate solids are wound outward (positive signed volume)"""
+        
+        if self.stats.face_count == 0:
+            self.result.add_check("Orientation", True, "No faces")
+            return
+        
+        # Signed volume of each face group (and instance prototype), taken
+        # about the group's own centroid; inside-out solids come out negative
+        solids = [(name, self.stats.positions, self.mesh.indices[self.mesh.group_faces(name)])
+                  for name in self.mesh.groups]
+        solids += [(f"{name} prototype", instances.prototype.positions, instances.prototype.indices)
+                   for name, instances in self.mesh.instances.items()]
+        
+        solids = [solid for solid in solids if len(solid[2])]
+        inverted = []
+        for name, positions, triangles in solids:
+            corners = positions[triangles]
+            corners = corners - corners.reshape(-1, 3).mean(axis=0)
+            volume = np.einsum('fk,fk->f', corners[:, 0], np.cross(corners[:, 1], corners[:, 2])).sum() / 6.0
+            if volume < 0:
+                inverted.append(f"{name} ({volume:.3g} m^3)")
+        
+        if inverted:
+            message = f"Inside-out solids: {', '.join(inverted)}"
+        else:
+            message = f"All {len(solids)} solids face outward"
+        self.result.add_check("Orientation", not inverted, message)
+    
+    def _check_self_intersection(self):
+        """Validate no two faces cut through each other"""
+        
+        if self.stats.face_count == 0:
+            self.result.add_check("Self-Intersection", True, "No faces")
+            return
+        
+        # Boxes of one instanced group (boxes wall mode) overlap at every
+        # junction by design; those face pairs are allowed and not tested
+        face_groups = self.mesh.face_groups
+        instanced = np.array([name in self.mesh.instances for name in self.mesh.groups], dtype=bool)
+        
+        def same_instanced_group(fa: np.ndarray, fb: np.ndarray) -> np.ndarray:
+            ga = face_groups[fa]
+            return (ga == face_groups[fb]) & instanced[ga]
+        
+        # Stage 8 only needs a verdict and a few samples: stop early
+        pairs = TriangleBVH(self.stats.positions, self.mesh.indices).self_intersections(
+            limit=SELF_INTERSECTION_SAMPLES,
+            skip=same_instanced_group if instanced.any() else None
+        )
+        
+        if len(pairs) >= SELF_INTERSECTION_SAMPLES:
+            message = f"At least {len(pairs)} intersecting face pairs (search stopped early)"
+        elif len(pairs):
+            message = f"{len(pairs)} intersecting face pairs"
+        elif instanced.any():
+            names = ", ".join(name for name, flag in zip(self.mesh.groups, instanced) if flag)
+            message = f"No intersecting faces (overlaps between instanced boxes of {names} are allowed)"
+        else:
+            message = "No intersecting faces"
+        self.result.add_check("Self-Intersection", len(pairs) == 0, message)
+        
+        if len(pairs):
+            sample = ", ".join(f"{a}-{b}" for a, b in pairs[:SELF_INTERSECTION_SAMPLES].tolist())
+            self.result.add_warning(f"Intersecting faces: {sample}")
     
     def _check_dimensions(self):
         """Validate mesh dimensions are reasonable"""
         
-        if len(self.mesh.vertices) == 0:
+        if self.stats.vertex_count == 0:
             self.result.add_check("Dimensions", False, "No vertices")
             return
         
-        positions = np.array([v.position for v in self.mesh.vertices])
-        
-        x_range = np.ptp(positions[:, 0])  # peak-to-peak
-        y_range = np.ptp(positions[:, 1])
-        z_range = np.ptp(positions[:, 2])
+        x_range, y_range, z_range = self.stats.extent.tolist()
         
         # Check height (should be at least wall height)
         height_ok = z_range >= MIN_MESH_HEIGHT
@@ -186,19 +434,17 @@ class MeshValidator:
     def _check_vertex_positions(self):
         """Validate all vertices have reasonable positions"""
         
-        positions = np.array([v.position for v in self.mesh.vertices])
-        
         # Check no extreme values
-        has_nan = np.any(np.isnan(positions))
-        has_inf = np.any(np.isinf(positions))
+        has_nan = self.stats.nan_count > 0
+        has_inf = self.stats.inf_count > 0
         
         passed = not (has_nan or has_inf)
         
         msg = ""
         if has_nan:
-            msg += "NaN values found; "
+            msg += f"NaN values found ({self.stats.nan_count} vertices); "
         if has_inf:
-            msg += "Infinity values found; "
+            msg += f"Infinity values found ({self.stats.inf_count} vertices); "
         if not msg:
             msg = "All vertex positions valid"
         
@@ -212,10 +458,12 @@ class MeshValidator:
         """Check for numerical errors"""
         
         # Check normals
-        for i, vertex in enumerate(self.mesh.vertices):
-            if np.any(np.isnan(vertex.normal)) or np.any(np.isinf(vertex.normal)):
-                self.result.add_warning(f"Vertex {i} has invalid normal")
-                break
+        invalid = self.stats.invalid_normals
+        if len(invalid):
+            self.result.add_warning(f"Vertex {invalid[0]} has invalid normal")
+        
+        if self.stats.degenerate_faces:
+            self.result.add_warning(f"{self.stats.degenerate_faces} degenerate faces (zero area)")
         
         self.result.add_check(
             "Numerical Validity",
@@ -233,24 +481,18 @@ class ArchitectureValidator:
         self.explicit_wall_count = wall_count
         self.result = ValidationResult()
     
-    def validate(self) -> ValidationResult:
-        """Execute all architectural validation checks"""
+    def validate(self, cancel: Optional[threading.Event] = None,
+                 critical: FrozenSet[str] = frozenset()) -> ValidationResult:
+        """Execute all architectural validation checks (see run_checks)"""
         
         log.info("[Validator] Validating architectural properties")
         
-        # Check wall count
-        self._check_wall_count()
-        
-        # Check room count
-        self._check_room_count()
-        
-        # Check no room merging
-        self._check_room_separation()
-        
-        # Check graph connectivity
-        self._check_graph_connectivity()
-        
-        return self.result
+        return run_checks(self.result, [
+            self._check_wall_count,
+            self._check_room_count,
+            self._check_room_separation,     # no room merging
+            self._check_graph_connectivity
+        ], cancel, critical)
     
     def _check_wall_count(self):
         """Validate building has multiple walls"""
@@ -297,6 +539,12 @@ class ArchitectureValidator:
             no_overlap,
             msg
         )
+        
+        # Reuse the Stage 4 room adjacency graph (wall thickness between rooms)
+        adjacency = getattr(self.room_set, 'adjacency', None)
+        if adjacency is not None:
+            is_separated, msg = adjacency.check_separation()
+            self.result.add_check("Room Walls", is_separated, msg)
     
     def _check_graph_connectivity(self):
         """Validate wall graph is connected"""
@@ -312,40 +560,43 @@ class ArchitectureValidator:
             is_connected,
             msg
         )
+        
+        # Report which fragments broke connectivity (union-find, no traversal)
+        if not is_connected and hasattr(self.wall_graph, 'fragments'):
+            sizes = [len(f) for f in self.wall_graph.fragments()]
+            self.result.add_warning(
+                f"{len(sizes)} disconnected wall fragments (vertex counts: {sizes[:10]})"
+            )
 
 
 class CutawayValidator:
     """Validate cutaway-specific properties"""
     
-    def __init__(self, mesh):
+    def __init__(self, mesh, stats: Optional[GeometryStats] = None):
         self.mesh = mesh
+        self.stats = stats if stats is not None else GeometryStats(mesh)
         self.result = ValidationResult()
     
-    def validate(self) -> ValidationResult:
-        """Execute cutaway-specific validation"""
+    def validate(self, cancel: Optional[threading.Event] = None,
+                 critical: FrozenSet[str] = frozenset()) -> ValidationResult:
+        """Execute cutaway-specific validation (see run_checks)"""
         
         log.info("[Validator] Validating cutaway properties")
         
-        # Check no roof (max Z should be reasonable)
-        self._check_no_roof()
-        
-        # Check open-top (should be visible from above)
-        self._check_open_top()
-        
-        # Check floor exists
-        self._check_floor_exists()
-        
-        return self.result
+        return run_checks(self.result, [
+            self._check_no_roof,             # max Z should be reasonable
+            self._check_open_top,            # visible from above
+            self._check_floor_exists
+        ], cancel, critical)
     
     def _check_no_roof(self):
         """Ensure there's no closed top"""
         
-        if len(self.mesh.vertices) == 0:
+        if self.stats.vertex_count == 0:
             self.result.add_check("No Roof", False, "No vertices")
             return
         
-        positions = np.array([v.position for v in self.mesh.vertices])
-        max_z = np.max(positions[:, 2])
+        max_z = self.stats.bounds_max[2]
         
         # Roof height check: should not be way above walls (< 3m for 1.3m walls)
         passed = max_z < 3.0
@@ -362,16 +613,13 @@ class CutawayValidator:
         # This is a heuristic: if mesh has floor and walls but reasonable Z range,
         # it's likely open-top
         
-        if len(self.mesh.vertices) < 8:
+        if self.stats.vertex_count < 8:
             self.result.add_check("Open-Top Visibility", False, "Insufficient geometry")
             return
         
-        positions = np.array([v.position for v in self.mesh.vertices])
-        z_values = positions[:, 2]
-        
         # Should have both floor (z<0) and walls (z>0)
-        has_floor = np.any(z_values < 0)
-        has_walls = np.any(z_values > 0)
+        has_floor = self.stats.count_z(high=0.0) > 0
+        has_walls = self.stats.count_z(low=0.0) > 0
         
         passed = has_floor and has_walls
         
@@ -384,18 +632,15 @@ class CutawayValidator:
     def _check_floor_exists(self):
         """Validate floor slab exists"""
         
-        if len(self.mesh.vertices) == 0:
+        if self.stats.vertex_count == 0:
             self.result.add_check("Floor Exists", False, "No vertices")
             return
         
-        positions = np.array([v.position for v in self.mesh.vertices])
-        z_values = positions[:, 2]
-        
         # Should have vertices near z=0 (floor top surface)
-        near_floor = np.any(np.abs(z_values) < 0.5)
+        near_floor = self.stats.count_z(-0.5, 0.5) > 0
         
         # Should have vertices below z=0 (floor bottom)
-        below_floor = np.any(z_values < -0.05)
+        below_floor = self.stats.count_z(high=-0.05) > 0
         
         passed = near_floor and below_floor
         
@@ -413,18 +658,28 @@ class CutawayValidator:
 class ComprehensiveValidator:
     """Execute all validation stages"""
     
-    def __init__(self, mesh, wall_graph, room_set, wall_count: int = None):
+    def __init__(self, mesh, wall_graph, room_set, wall_count: int = None,
+                 critical_checks: Tuple[str, ...] = CRITICAL_CHECKS,
+                 max_workers: Optional[int] = None):
         self.mesh = mesh
         self.wall_graph = wall_graph
         self.room_set = room_set
         self.wall_count = wall_count
+        self.critical_checks = set(critical_checks)
+        self.max_workers = max_workers  # None: one thread per validator
         
         self.all_results: Dict[str, ValidationResult] = {}
+        self.stats: Optional[GeometryStats] = None
     
     def validate_all(self) -> Tuple[bool, ValidationResult]:
         """
         Execute comprehensive validation.
         
+        The validators run in a thread pool; the first failed critical
+        check cancels the checks that have not started. Results are merged
+        in a fixed order (mesh, architecture, cutaway) whatever the
+        completion order.
+        
         Returns:
             (passed, combined_result)
         """
@@ -433,36 +688,34 @@ class ComprehensiveValidator:
         
         combined_result = ValidationResult()
         
-        # Mesh validation
-        mesh_validator = MeshValidator(self.mesh)
-        mesh_result = mesh_validator.validate()
-        self.all_results['mesh'] = mesh_result
-        
-        # Merge results
-        for name, passed, msg in mesh_result.checks:
-            combined_result.add_check(f"Mesh: {name}", passed, msg)
-        for w in mesh_result.warnings:
-            combined_result.add_warning(f"Mesh: {w}")
-        
-        # Architecture validation
-        arch_validator = ArchitectureValidator(self.wall_graph, self.room_set, self.wall_count)
-        arch_result = arch_validator.validate()
-        self.all_results['architecture'] = arch_result
-        
-        for name, passed, msg in arch_result.checks:
-            combined_result.add_check(f"Architecture: {name}", passed, msg)
-        for w in arch_result.warnings:
-            combined_result.add_warning(f"Architecture: {w}")
-        
-        # Cutaway validation
-        cutaway_validator = CutawayValidator(self.mesh)
-        cutaway_result = cutaway_validator.validate()
-        self.all_results['cutaway'] = cutaway_result
-        
-        for name, passed, msg in cutaway_result.checks:
-            combined_result.add_check(f"Cutaway: {name}", passed, msg)
-        for w in cutaway_result.warnings:
-            combined_result.add_warning(f"Cutaway: {w}")
+        # One pass over the mesh arrays, shared by the mesh and cutaway checks
+        start = time.perf_counter()
+        self.stats = GeometryStats(self.mesh)
+        stats_seconds = time.perf_counter() - start
+        
+        validators = [
+            ('mesh', "Mesh: ", MeshValidator(self.mesh, self.stats)),
+            ('architecture', "Architecture: ",
+             ArchitectureValidator(self.wall_graph, self.room_set, self.wall_count)),
+            ('cutaway', "Cutaway: ", CutawayValidator(self.mesh, self.stats))
+        ]
+        
+        cancel = threading.Event()
+        with ThreadPoolExecutor(max_workers=self.max_workers or len(validators)) as pool:
+            futures = []
+            for key, prefix, validator in validators:
+                critical = frozenset(name[len(prefix):] for name in self.critical_checks
+                                     if name.startswith(prefix))
+                futures.append((key, prefix, pool.submit(validator.validate, cancel, critical)))
+            
+            for key, prefix, future in futures:
+                result = future.result()
+                self.all_results[key] = result
+                combined_result.merge(result, prefix)
+        
+        combined_result.timings['Geometry Stats'] = stats_seconds
+        if combined_result.skipped:
+            log.error(f"[Validator] {combined_result.skipped} checks skipped after a critical check failed")
         
         # FAIL FAST: if core checks failed, halt
         if not combined_result.passed:
@@ -478,10 +731,7 @@ class ComprehensiveValidator:
         combined = ValidationResult()
         
         for result in self.all_results.values():
-            for name, passed, msg in result.checks:
-                combined.add_check(name, passed, msg)
-            for w in result.warnings:
-                combined.add_warning(w)
+            combined.merge(result)
         
         return combined.summary()
 
@@ -18,15 +18,37 @@ GLB Format:
 - Supports PBR materials
 
 Export includes:
-- Mesh geometry (vertices, faces, normals)
+- Mesh geometry (vertices, faces, normals), one primitive per face group
 - Material definitions (colors per specification)
 - Metadata (scale factor, dimensions)
+
+Instanced export (instancing=True): face groups that Stage 6 describes as
+copies of one prototype (box walls) are written once with per-instance
+TRANSLATION/ROTATION/SCALE accessors (EXT_mesh_gpu_instancing). Scene 1
+repeats them as plain per-instance nodes for viewers without the extension.
+
+Levels of detail (lods=[...] from Stage 6 build_lod_chain): the root node
+lists the coarser meshes' nodes with MSFT_lod, and extras carry the
+MSFT_screencoverage thresholds.
+
+Quantized export (quantize=True, KHR_mesh_quantization, required):
+positions are normalized SHORT relative to each vertex set's bounding box
+(uniform scale, so normals need no correction), dequantized by the node's
+translation/scale, or folded into the per-instance transforms of instanced
+groups; normals are normalized BYTE; indices are UNSIGNED_SHORT when the
+vertex set has fewer than 65536 vertices. Attributes are padded to 4-byte
+strides as glTF requires.
+
+Writing: buffer views keep references to the arrays (no byte copies); the
+file layout (offsets, padding, chunk lengths) is computed up front and the
+header, JSON chunk and every array are streamed to the file or to an
+in-memory stream (io.BytesIO for HTTP responses) through memoryviews.
 """
 
 import json
 import struct
 import numpy as np
-from typing import Optional, Dict, Tuple, List
+from typing import Optional, Dict, Tuple, List, Union, BinaryIO, Iterator
 import logging
 import os
 
@@ -44,10 +66,24 @@ GLTF_VERSION = 2
 ARRAY_BUFFER = 34962
 ELEMENT_ARRAY_BUFFER = 34963
 
+# Extensions
+EXT_INSTANCING = 'EXT_mesh_gpu_instancing'
+EXT_LOD = 'MSFT_lod'
+KHR_QUANTIZATION = 'KHR_mesh_quantization'
+
+# Chunk types
+CHUNK_JSON = 0x4E4F534A  # "JSON"
+CHUNK_BIN = 0x004E4942   # "BIN\x00"
+
 # Component types
 FLOAT = 5126
 UNSIGNED_INT = 5125
 UNSIGNED_SHORT = 5123
+SHORT = 5122
+BYTE = 5120
+
+SHORT_MAX = 32767  # normalized SHORT: value / 32767
+BYTE_MAX = 127     # normalized BYTE: value / 127
 
 # Material colors (per architectural specification)
 COLORS = {
@@ -71,7 +107,9 @@ class GLTFAccessor:
                  count: int,
                  type_str: str,
                  min_values: Optional[List[float]] = None,
-                 max_values: Optional[List[float]] = None):
+                 max_values: Optional[List[float]] = None,
+                 byte_offset: int = 0,
+                 normalized: bool = False):
         """
         Args:
             buffer_view_idx: index into bufferViews array
@@ -80,13 +118,17 @@ class GLTFAccessor:
             type_str: "SCALAR", "VEC2", "VEC3", "MAT4", etc.
             min_values: per-component minimum values
             max_values: per-component maximum values
+            byte_offset: start of the data within the buffer view
+            normalized: integer components map to [-1, 1] / [0, 1]
         """
         self.bufferView = buffer_view_idx
+        self.byteOffset = byte_offset
         self.componentType = component_type
         self.count = count
         self.type = type_str
         self.min = min_values
         self.max = max_values
+        self.normalized = normalized
     
     def to_dict(self) -> Dict:
         """Convert to GLTF JSON"""
@@ -96,6 +138,10 @@ class GLTFAccessor:
             'count': self.count,
             'type': self.type
         }
+        if self.byteOffset:
+            d['byteOffset'] = self.byteOffset
+        if self.normalized:
+            d['normalized'] = True
         if self.min is not None:
             d['min'] = self.min
         if self.max is not None:
@@ -110,7 +156,7 @@ class GLTFBufferView:
                  buffer_idx: int,
                  byte_offset: int,
                  byte_length: int,
-                 target: int = ARRAY_BUFFER,
+                 target: Optional[int] = ARRAY_BUFFER,
                  byte_stride: Optional[int] = None):
         self.buffer = buffer_idx
         self.byteOffset = byte_offset
@@ -122,9 +168,10 @@ class GLTFBufferView:
         d = {
             'buffer': self.buffer,
             'byteOffset': self.byteOffset,
-            'byteLength': self.byteLength,
-            'target': self.target
+            'byteLength': self.byteLength
         }
+        if self.target is not None:
+            d['target'] = self.target
         if self.byteStride is not None:
             d['byteStride'] = self.byteStride
         return d
@@ -160,13 +207,15 @@ class GLTFPrimitive:
                  indices_accessor_idx: int,
                  position_accessor_idx: int,
                  normal_accessor_idx: int,
-                 material_idx: Optional[int] = None):
+                 material_idx: Optional[int] = None,
+                 extras: Optional[Dict] = None):
         self.attributes = {
             'POSITION': position_accessor_idx,
             'NORMAL': normal_accessor_idx
         }
         self.indices = indices_accessor_idx
         self.material = material_idx
+        self.extras = extras
         self.mode = 4  # TRIANGLES
     
     def to_dict(self) -> Dict:
@@ -177,6 +226,8 @@ class GLTFPrimitive:
         }
         if self.material is not None:
             d['material'] = self.material
+        if self.extras:
+            d['extras'] = self.extras
         return d
 
 
@@ -197,17 +248,75 @@ class GLTFMesh:
 class GLTFNode:
     """Represents a GLTF node"""
     
-    def __init__(self, name: str, mesh_idx: Optional[int] = None):
+    def __init__(self, name: Optional[str], mesh_idx: Optional[int] = None,
+                 children: Optional[List[int]] = None,
+                 translation: Optional[List[float]] = None,
+                 rotation: Optional[List[float]] = None,
+                 scale: Optional[List[float]] = None,
+                 extensions: Optional[Dict] = None,
+                 extras: Optional[Dict] = None):
         self.name = name
         self.mesh = mesh_idx
+        self.children = children
+        self.translation = translation
+        self.rotation = rotation
+        self.scale = scale
+        self.extensions = extensions
+        self.extras = extras
     
     def to_dict(self) -> Dict:
-        d = {'name': self.name}
+        d = {'name': self.name} if self.name else {}
         if self.mesh is not None:
             d['mesh'] = self.mesh
+        for key in ('children', 'translation', 'rotation', 'scale', 'extensions', 'extras'):
+            value = getattr(self, key)
+            if value:
+                d[key] = value
         return d
 
 
+# ============================================================================
+# QUANTIZATION (KHR_mesh_quantization)
+# ============================================================================
+
+def quantize_positions(positions: np.ndarray) -> Tuple[np.ndarray, List[float], float]:
+    """
+    Positions as normalized SHORT around their bounding box center.
+    
+    One scale for all axes keeps the dequantizing node transform uniform,
+    so vertex normals stay valid.
+    
+    Returns:
+        (quantized, translation, scale): (N, 4) int16 (4th component is
+        stride padding); position = quantized / 32767 * scale + translation
+    """
+    
+    positions = np.asarray(positions, dtype=np.float64)
+    lo, hi = positions.min(axis=0), positions.max(axis=0)
+    center = 0.5 * (lo + hi)
+    scale = float(np.max(hi - lo)) * 0.5 or 1.0
+    
+    quantized = np.zeros((len(positions), 4), dtype=np.int16)
+    quantized[:, :3] = np.clip(np.rint((positions - center) * (SHORT_MAX / scale)), -SHORT_MAX, SHORT_MAX)
+    return quantized, center.tolist(), scale
+
+
+def quantize_normals(normals: np.ndarray) -> np.ndarray:
+    """Unit normals as (N, 4) normalized BYTE (4th component is padding)"""
+    
+    quantized = np.zeros((len(normals), 4), dtype=np.int8)
+    quantized[:, :3] = np.clip(np.rint(np.asarray(normals, dtype=np.float64) * BYTE_MAX), -BYTE_MAX, BYTE_MAX)
+    return quantized
+
+
+def _rotate(quaternions: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+    """Rotate (K, 3) vectors by (K, 4) unit quaternions (x, y, z, w)"""
+    
+    q, w = quaternions[:, :3], quaternions[:, 3:4]
+    t = 2.0 * np.cross(q, vectors)
+    return vectors + w * t + np.cross(q, t)
+
+
 # ============================================================================
 # GLB EXPORTER
 # ============================================================================
@@ -215,36 +324,61 @@ class GLTFNode:
 class GLBExporter:
     """Export 3D mesh to GLB format"""
     
-    def __init__(self, mesh, metadata: Optional[Dict] = None):
+    def __init__(self, mesh, metadata: Optional[Dict] = None,
+                 instancing: bool = False, instancing_fallback: bool = True,
+                 lods: Optional[List] = None,
+                 lod_coverage: Optional[List[float]] = None,
+                 quantize: bool = False):
         """
         Args:
             mesh: Mesh object from stage 6/7
             metadata: optional metadata dict
+            instancing: write instanced face groups with
+                        EXT_mesh_gpu_instancing
+            instancing_fallback: also write scene 1, placing the prototypes
+                                 with one plain node per instance
+            lods: optional coarser meshes, finest first (MSFT_lod)
+            lod_coverage: screen coverage threshold per level, mesh first
+                          (len(lods) + 1 values)
+            quantize: write SHORT positions, BYTE normals and 16-bit
+                      indices where possible (KHR_mesh_quantization)
         """
         self.mesh = mesh
         self.metadata = metadata or {}
-        
-        # GLTF structure
-        self.buffer_data = bytearray()
+        self.instancing = instancing
+        self.instancing_fallback = instancing_fallback
+        self.lods = list(lods or [])
+        self.lod_coverage = lod_coverage
+        self.quantize = quantize
+        
+        # GLTF structure; the binary buffer is a list of (padding, array)
+        # segments written in order
+        self.buffer_segments: List[Tuple[int, np.ndarray]] = []
+        self.buffer_length = 0
         self.buffer_views: List[GLTFBufferView] = []
         self.accessors: List[GLTFAccessor] = []
         self.materials: List[GLTFMaterial] = []
         self.primitives: List[GLTFPrimitive] = []
         self.meshes: List[GLTFMesh] = []
         self.nodes: List[GLTFNode] = []
+        self.scenes: List[Dict] = []
+        self.extensions_used: List[str] = []
+        self.extensions_required: List[str] = []
     
-    def export(self, output_path: str) -> bool:
+    def export(self, output_path: Union[str, BinaryIO]) -> bool:
         """
         Export mesh to GLB file.
         
         Args:
-            output_path: path to output .glb file
+            output_path: path to output .glb file, or a writable binary
+                         stream (e.g. io.BytesIO)
         
         Returns:
             success
         """
         
-        log.info(f"[GLBExporter] Exporting to {output_path}")
+        target = output_path if isinstance(output_path, str) else type(output_path).__name__
+        log.info(f"[GLBExporter] Exporting to {target}")
         
         try:
             # Step 1: Prepare materials
@@ -260,7 +394,7 @@ class GLBExporter:
             success = self._write_glb_file(output_path, gltf_dict)
             
             if success:
-                log.info(f"[GLBExporter] ✓ Export complete: {output_path}")
+                log.info(f"[GLBExporter] ✓ Export complete: {target}")
             else:
                 log.error("[GLBExporter] Export failed")
             
@@ -288,110 +422,315 @@ class GLBExporter:
         
         log.info("[GLBExporter] Preparing geometry")
         
-        if not self.mesh.vertices or not self.mesh.faces:
+        if not len(self.mesh.vertices) or not len(self.mesh.faces):
             log.error("[GLBExporter] Mesh has no geometry")
             return
         
-        # Extract positions (VEC3 floats)
-        positions = np.array([v.position for v in self.mesh.vertices], dtype=np.float32)
-        
-        # Extract normals (VEC3 floats)
-        normals = np.array([v.normal for v in self.mesh.vertices], dtype=np.float32)
-        
-        # Extract indices (UNSIGNED_INT)
-        indices_list = []
-        for face in self.mesh.faces:
-            indices_list.extend(face.vertex_indices)
-        indices = np.array(indices_list, dtype=np.uint32)
-        
-        # Add position data to buffer
-        pos_byte_offset = len(self.buffer_data)
-        pos_bytes = positions.tobytes()
-        self.buffer_data.extend(pos_bytes)
-        
-        pos_accessor = GLTFAccessor(
-            buffer_view_idx=len(self.buffer_views),
-            component_type=FLOAT,
-            count=len(positions),
-            type_str="VEC3",
-            min_values=positions.min(axis=0).tolist(),
-            max_values=positions.max(axis=0).tolist()
-        )
-        self.accessors.append(pos_accessor)
-        
-        pos_buffer_view = GLTFBufferView(
-            buffer_idx=0,
-            byte_offset=pos_byte_offset,
-            byte_length=len(pos_bytes),
-            target=ARRAY_BUFFER
-        )
-        self.buffer_views.append(pos_buffer_view)
-        
-        # Add normal data to buffer
-        norm_byte_offset = len(self.buffer_data)
-        norm_bytes = normals.tobytes()
-        self.buffer_data.extend(norm_bytes)
-        
-        norm_accessor = GLTFAccessor(
-            buffer_view_idx=len(self.buffer_views),
-            component_type=FLOAT,
-            count=len(normals),
-            type_str="VEC3"
-        )
-        self.accessors.append(norm_accessor)
-        
-        norm_buffer_view = GLTFBufferView(
-            buffer_idx=0,
-            byte_offset=norm_byte_offset,
-            byte_length=len(norm_bytes),
-            target=ARRAY_BUFFER
-        )
-        self.buffer_views.append(norm_buffer_view)
-        
-        # Add index data to buffer
-        idx_byte_offset = len(self.buffer_data)
-        idx_bytes = indices.tobytes()
-        self.buffer_data.extend(idx_bytes)
-        
-        idx_accessor = GLTFAccessor(
-            buffer_view_idx=len(self.buffer_views),
-            component_type=UNSIGNED_INT,
-            count=len(indices),
-            type_str="SCALAR"
-        )
-        self.accessors.append(idx_accessor)
-        
-        idx_buffer_view = GLTFBufferView(
-            buffer_idx=0,
-            byte_offset=idx_byte_offset,
-            byte_length=len(idx_bytes),
-            target=ELEMENT_ARRAY_BUFFER
-        )
-        self.buffer_views.append(idx_buffer_view)
-        
-        # Create primitive
-        # Use first material by default
-        primitive = GLTFPrimitive(
-            indices_accessor_idx=len(self.accessors) - 1,
-            position_accessor_idx=0,
-            normal_accessor_idx=1,
-            material_idx=0 if len(self.materials) > 0 else None
-        )
-        self.primitives.append(primitive)
-        
-        # Create mesh
-        mesh_obj = GLTFMesh(
-            name=self.mesh.name or "mesh",
-            primitives=[primitive]
-        )
-        self.meshes.append(mesh_obj)
-        
-        # Create node
-        node = GLTFNode(name="root", mesh_idx=0)
-        self.nodes.append(node)
+        # Mesh arrays are already in glTF layout: positions and normals as
+        # VEC3 floats, indices as UNSIGNED_INT
+        positions, normals = self.mesh.positions, self.mesh.normals
+        indices, face_groups = self.mesh.indices, self.mesh.face_groups
+        
+        instanced = []
+        if self.instancing:
+            instances = getattr(self.mesh, 'instances', {})
+            instanced = [g for g in self.mesh.groups if len(instances.get(g, ()))]
+            if not instanced:
+                log.info("[GLBExporter] No instanced face groups, writing merged geometry")
+        
+        if instanced:
+            # Leave instanced groups (and vertices only they use) out of
+            # the merged mesh
+            keep = ~np.isin(face_groups, [self.mesh.groups.index(g) for g in instanced])
+            indices, face_groups = indices[keep], face_groups[keep]
+            used = np.unique(indices)
+            remap = np.zeros(len(positions), dtype=np.uint32)
+            remap[used] = np.arange(len(used), dtype=np.uint32)
+            positions, normals, indices = positions[used], normals[used], remap[indices]
+        
+        if self.quantize:
+            self.extensions_used.append(KHR_QUANTIZATION)
+            self.extensions_required.append(KHR_QUANTIZATION)
+        
+        root_nodes = []
+        primitives, (translation, scale) = self._add_primitives(positions, normals, indices,
+                                                                face_groups, self.mesh.groups)
+        if primitives:
+            # Create mesh and its node
+            self.meshes.append(GLTFMesh(name=self.mesh.name or "mesh", primitives=primitives))
+            self.nodes.append(GLTFNode(name="root", mesh_idx=len(self.meshes) - 1,
+                                       translation=translation, scale=scale))
+            root_nodes.append(len(self.nodes) - 1)
+        
+        if self.lods and primitives:
+            if instanced:
+                log.warning("[GLBExporter] Levels of detail are not combined with instancing, skipping them")
+            else:
+                self._add_lods(self.nodes[root_nodes[0]])
+        
+        self.scenes.append({'nodes': list(root_nodes)})
+        if instanced:
+            fallback_nodes = list(root_nodes)
+            for group in instanced:
+                node, fallback = self._add_instanced_group(group, self.mesh.instances[group])
+                self.scenes[0]['nodes'].append(node)
+                fallback_nodes.append(fallback)
+            
+            if self.instancing_fallback:
+                self.scenes[0]['extras'] = {'fallback_scene': 1}
+                self.scenes.append({'name': 'de-instanced fallback', 'nodes': fallback_nodes})
+            self.extensions_used.append(EXT_INSTANCING)
         
         log.info(f"[GLBExporter] Prepared {len(positions)} vertices, "
-                f"{len(indices)} indices")
+                f"{3 * len(indices)} indices in {len(self.primitives)} primitives")
+    
+    def _add_lods(self, root: GLTFNode):
+        """
+        Write the coarser levels as nodes outside the scene and link them
+        from the root node (MSFT_lod, MSFT_screencoverage)
+        """
+        
+        # A level that is empty or not coarser than the previous written
+        # one is skipped; the previous level takes over its threshold
+        coverage = list(self.lod_coverage) if self.lod_coverage is not None else None
+        kept_coverage = coverage[:1] if coverage else []
+        ids, faces = [], [self.mesh.face_count]
+        for level, lod in enumerate(self.lods, start=1):
+            threshold = coverage[level] if coverage and level < len(coverage) else None
+            primitives = None
+            if lod.face_count < faces[-1]:
+                primitives, (translation, scale) = self._add_primitives(lod.positions, lod.normals, lod.indices,
+                                                                        lod.face_groups, lod.groups)
+            if not primitives:
+                log.info(f"[GLBExporter] Skipping level {level}: {lod.face_count} faces, "
+                         f"previous level has {faces[-1]}")
+                if threshold is not None and kept_coverage:
+                    kept_coverage[-1] = threshold
+                continue
+            self.meshes.append(GLTFMesh(name=lod.name or f"lod{level}", primitives=primitives))
+            self.nodes.append(GLTFNode(name=f"{root.name}_lod{level}", mesh_idx=len(self.meshes) - 1,
+                                       translation=translation, scale=scale))
+            ids.append(len(self.nodes) - 1)
+            faces.append(lod.face_count)
+            if threshold is not None:
+                kept_coverage.append(threshold)
+        
+        if not ids:
+            return
+        
+        root.extensions = {EXT_LOD: {'ids': ids}}
+        if coverage is not None:
+            root.extras = {'MSFT_screencoverage': [float(c) for c in kept_coverage]}
+        self.extensions_used.append(EXT_LOD)
+        
+        log.info(f"[GLBExporter] Levels of detail: {len(ids) + 1}, faces per level: "
+                 + ", ".join(str(f) for f in faces))
+    
+    def _append_buffer_view(self, array: np.ndarray, target: Optional[int],
+                            byte_stride: Optional[int] = None) -> int:
+        """
+        Add an array (4-byte aligned) as a new buffer view.
+        
+        Only a reference is kept (contiguous mesh arrays are not copied);
+        the array must not change before the file is written.
+        """
+        
+        array = np.ascontiguousarray(array)
+        padding = -self.buffer_length % 4
+        self.buffer_views.append(GLTFBufferView(
+            buffer_idx=0,
+            byte_offset=self.buffer_length + padding,
+            byte_length=array.nbytes,
+            target=target,
+            byte_stride=byte_stride
+        ))
+        self.buffer_segments.append((padding, array))
+        self.buffer_length += padding + array.nbytes
+        return len(self.buffer_views) - 1
+    
+    def _add_primitives(self, positions: np.ndarray, normals: np.ndarray,
+                        indices: np.ndarray, face_groups: np.ndarray,
+                        groups: List[str]) -> Tuple[List[GLTFPrimitive], Tuple]:
+        """
+        Write one vertex set and one primitive per non-empty face group.
+        
+        Args:
+            positions: (N, 3) vertex positions
+            normals: (N, 3) vertex normals
+            indices: (M, 3) triangles
+            face_groups: (M,) group of each face (indexes groups)
+            groups: group names
+        
+        Returns:
+            (primitives, (translation, scale)): the new primitives and the
+            node transform that dequantizes their positions ((None, None)
+            unless quantizing)
+        """
+        
+        if len(indices) == 0:
+            return [], (None, None)
+        
+        # Add position and normal data to buffer
+        dequantize = (None, None)
+        if self.quantize:
+            quantized, translation, scale = quantize_positions(positions)
+            dequantize = (translation, [scale] * 3)
+            self.accessors.append(GLTFAccessor(
+                buffer_view_idx=self._append_buffer_view(quantized, ARRAY_BUFFER, byte_stride=8),
+                component_type=SHORT,
+                count=len(quantized),
+                type_str="VEC3",
+                min_values=quantized[:, :3].min(axis=0).tolist(),
+                max_values=quantized[:, :3].max(axis=0).tolist(),
+                normalized=True
+            ))
+        else:
+            positions = np.ascontiguousarray(positions, dtype=np.float32)
+            self.accessors.append(GLTFAccessor(
+                buffer_view_idx=self._append_buffer_view(positions, ARRAY_BUFFER),
+                component_type=FLOAT,
+                count=len(positions),
+                type_str="VEC3",
+                min_values=positions.min(axis=0).tolist(),
+                max_values=positions.max(axis=0).tolist()
+            ))
+        pos_accessor = len(self.accessors) - 1
+        
+        if self.quantize:
+            self.accessors.append(GLTFAccessor(
+                buffer_view_idx=self._append_buffer_view(quantize_normals(normals), ARRAY_BUFFER,
+                                                         byte_stride=4),
+                component_type=BYTE,
+                count=len(normals),
+                type_str="VEC3",
+                normalized=True
+            ))
+        else:
+            self.accessors.append(GLTFAccessor(
+                buffer_view_idx=self._append_buffer_view(np.asarray(normals, dtype=np.float32), ARRAY_BUFFER),
+                component_type=FLOAT,
+                count=len(normals),
+                type_str="VEC3"
+            ))
+        norm_accessor = len(self.accessors) - 1
+        
+        # Faces ordered by group: one index buffer view, sliced into one
+        # primitive per group (walls, each room floor) that viewers can
+        # hide or highlight on their own
+        short_indices = self.quantize and len(positions) < 65536
+        index_type = np.uint16 if short_indices else np.uint32
+        order = np.argsort(face_groups, kind='stable')
+        ordered = np.ascontiguousarray(indices[order], dtype=index_type).ravel()
+        group_sizes = np.bincount(face_groups, minlength=len(groups))
+        idx_view = self._append_buffer_view(ordered, ELEMENT_ARRAY_BUFFER)
+        
+        primitives = []
+        first_face = 0
+        for group, size in zip(groups, group_sizes.tolist()):
+            if size == 0:
+                continue
+            
+            idx_accessor = GLTFAccessor(
+                buffer_view_idx=idx_view,
+                component_type=UNSIGNED_SHORT if short_indices else UNSIGNED_INT,
+                count=3 * size,
+                type_str="SCALAR",
+                byte_offset=3 * first_face * ordered.itemsize
+            )
+            self.accessors.append(idx_accessor)
+            first_face += size
+            
+            extras = {'group': group}
+            if group.startswith('room_'):
+                extras['room_id'] = int(group[len('room_'):])
+            
+            primitive = GLTFPrimitive(
+                indices_accessor_idx=len(self.accessors) - 1,
+                position_accessor_idx=pos_accessor,
+                normal_accessor_idx=norm_accessor,
+                material_idx=self._material_index(group),
+                extras=extras
+            )
+            primitives.append(primitive)
+        
+        self.primitives.extend(primitives)
+        return primitives, dequantize
+    
+    def _add_instanced_group(self, group: str, instances) -> Tuple[int, int]:
+        """
+        Write a face group as one prototype mesh drawn once per instance.
+        
+        Args:
+            group: face group name
+            instances: InstanceSet from Stage 6
+        
+        Returns:
+            (instanced_node, fallback_node) node indices; the fallback node
+            holds one plain child node per instance (None when the
+            fallback is disabled)
+        """
+        
+        prototype = instances.prototype
+        primitives, (offset, scale) = self._add_primitives(
+            prototype.positions, prototype.normals, prototype.indices,
+            np.zeros(prototype.face_count, dtype=np.int64), [group])
+        primitives[0].extras['instances'] = len(instances)
+        self.meshes.append(GLTFMesh(name=group, primitives=primitives))
+        mesh_idx = len(self.meshes) - 1
+        
+        translation = np.asarray(instances.translation, dtype=np.float64)
+        rotation = np.asarray(instances.rotation, dtype=np.float64)
+        scales = np.asarray(instances.scale, dtype=np.float64)
+        if scale is not None:
+            # Instance transforms apply after the prototype's vertices, so
+            # the dequantization folds into them: T R S (s q + t) is
+            # (T + R S t) R (S s) q
+            translation = translation + _rotate(rotation, scales * np.asarray(offset))
+            scales = scales * scale[0]
+        
+        # Per-instance TRS accessors (not vertex attributes: no target)
+        attributes = {}
+        for name, values, type_str in (('TRANSLATION', translation, "VEC3"),
+                                       ('ROTATION', rotation, "VEC4"),
+                                       ('SCALE', scales, "VEC3")):
+            self.accessors.append(GLTFAccessor(
+                buffer_view_idx=self._append_buffer_view(values.astype(np.float32), None),
+                component_type=FLOAT,
+                count=len(values),
+                type_str=type_str
+            ))
+            attributes[name] = len(self.accessors) - 1
+        
+        self.nodes.append(GLTFNode(name=group, mesh_idx=mesh_idx,
+                                   extensions={EXT_INSTANCING: {'attributes': attributes}}))
+        instanced_node = len(self.nodes) - 1
+        
+        log.info(f"[GLBExporter] Instanced '{group}': {len(instances)} instances of "
+                 f"{prototype.face_count} faces")
+        
+        if not self.instancing_fallback:
+            return instanced_node, None
+        
+        # Fallback: the same prototype placed by plain node transforms
+        # (unnamed, rounded to micrometers to keep the JSON small)
+        first_child = len(self.nodes)
+        trs = [np.round(values, 6).tolist() for values in (translation, rotation, scales)]
+        for t, r, sc in zip(*trs):
+            self.nodes.append(GLTFNode(name=None, mesh_idx=mesh_idx,
+                                       translation=t, rotation=r, scale=sc))
+        self.nodes.append(GLTFNode(name=f"{group}_fallback",
+                                   children=list(range(first_child, len(self.nodes)))))
+        
+        return instanced_node, len(self.nodes) - 1
+    
+    def _material_index(self, group: str) -> Optional[int]:
+        """Material of a face group: Floor for floor/room slabs, Wall otherwise"""
+        
+        if not self.materials:
+            return None
+        if group == 'floor' or group.startswith('room_'):
+            return 1
+        return 0
     
     def _build_gltf_dict(self) -> Dict:
         """Build GLTF JSON structure"""
@@ -404,9 +743,7 @@ class GLBExporter:
                 'generator': 'Skematix Blueprint-to-3D Pipeline'
             },
             'scene': 0,
-            'scenes': [
-                {'nodes': [0]}
-            ],
+            'scenes': self.scenes or [{'nodes': []}],
             'nodes': [n.to_dict() for n in self.nodes],
             'meshes': [m.to_dict() for m in self.meshes],
             'materials': [m.to_dict() for m in self.materials],
@@ -414,11 +751,16 @@ class GLBExporter:
             'bufferViews': [bv.to_dict() for bv in self.buffer_views],
             'buffers': [
                 {
-                    'byteLength': len(self.buffer_data)
+                    'byteLength': self.buffer_length
                 }
             ]
         }
         
+        if self.extensions_used:
+            gltf['extensionsUsed'] = list(self.extensions_used)
+        if self.extensions_required:
+            gltf['extensionsRequired'] = list(self.extensions_required)
+        
         # Add metadata extensions if available
         if self.metadata:
             gltf['extensions'] = {
@@ -427,53 +769,54 @@ class GLBExporter:
         
         return gltf
     
-    def _write_glb_file(self, output_path: str, gltf_dict: Dict) -> bool:
-        """Write GLB file to disk"""
-        
-        log.info("[GLBExporter] Writing GLB file")
-        
-        # Convert GLTF to JSON
-        gltf_json = json.dumps(gltf_dict)
-        gltf_json_bytes = gltf_json.encode('utf-8')
-        
-        # Pad JSON to 4-byte boundary
-        json_padding = (4 - (len(gltf_json_bytes) % 4)) % 4
-        gltf_json_bytes += b'\x20' * json_padding
-        
-        # Create file chunks
-        # JSON chunk
-        json_chunk_type = 0x4E4F534A  # "JSON"
-        json_chunk_data = gltf_json_bytes
-        json_chunk = struct.pack('<II', len(json_chunk_data), json_chunk_type) + json_chunk_data
-        
-        # Binary chunk (geometry)
-        bin_chunk_type = 0x004E4942  # "BIN\x00"
-        bin_chunk_data = bytes(self.buffer_data)
+    def _glb_parts(self, gltf_dict: Dict) -> Tuple[int, Iterator]:
+        """
+        Layout of the GLB file and a generator over its parts.
         
-        # Pad binary to 4-byte boundary
-        bin_padding = (4 - (len(bin_chunk_data) % 4)) % 4
-        bin_chunk_data += b'\x00' * bin_padding
+        Returns:
+            (file_size, parts): parts yields bytes/memoryviews in file
+            order (header, JSON chunk, BIN chunk header, each array with
+            its alignment padding, final padding)
+        """
         
-        bin_chunk = struct.pack('<II', len(bin_chunk_data), bin_chunk_type) + bin_chunk_data
+        # JSON chunk, padded with spaces to a 4-byte boundary
+        gltf_json = json.dumps(gltf_dict, separators=(',', ':')).encode('utf-8')
+        json_length = len(gltf_json) + (-len(gltf_json) % 4)
+        
+        # Binary chunk (geometry), padded with zeros
+        bin_length = self.buffer_length + (-self.buffer_length % 4)
+        
+        file_size = 12 + 8 + json_length + 8 + bin_length
+        
+        def parts():
+            yield struct.pack('<III', GLTF_MAGIC, GLTF_VERSION, file_size)
+            yield struct.pack('<II', json_length, CHUNK_JSON)
+            yield gltf_json
+            yield b'\x20' * (json_length - len(gltf_json))
+            yield struct.pack('<II', bin_length, CHUNK_BIN)
+            for padding, array in self.buffer_segments:
+                if padding:
+                    yield b'\x00' * padding
+                if array.nbytes:
+                    yield memoryview(array.reshape(-1).view(np.uint8))
+            yield b'\x00' * (bin_length - self.buffer_length)
+        
+        return file_size, parts()
+    
+    def _write_glb_file(self, output_path: Union[str, BinaryIO], gltf_dict: Dict) -> bool:
+        """Stream the GLB to a file path or a writable binary stream"""
         
-        # GLB header
-        file_size = 12 + len(json_chunk) + len(bin_chunk)
+        log.info("[GLBExporter] Writing GLB file")
         
-        glb_header = struct.pack(
-            '<III',
-            GLTF_MAGIC,
-            GLTF_VERSION,
-            file_size
-        )
+        file_size, parts = self._glb_parts(gltf_dict)
         
-        # Write file
         try:
-            os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
-            
-            with open(output_path, 'wb') as f:
-                f.write(glb_header)
-                f.write(json_chunk)
-                f.write(bin_chunk)
+            if isinstance(output_path, str):
+                os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+                with open(output_path, 'wb') as f:
+                    f.writelines(parts)
+            else:
+                output_path.writelines(parts)
             
             log.info(f"[GLBExporter] Wrote {file_size} bytes")
             return True
@@ -487,7 +830,10 @@ class GLBExporter:
 # STAGE 9 MAIN FUNCTION
 # ============================================================================
 
-def stage9_export(mesh, output_path: str, metadata: Optional[Dict] = None) -> Tuple[bool, str]:
+def stage9_export(mesh, output_path: str, metadata: Optional[Dict] = None,
+                  instancing: bool = False, lods: Optional[List] = None,
+                  lod_coverage: Optional[List[float]] = None,
+                  quantize: bool = False) -> Tuple[bool, str]:
     """
     Execute Stage 9: Export to GLB
     
@@ -495,6 +841,11 @@ def stage9_export(mesh, output_path: str, metadata: Optional[Dict] = None) -> Tu
         mesh: 3D mesh from Stage 8
         output_path: path to output GLB file
         metadata: optional metadata dict
+        instancing: write instanced face groups (box walls) with
+                    EXT_mesh_gpu_instancing
+        lods: optional coarser meshes, finest first (MSFT_lod)
+        lod_coverage: screen coverage threshold per level
+        quantize: quantized attributes (KHR_mesh_quantization)
     
     Returns:
         (success, message_or_path)
@@ -503,7 +854,8 @@ def stage9_export(mesh, output_path: str, metadata: Optional[Dict] = None) -> Tu
     log.info("[Stage9] Starting GLB export")
     
     try:
-        exporter = GLBExporter(mesh, metadata)
+        exporter = GLBExporter(mesh, metadata, instancing=instancing,
+                               lods=lods, lod_coverage=lod_coverage, quantize=quantize)
         success = exporter.export(output_path)
         
         if success:
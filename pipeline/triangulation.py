@@ -0,0 +1,314 @@
+"""
+TRIANGULATION MODULE
+Ear-clipping triangulation of polygons with holes
+
+Purpose: Turn room outlines (outer ring plus hole rings) into triangles
+for floor geometry.
+
+Method:
+- Holes are bridged into the outer ring (rightmost hole vertex to the
+  nearest visible ring vertex to its right), giving one weakly simple ring
+- The ring is ear-clipped; an ear is a convex corner whose triangle holds
+  no other ring vertex
+- Hole-free strictly convex rings skip ear clipping: triangulate_polygons
+  fans all of them at once with array arithmetic
+
+Triangles index into the concatenated input rings (outer, then holes in
+order) and are counter-clockwise whatever the input orientation.
+
+Used by: Stage 6 (room floors).
+"""
+
+import numpy as np
+from typing import List, Sequence, Tuple
+import logging
+
+log = logging.getLogger(__name__)
+
+Polygon = Tuple[np.ndarray, Sequence[np.ndarray]]  # (outer ring, hole rings)
+
+# ============================================================================
+# RING HELPERS
+# ============================================================================
+
+def ring_area(ring: np.ndarray) -> float:
+    """Signed shoelace area (positive for counter-clockwise rings)"""
+    x, y = ring[:, 0], ring[:, 1]
+    return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y))
+
+
+def _cross(ax, ay, bx, by, cx, cy) -> float:
+    """Twice the signed area of triangle (a, b, c)"""
+    return (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+
+
+def _segments_cross(p: np.ndarray, q: np.ndarray,
+                    a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Whether segment p-q properly crosses each segment a[i]-b[i]"""
+
+    def orient(u, v, w):
+        return (v[..., 0] - u[..., 0]) * (w[..., 1] - u[..., 1]) - \
+               (v[..., 1] - u[..., 1]) * (w[..., 0] - u[..., 0])
+
+    d1, d2 = orient(a, b, p), orient(a, b, q)
+    d3, d4 = orient(p, q, a), orient(p, q, b)
+    return (d1 * d2 < 0) & (d3 * d4 < 0)
+
+
+def _touches_segment(p: np.ndarray, q: np.ndarray, vertices: np.ndarray) -> np.ndarray:
+    """Whether any vertex lies on the open segment p-q, for each end q in (Q, 2)"""
+
+    d = q - p                                      # (Q, 2)
+    rel = vertices[None, :, :] - p                 # (1, V, 2)
+    along = rel @ d[:, :, None]                    # (Q, V, 1)
+    along = along[:, :, 0]
+    length_sq = np.einsum('ij,ij->i', d, d)[:, None]
+    collinear = (np.abs(rel[:, :, 0] * d[:, 1:2] - rel[:, :, 1] * d[:, 0:1]) <=
+                 1e-12 * np.maximum(length_sq, 1.0))
+
+    # Copies of the end points never block: rounding in along can put the
+    # end q itself just inside (0, length_sq)
+    at_end = ((vertices[None, :, :] == q[:, None, :]).all(axis=2) |
+              (vertices == p).all(axis=1)[None, :])
+    return (collinear & ~at_end & (along > 0) & (along < length_sq)).any(axis=1)
+
+
+# ============================================================================
+# HOLE BRIDGING
+# ============================================================================
+
+def _locally_inside(points: np.ndarray, prev: int, vertex: int, nxt: int, target: int) -> bool:
+    """Whether the direction vertex->target starts inside the ring's interior wedge at vertex"""
+
+    (ax, ay), (px, py), (nx, ny), (tx, ty) = points[vertex], points[prev], points[nxt], points[target]
+    if _cross(px, py, ax, ay, nx, ny) >= 0:
+        # Convex corner: between the outgoing and the reversed incoming edge
+        return _cross(ax, ay, nx, ny, tx, ty) >= 0 and _cross(ax, ay, tx, ty, px, py) >= 0
+    # Reflex corner: anywhere outside the exterior wedge
+    return not (_cross(ax, ay, px, py, tx, ty) > 0 and _cross(ax, ay, tx, ty, nx, ny) > 0)
+
+
+def _bridge_holes(points: np.ndarray, outer: List[int],
+                  holes: List[List[int]]) -> List[int]:
+    """
+    Splice hole rings into the outer ring.
+
+    Args:
+        points: (N, 2) all ring vertices
+        outer: counter-clockwise outer ring (indices into points)
+        holes: clockwise hole rings (indices into points)
+
+    Returns:
+        one ring of indices; bridge endpoints appear twice
+    """
+
+    ring = list(outer)
+
+    # Right-most holes first, so bridges never cross holes not yet merged
+    for hole in sorted(holes, key=lambda h: -points[h, 0].max()):
+        start = max(range(len(hole)), key=lambda k: (points[hole[k], 0], -points[hole[k], 1]))
+        h = hole[start]
+        hx, hy = points[h]
+
+        ring_arr = np.asarray(ring)
+        hole_arr = np.asarray(hole)
+        edge_a = np.concatenate([points[ring_arr], points[hole_arr]])
+        edge_b = np.concatenate([points[np.roll(ring_arr, -1)], points[np.roll(hole_arr, -1)]])
+        h_prev, h_next = hole[start - 1], hole[(start + 1) % len(hole)]
+
+        # Test every candidate bridge against every edge at once, nearest first
+        candidates = np.flatnonzero(points[ring_arr, 0] >= hx)
+        targets = points[ring_arr[candidates]]
+        order = np.argsort(np.hypot(targets[:, 0] - hx, targets[:, 1] - hy), kind='stable')
+        candidates, targets = candidates[order], targets[order]
+        blocked = (_segments_cross(points[h], targets[:, None, :], edge_a, edge_b).any(axis=1) |
+                   _touches_segment(points[h], targets, edge_a))
+
+        bridge = None
+        for k in candidates[~blocked].tolist():
+            target = ring[k]
+            if not _locally_inside(points, h_prev, h, h_next, target):
+                continue
+
+            # A vertex may occur several times (earlier bridges); attach to
+            # the occurrence whose interior wedge faces the hole
+            same = np.flatnonzero((points[ring_arr] == points[target]).all(axis=1))
+            for j in same.tolist():
+                if _locally_inside(points, ring[j - 1], ring[j], ring[(j + 1) % len(ring)], h):
+                    bridge = j
+                    break
+            if bridge is not None:
+                break
+        if bridge is None:
+            log.debug("[Triangulation] No visible bridge for hole, skipping it")
+            continue
+
+        rotated = hole[start:] + hole[:start]
+        ring = ring[:bridge + 1] + rotated + [h] + ring[bridge:]
+
+    return ring
+
+
+# ============================================================================
+# EAR CLIPPING
+# ============================================================================
+
+def _ear_clip(points: np.ndarray, ring: List[int]) -> List[Tuple[int, int, int]]:
+    """
+    Ear-clip one counter-clockwise (weakly simple) ring.
+
+    Returns:
+        list of counter-clockwise index triples
+    """
+
+    xs, ys = points[:, 0].tolist(), points[:, 1].tolist()
+    n = len(ring)
+    prev = [(k - 1) % n for k in range(n)]
+    nxt = [(k + 1) % n for k in range(n)]
+    triangles: List[Tuple[int, int, int]] = []
+
+    def corner(k: int) -> float:
+        a, b, c = ring[prev[k]], ring[k], ring[nxt[k]]
+        return (xs[b] - xs[a]) * (ys[c] - ys[a]) - (ys[b] - ys[a]) * (xs[c] - xs[a])
+
+    # Only reflex (or flat) corners can block an ear
+    reflex = {k for k in range(n) if corner(k) <= 0}
+
+    def is_ear(k: int) -> bool:
+        if k in reflex or corner(k) <= 1e-12:
+            return False
+
+        a, b, c = ring[prev[k]], ring[k], ring[nxt[k]]
+        ax, ay, bx, by, cx, cy = xs[a], ys[a], xs[b], ys[b], xs[c], ys[c]
+
+        # No reflex vertex may lie inside (or on) the candidate triangle;
+        # copies of its corners (bridge ends, touching holes) do not count
+        for q in reflex:
+            vx, vy = xs[ring[q]], ys[ring[q]]
+            if ((vx != ax or vy != ay) and (vx != bx or vy != by) and (vx != cx or vy != cy) and
+                    (bx - ax) * (vy - ay) - (by - ay) * (vx - ax) >= 0 and
+                    (cx - bx) * (vy - by) - (cy - by) * (vx - bx) >= 0 and
+                    (ax - cx) * (vy - cy) - (ay - cy) * (vx - cx) >= 0):
+                return False
+        return True
+
+    k, remaining, misses = 0, n, 0
+    while remaining > 3:
+        if is_ear(k) or misses >= remaining:
+            # A full lap without an ear means a degenerate ring: clip anyway
+            triangles.append((ring[prev[k]], ring[k], ring[nxt[k]]))
+            before, after = prev[k], nxt[k]
+            nxt[before], prev[after] = after, before
+            reflex.discard(k)
+            for q in (before, after):
+                if corner(q) <= 0:
+                    reflex.add(q)
+                else:
+                    reflex.discard(q)
+            k = before
+            remaining -= 1
+            misses = 0
+        else:
+            k = nxt[k]
+            misses += 1
+
+    triangles.append((ring[prev[k]], ring[k], ring[nxt[k]]))
+    return triangles
+
+
+# ============================================================================
+# PUBLIC API
+# ============================================================================
+
+def _oriented_rings(outer: np.ndarray,
+                    holes: Sequence[np.ndarray]) -> Tuple[np.ndarray, List[int], List[List[int]]]:
+    """Concatenate rings; return index rings with outer CCW and holes CW"""
+
+    rings = [np.asarray(outer, dtype=np.float64).reshape(-1, 2)]
+    rings += [np.asarray(h, dtype=np.float64).reshape(-1, 2) for h in holes]
+    points = np.concatenate(rings)
+
+    starts = np.cumsum([0] + [len(r) for r in rings])
+    index_rings = [list(range(starts[i], starts[i + 1])) for i in range(len(rings))]
+    for i, ring in enumerate(rings):
+        clockwise = ring_area(ring) < 0
+        if clockwise != (i > 0):
+            index_rings[i].reverse()
+
+    return points, index_rings[0], [r for r in index_rings[1:] if len(r) >= 3]
+
+
+def triangulate_polygon(outer: np.ndarray,
+                        holes: Sequence[np.ndarray] = ()) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Triangulate a polygon with holes by ear clipping.
+
+    Args:
+        outer: (N, 2) outer ring (either orientation, not closed)
+        holes: (K, 2) hole rings
+
+    Returns:
+        (points, triangles): (P, 2) concatenated ring vertices and (T, 3)
+        counter-clockwise triangles indexing them
+    """
+
+    points, ring, hole_rings = _oriented_rings(outer, holes)
+    if len(ring) < 3:
+        return points, np.empty((0, 3), dtype=np.int64)
+
+    if hole_rings:
+        ring = _bridge_holes(points, ring, hole_rings)
+
+    triangles = np.array(_ear_clip(points, ring), dtype=np.int64).reshape(-1, 3)
+    return points, triangles
+
+
+def triangulate_polygons(polygons: Sequence[Polygon]) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Triangulate many polygons.
+
+    Hole-free, strictly convex rings are fanned together in one vectorized
+    pass; the rest go through triangulate_polygon.
+
+    Args:
+        polygons: (outer, holes) pairs
+
+    Returns:
+        (points, triangles) per polygon, as from triangulate_polygon
+    """
+
+    results: List[Tuple[np.ndarray, np.ndarray]] = [None] * len(polygons)
+
+    simple = [i for i, (outer, holes) in enumerate(polygons)
+              if len(holes) == 0 and len(outer) >= 3]
+    if simple:
+        rings = [np.asarray(polygons[i][0], dtype=np.float64).reshape(-1, 2) for i in simple]
+        sizes = np.array([len(r) for r in rings])
+        starts = np.cumsum(sizes) - sizes
+        points = np.concatenate(rings)
+
+        # Corner turns around each ring (wrapping within the ring)
+        local = np.arange(len(points)) - np.repeat(starts, sizes)
+        size = np.repeat(sizes, sizes)
+        start = np.repeat(starts, sizes)
+        after = points[start + (local + 1) % size]
+        before = points[start + (local - 1) % size]
+        turn = ((points[:, 0] - before[:, 0]) * (after[:, 1] - points[:, 1]) -
+                (points[:, 1] - before[:, 1]) * (after[:, 0] - points[:, 0]))
+        ccw = np.minimum.reduceat(turn, starts) > 1e-12
+        cw = np.maximum.reduceat(turn, starts) < -1e-12
+
+        for slot, i in enumerate(simple):
+            n = sizes[slot]
+            if ccw[slot] or cw[slot]:
+                fan = np.column_stack([np.zeros(n - 2, dtype=np.int64),
+                                       np.arange(1, n - 1), np.arange(2, n)])
+                if cw[slot]:
+                    fan = fan[:, ::-1]
+                results[i] = (rings[slot], fan)
+
+    for i, (outer, holes) in enumerate(polygons):
+        if results[i] is None:
+            results[i] = triangulate_polygon(outer, holes)
+
+    return results
@@ -0,0 +1,810 @@
+"""Micro-benchmarks for pipeline data structures and stages.
+
+Usage:
+  python scripts/benchmarks.py                 # run every benchmark
+  python scripts/benchmarks.py spatial_index   # run one benchmark by name
+
+Each benchmark prints a small table; numbers are wall-clock seconds unless
+noted otherwise.
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(root))
+
+
+def _timed(fn, repeat=1):
+    """Best-of-N wall time of fn() and its last result"""
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def _random_segments(n, rng, extent=None, max_len=20.0):
+    """n short random segments spread over a square"""
+    extent = extent or max(100.0, np.sqrt(n) * max_len)
+    p0 = rng.uniform(0, extent, size=(n, 2))
+    p1 = p0 + rng.uniform(-max_len, max_len, size=(n, 2))
+    return np.hstack([p0, p1])
+
+
+def _grid_plan(rooms_x, rooms_y, room_px=120, wall_px=12):
+    """Binary wall mask of a rooms_x x rooms_y grid of square rooms"""
+    pitch = room_px + wall_px
+    h, w = rooms_y * pitch + wall_px, rooms_x * pitch + wall_px
+    mask = np.zeros((h, w), dtype=np.uint8)
+    for i in range(rooms_y + 1):
+        mask[i * pitch:i * pitch + wall_px, :] = 255
+    for j in range(rooms_x + 1):
+        mask[:, j * pitch:j * pitch + wall_px] = 255
+    return mask
+
+
+# ============================================================================
+# BASELINE MESH (pre-array Stage 6, kept for comparison)
+# ============================================================================
+
+class _BaselineMesh:
+    """
+    The Stage 6 Mesh before it moved to arrays: Vertex/Face objects and a
+    rounding-dict lookup on every add_vertex call (copied as it was)
+    """
+
+    def __init__(self, name="mesh"):
+        from pipeline.stage6_3d_construction import Vertex, Face
+        self._vertex, self._face = Vertex, Face
+        self.name = name
+        self.vertices = []
+        self.faces = []
+        self.vertex_hash_map = {}
+
+    def add_vertex(self, position, normal=None):
+        key = tuple(np.round(position, decimals=6))
+        if key in self.vertex_hash_map:
+            return self.vertex_hash_map[key]
+        idx = len(self.vertices)
+        vertex = self._vertex(position=position.copy())
+        if normal is not None:
+            vertex.normal = normal.copy()
+        self.vertices.append(vertex)
+        self.vertex_hash_map[key] = idx
+        return idx
+
+    def add_face(self, vi0, vi1, vi2, normal=None):
+        self.faces.append(self._face(vertex_indices=(vi0, vi1, vi2), normal=normal))
+        return len(self.faces) - 1
+
+    def recalculate_normals(self):
+        # np.cross(..., dtype=) raises, so every face fell into the except
+        if not self.faces:
+            return
+        vertex_normals = {i: np.array([0., 0., 0.], dtype=np.float32) for i in range(len(self.vertices))}
+        for face in self.faces:
+            try:
+                vi0, vi1, vi2 = face.vertex_indices
+                v0, v1, v2 = (self.vertices[v].position for v in (vi0, vi1, vi2))
+                face_normal = np.cross(v1 - v0, v2 - v0, dtype=np.float32)
+                norm_sq = np.dot(face_normal, face_normal)
+                if norm_sq > 1e-12:
+                    face_normal = face_normal / np.sqrt(norm_sq)
+                    face.normal = face_normal
+                    for v in (vi0, vi1, vi2):
+                        vertex_normals[v] += face_normal
+            except Exception:
+                continue
+        for i in range(len(self.vertices)):
+            normal = vertex_normals[i]
+            norm_sq = np.dot(normal, normal)
+            if norm_sq > 1e-12:
+                self.vertices[i].normal = normal / np.sqrt(norm_sq)
+
+    def validate_manifold(self):
+        edge_count = {}
+        for face in self.faces:
+            vi0, vi1, vi2 = face.vertex_indices
+            for edge in (tuple(sorted([vi0, vi1])), tuple(sorted([vi1, vi2])), tuple(sorted([vi2, vi0]))):
+                edge_count[edge] = edge_count.get(edge, 0) + 1
+        bad = sum(1 for count in edge_count.values() if count != 2)
+        return bad == 0, f"Non-manifold edges: {bad}"
+
+
+def _baseline_box(mesh, corners):
+    """Old per-box emission: 8 deduplicated add_vertex calls, 12 add_face calls"""
+    from pipeline.stage6_3d_construction import BOX_FACES
+    ids = [mesh.add_vertex(p) for p in corners]
+    for a, b, c in BOX_FACES.tolist():
+        mesh.add_face(ids[a], ids[b], ids[c])
+
+
+def _baseline_build(wall_graph):
+    """Old CutawayBuilder.build(): floor slab, per-edge boxes, normals, manifold check"""
+    from pipeline.stage6_3d_construction import WALL_THICKNESS, WALL_HEIGHT, FLOOR_SLAB_THICKNESS
+
+    mesh = _BaselineMesh("cutaway_model")
+    xs = [v.position[0] for v in wall_graph.vertices.values()]
+    ys = [v.position[1] for v in wall_graph.vertices.values()]
+    x0, x1, y0, y1 = min(xs) - 0.5, max(xs) + 0.5, min(ys) - 0.5, max(ys) + 0.5
+    _baseline_box(mesh, [np.array([x, y, z]) for z in (-FLOOR_SLAB_THICKNESS, 0.0)
+                         for x, y in ((x0, y0), (x1, y0), (x1, y1), (x0, y1))])
+
+    for edge in wall_graph.edges.values():
+        p_start, p_end = np.array(edge.vertex_a.position), np.array(edge.vertex_b.position)
+        wall_vec = p_end - p_start
+        wall_len = np.linalg.norm(wall_vec)
+        if wall_len < 1e-6:
+            continue
+        perp = np.array([-wall_vec[1], wall_vec[0]]) / wall_len * (WALL_THICKNESS / 2.0)
+        footprint = (p_start + perp, p_start - perp, p_end - perp, p_end + perp)
+        _baseline_box(mesh, [np.array([x, y, z]) for z in (0.0, WALL_HEIGHT) for x, y in footprint])
+
+    mesh.recalculate_normals()
+    mesh.validate_manifold()
+    return mesh
+
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+def bench_spatial_index():
+    """SegmentIndex vs. linear (vectorized) scan over wall segments"""
+    from pipeline.spatial_index import SegmentIndex, point_segment_distances
+
+    rng = np.random.default_rng(0)
+    queries = 200
+    print(f"{'segments':>10} {'build':>9} {'index q/s':>12} {'scan q/s':>12} {'speedup':>8}")
+
+    for n in (100, 10_000, 1_000_000):
+        segments = _random_segments(n, rng)
+        build_time, index = _timed(lambda: SegmentIndex.bulk_load(segments))
+        points = rng.uniform(segments[:, :2].min(), segments[:, :2].max(), size=(queries, 2))
+
+        def indexed():
+            for p in points:
+                index.nearest_segment(p, k=3)
+                index.segments_within(p, 10.0)
+
+        def scan():
+            for p in points:
+                d, _ = point_segment_distances(p, segments)
+                d = d[0]
+                np.argpartition(d, 3)[:3]
+                np.nonzero(d <= 10.0)
+
+        t_index, _ = _timed(indexed)
+        t_scan, _ = _timed(scan)
+        print(f"{n:>10} {build_time:>9.3f} {queries / t_index:>12.0f} "
+              f"{queries / t_scan:>12.0f} {t_scan / t_index:>7.1f}x")
+
+
+def bench_topology_engines():
+    """Stage 3 skeleton vs. segments engine: time and vertex agreement"""
+    import logging
+    from pipeline.stage3_topology_extraction import TopologyExtractor
+
+    logging.disable(logging.INFO)
+    wall_px = 12
+    print(f"{'plan':>6} {'skeleton s':>11} {'segments s':>11} {'V skel':>7} {'V seg':>6} "
+          f"{'seg->skel':>10} {'skel->seg':>10}")
+
+    for n in (2, 3, 4):
+        mask = _grid_plan(n, n, wall_px=wall_px)
+        t_skel, g_skel = _timed(lambda: TopologyExtractor(mask, engine='skeleton').extract())
+        t_seg, g_seg = _timed(lambda: TopologyExtractor(mask, engine='segments').extract())
+
+        a = np.array([v.position for v in g_seg.vertices.values()]).reshape(-1, 2)
+        b = np.array([v.position for v in g_skel.vertices.values()]).reshape(-1, 2)
+        d = np.linalg.norm(a[:, None, :] - b[None, :, :], axis=2) if len(a) and len(b) else np.zeros((0, 0))
+        seg_hit = (d.min(axis=1) <= wall_px).mean() if d.size else 0.0
+        skel_hit = (d.min(axis=0) <= wall_px).mean() if d.size else 0.0
+
+        print(f"{n}x{n:<4} {t_skel:>11.3f} {t_seg:>11.3f} {len(b):>7} {len(a):>6} "
+              f"{seg_hit:>10.0%} {skel_hit:>10.0%}")
+
+    # Large plans: segments engine only (thinning is far too slow here)
+    import tracemalloc
+    print(f"\n{'plan':>6} {'image':>10} {'segments s':>11} {'peak MiB':>9} {'V':>6} {'E':>6}")
+    for n in (12, 40, 60):
+        mask = _grid_plan(n, n, room_px=60, wall_px=6)
+        t_seg, graph = _timed(lambda: TopologyExtractor(mask, engine='segments').extract())
+        tracemalloc.start()
+        TopologyExtractor(mask, engine='segments').extract()
+        mib = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        tracemalloc.stop()
+        print(f"{n}x{n:<4} {mask.shape[1]:>5}x{mask.shape[0]:<4} {t_seg:>11.2f} {mib:>9.0f} "
+              f"{len(graph.vertices):>6} {len(graph.edges):>6}")
+    logging.disable(logging.NOTSET)
+
+
+def bench_tiled_thinning():
+    """Stage 3 tile-parallel thinning: scaling across thread counts"""
+    import logging
+    from pipeline.stage3_topology_extraction import TopologyExtractor
+
+    logging.disable(logging.INFO)
+    mask = _grid_plan(40, 30, room_px=140, wall_px=14)
+    print(f"mask {mask.shape[1]}x{mask.shape[0]}")
+    print(f"{'threads':>8} {'seconds':>9} {'speedup':>8}")
+
+    baseline = None
+    for workers in (1, 2, 4, 8):
+        extractor = TopologyExtractor(mask, workers=workers, tile_size=1024)
+        t, _ = _timed(extractor._skeletonize_wall_mask)
+        baseline = baseline or t
+        print(f"{workers:>8} {t:>9.2f} {baseline / t:>7.2f}x")
+    logging.disable(logging.NOTSET)
+
+
+def bench_room_labels():
+    """Stage 4 label-image rooms vs. per-room pixel sets: time and peak memory"""
+    import logging
+    import tracemalloc
+    import cv2
+    from pipeline.stage4_room_detection import RoomDetector
+
+    logging.disable(logging.INFO)
+    print(f"{'image':>10} {'rooms':>6} {'labels s':>9} {'labels MiB':>11} "
+          f"{'sets s':>8} {'sets MiB':>9}")
+
+    def peak(fn):
+        tracemalloc.start()
+        t, result = _timed(fn)
+        mib = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        tracemalloc.stop()
+        return t, mib, result
+
+    def pixel_sets(mask):
+        # Previous representation: one tuple per room pixel, mask filled per pixel
+        _, labeled = cv2.connectedComponents((mask == 0).astype(np.uint8))
+        rooms = [set(map(tuple, np.argwhere(labeled == i)[:, ::-1].tolist()))
+                 for i in range(1, labeled.max() + 1)]
+        room_mask = np.zeros(mask.shape, dtype=np.uint8)
+        for room_id, pixels in enumerate(rooms):
+            for x, y in pixels:
+                room_mask[y, x] = room_id + 1
+        return rooms
+
+    for rooms_x, rooms_y in ((4, 3), (8, 6), (16, 12)):
+        mask = (_grid_plan(rooms_x, rooms_y, room_px=240) > 0).astype(np.uint8)
+        t_label, mib_label, room_set = peak(lambda: RoomDetector(mask).detect())
+        if mask.size <= 4_000_000:
+            t_sets, mib_sets, _ = peak(lambda: pixel_sets(mask))
+            sets = f"{t_sets:>8.2f} {mib_sets:>9.0f}"
+        else:
+            sets = f"{'-':>8} {'-':>9}"
+        print(f"{mask.shape[1]:>5}x{mask.shape[0]:<4} {len(room_set.rooms):>6} "
+              f"{t_label:>9.2f} {mib_label:>11.0f} {sets}")
+    logging.disable(logging.NOTSET)
+
+
+def bench_mesh_build():
+    """Stage 6 mesh: baseline Vertex/Face mesh vs. array mesh (per element, bulk + weld)"""
+    import logging
+    from pipeline.stage3_topology_extraction import TopologyExtractor
+    from pipeline.stage6_3d_construction import Mesh, BOX_FACES, CutawayBuilder
+
+    logging.disable(logging.WARNING)
+    print(f"{'walls':>8} {'vertices':>9} {'baseline s':>11} {'per-elem s':>11} {'bulk s':>8} "
+          f"{'vs baseline':>12}")
+
+    for n in (500, 5_000, 20_000):
+        # n unit boxes on a lattice; neighbours share corner vertices
+        k = int(np.ceil(np.sqrt(n)))
+        ij = np.stack(np.meshgrid(np.arange(k), np.arange(k)), -1).reshape(-1, 2)[:n]
+        unit = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0],
+                         [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1]], dtype=np.float64)
+        corners = (unit[None] + np.pad(ij, ((0, 0), (0, 1)))[:, None, :]).reshape(-1, 3)
+        triangles = (BOX_FACES[None] + 8 * np.arange(n)[:, None, None]).reshape(-1, 3)
+
+        def baseline():
+            mesh = _BaselineMesh()
+            for box in corners.reshape(-1, 8, 3):
+                _baseline_box(mesh, box)
+            return mesh
+
+        def per_element():
+            mesh = Mesh()
+            ids = [mesh.add_vertex(p) for p in corners]
+            for a, b, c in triangles.tolist():
+                mesh.add_face(ids[a], ids[b], ids[c])
+            mesh.weld()
+            return mesh
+
+        def bulk():
+            mesh = Mesh()
+            ids = mesh.add_vertices(corners)
+            mesh.add_faces(ids[triangles])
+            mesh.weld()
+            return mesh
+
+        t_base, old = _timed(baseline)
+        t_elem, _ = _timed(per_element)
+        t_bulk, mesh = _timed(bulk, repeat=3)
+        assert len(old.vertices) == mesh.vertex_count
+        print(f"{n:>8} {mesh.vertex_count:>9} {t_base:>11.3f} {t_elem:>11.3f} {t_bulk:>8.4f} "
+              f"{t_base / t_bulk:>11.1f}x")
+
+    # End to end: floor + walls + normals + manifold check on a grid graph,
+    # the old builder over the baseline mesh vs. CutawayBuilder in boxes mode
+    print(f"\n{'plan':>7} {'walls':>6} {'faces':>7} {'baseline s':>11} {'current s':>10} {'speedup':>8}")
+    for n in (16, 50):
+        graph = TopologyExtractor(_grid_plan(n, n, room_px=60, wall_px=6), engine='segments').extract()
+        t_base, old = _timed(lambda: _baseline_build(graph))
+        t_new, mesh = _timed(lambda: CutawayBuilder(graph, None, None, wall_mode='boxes').build(), repeat=3)
+        assert len(old.faces) == mesh.face_count
+        print(f"{n:>3}x{n:<3} {len(graph.edges):>6} {mesh.face_count:>7} {t_base:>11.3f} "
+              f"{t_new:>10.4f} {t_base / t_new:>7.1f}x")
+    logging.disable(logging.NOTSET)
+
+
+def bench_half_edges():
+    """Mesh adjacency: edge->face dictionaries vs. array half-edge structure"""
+    from pipeline.half_edge import HalfEdgeMesh
+    from pipeline.stage6_3d_construction import BOX_FACES
+
+    print(f"{'faces':>8} {'dict s':>8} {'arrays s':>9} {'speedup':>8} {'boundary loops':>15}")
+
+    for n in (1_000, 10_000, 100_000):
+        # n closed boxes, every fourth with its top removed
+        triangles = (BOX_FACES[None] + 8 * np.arange(n)[:, None, None])
+        keep = np.ones(triangles.shape[:2], dtype=bool)
+        keep[::4, 2:4] = False
+        triangles = triangles[keep]
+
+        def dictionaries():
+            edge_faces = {}
+            for f, (a, b, c) in enumerate(triangles.tolist()):
+                for edge in ((a, b), (b, c), (c, a)):
+                    edge_faces.setdefault(edge, []).append(f)
+            return {edge: faces for edge, faces in edge_faces.items()
+                    if (edge[1], edge[0]) not in edge_faces}
+
+        t_dict, _ = _timed(dictionaries)
+        t_arrays, half_edges = _timed(lambda: HalfEdgeMesh(triangles), repeat=3)
+        loops = len(half_edges.boundary_loops())
+        print(f"{len(triangles):>8} {t_dict:>8.3f} {t_arrays:>9.4f} {t_dict / t_arrays:>7.1f}x "
+              f"{loops:>15}")
+
+
+def bench_mesh_checks():
+    """Stage 6 mesh: per-face loops vs. vectorized normals and manifold check"""
+    import logging
+    from pipeline.stage6_3d_construction import Mesh, BOX_FACES
+
+    logging.disable(logging.INFO)
+    print(f"{'faces':>8} {'loop normals':>13} {'normals':>8} {'loop edges':>11} "
+          f"{'edges':>7} {'speedup':>8}")
+
+    def loop_normals(mesh):
+        # Previous implementation: one cross product per face
+        positions, normals = mesh.positions, np.zeros((mesh.vertex_count, 3))
+        for vi0, vi1, vi2 in mesh.indices.tolist():
+            n = np.cross(positions[vi1] - positions[vi0], positions[vi2] - positions[vi0])
+            norm_sq = np.dot(n, n)
+            if norm_sq > 1e-12:
+                n = n / np.sqrt(norm_sq)
+                normals[vi0] += n
+                normals[vi1] += n
+                normals[vi2] += n
+        return normals
+
+    def loop_edges(mesh):
+        # Previous implementation: dict of sorted vertex tuples
+        edge_count = {}
+        for vi0, vi1, vi2 in mesh.indices.tolist():
+            for edge in ((vi0, vi1), (vi1, vi2), (vi2, vi0)):
+                edge = tuple(sorted(edge))
+                edge_count[edge] = edge_count.get(edge, 0) + 1
+        return sum(1 for count in edge_count.values() if count != 2)
+
+    for n in (500, 5_000, 20_000):
+        k = int(np.ceil(np.sqrt(n)))
+        ij = np.stack(np.meshgrid(np.arange(k), np.arange(k)), -1).reshape(-1, 2)[:n]
+        unit = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0],
+                         [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1]], dtype=np.float64)
+        mesh = Mesh()
+        ids = mesh.add_vertices((unit[None] + np.pad(ij, ((0, 0), (0, 1)))[:, None, :]).reshape(-1, 3))
+        mesh.add_faces(ids[(BOX_FACES[None] + 8 * np.arange(n)[:, None, None]).reshape(-1, 3)])
+        mesh.weld()
+
+        def edges():
+            mesh._edge_uses = None
+            return len(mesh.check_manifold()[1])
+
+        t_loop_n, _ = _timed(lambda: loop_normals(mesh))
+        t_vec_n, _ = _timed(mesh.recalculate_normals, repeat=3)
+        t_loop_e, bad_loop = _timed(lambda: loop_edges(mesh))
+        t_vec_e, bad_vec = _timed(edges, repeat=3)
+        assert bad_loop == bad_vec
+        print(f"{mesh.face_count:>8} {t_loop_n:>13.3f} {t_vec_n:>8.4f} {t_loop_e:>11.3f} "
+              f"{t_vec_e:>7.4f} {(t_loop_n + t_loop_e) / (t_vec_n + t_vec_e):>7.0f}x")
+    logging.disable(logging.NOTSET)
+
+def bench_wall_extrusion():
+    """Stage 6 walls: per-edge box extrusion vs. one batched pass"""
+    import logging
+    from pipeline.stage6_3d_construction import Mesh, WallExtrusion, BOX_FACES
+
+    logging.disable(logging.INFO)
+    rng = np.random.default_rng(0)
+    print(f"{'edges':>8} {'per-edge s':>11} {'batched s':>10} {'speedup':>8}")
+
+    def per_edge(segments):
+        # Previous implementation: one 8-corner box per call
+        mesh = Mesh()
+        for p_start, p_end in segments:
+            wall_vec = p_end - p_start
+            wall_len = np.linalg.norm(wall_vec)
+            if wall_len < 1e-6:
+                continue
+            wall_dir = wall_vec / wall_len
+            perp_offset = np.array([-wall_dir[1], wall_dir[0]]) * 0.1
+            footprint = np.array([p_start + perp_offset, p_start - perp_offset,
+                                  p_end - perp_offset, p_end + perp_offset])
+            corners = np.zeros((8, 3))
+            corners[:4, :2] = footprint
+            corners[4:, :2] = footprint
+            corners[4:, 2] = 1.3
+            vi = mesh.add_vertices(corners)
+            mesh.add_faces(vi[BOX_FACES])
+        return mesh
+
+    def batched(segments):
+        mesh = Mesh()
+        WallExtrusion.extrude_wall_edges(segments, 0.2, 1.3, mesh)
+        return mesh
+
+    for n in (100, 10_000, 100_000):
+        segments = _random_segments(n, rng).reshape(-1, 2, 2)
+        t_edge, reference = _timed(lambda: per_edge(segments))
+        t_batch, mesh = _timed(lambda: batched(segments), repeat=3)
+        assert np.allclose(reference.positions, mesh.positions)
+        assert np.array_equal(reference.indices, mesh.indices)
+
+        # Every box is wound outward: positive signed volume
+        corners = mesh.positions[mesh.indices].reshape(-1, len(BOX_FACES), 3, 3)
+        corners = corners - corners.mean(axis=(1, 2), keepdims=True)
+        volume = np.einsum('bfk,bfk->b', corners[:, :, 0],
+                           np.cross(corners[:, :, 1], corners[:, :, 2])) / 6.0
+        assert (volume > 0).all()
+        print(f"{n:>8} {t_edge:>11.3f} {t_batch:>10.4f} {t_edge / t_batch:>7.0f}x")
+    logging.disable(logging.NOTSET)
+
+def bench_wall_footprint():
+    """Stage 6 walls: one box per edge vs. mitered footprint union"""
+    import logging
+    from pipeline.stage3_topology_extraction import TopologyExtractor
+    from pipeline.stage6_3d_construction import CutawayBuilder, Mesh
+
+    logging.disable(logging.INFO)
+    print(f"{'plan':>7} {'edges':>6} {'mode':>10} {'faces':>8} {'bad edges':>10} {'seconds':>8}")
+
+    for n in (4, 16, 40):
+        graph = TopologyExtractor(_grid_plan(n, n, room_px=60, wall_px=6), engine='segments').extract()
+        for mode in CutawayBuilder.WALL_MODES:
+            builder = CutawayBuilder(graph, None, None, wall_mode=mode)
+            t, mesh = _timed(lambda: builder._build_walls(Mesh()), repeat=3)
+            mesh.weld()
+            _, bad = mesh.check_manifold()
+            print(f"{n:>3}x{n:<3} {len(graph.edges):>6} {mode:>10} {mesh.face_count:>8} "
+                  f"{len(bad):>10} {t:>8.4f}")
+    logging.disable(logging.NOTSET)
+
+
+def bench_room_floors():
+    """Stage 6 floors: batched triangulation of room polygons into per-room slabs"""
+    import logging
+    from pipeline.stage4_room_detection import RoomDetector
+    from pipeline.stage6_3d_construction import CutawayBuilder, Mesh
+
+    logging.disable(logging.INFO)
+    print(f"{'plan':>7} {'rooms':>6} {'groups':>7} {'faces':>8} {'bad edges':>10} {'seconds':>8}")
+
+    for n in (4, 16, 30):
+        room_set = RoomDetector(_grid_plan(n, n, room_px=60, wall_px=6)).detect()
+        builder = CutawayBuilder(None, room_set, None)
+        t, mesh = _timed(lambda: builder._build_floor_slab(Mesh()), repeat=3)
+        mesh.weld()
+        _, bad = mesh.check_manifold()
+        print(f"{n:>3}x{n:<3} {len(room_set.rooms):>6} {len(mesh.groups):>7} {mesh.face_count:>8} "
+              f"{len(bad):>10} {t:>8.4f}")
+    logging.disable(logging.NOTSET)
+
+
+def bench_wall_instancing():
+    """Stage 9 box walls: merged GLB vs. EXT_mesh_gpu_instancing (bytes per plan)"""
+    import logging
+    import os
+    import tempfile
+    from pipeline.stage3_topology_extraction import TopologyExtractor
+    from pipeline.stage6_3d_construction import CutawayBuilder
+    from pipeline.stage9_export import GLBExporter
+
+    logging.disable(logging.WARNING)
+    print(f"{'plan':>7} {'walls':>6} {'merged B':>10} {'instanced B':>12} {'+fallback B':>12} "
+          f"{'saved B':>9} {'saved':>6}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'plan.glb')
+
+        def size(**options):
+            GLBExporter(mesh, **options).export(path)
+            return os.path.getsize(path)
+
+        for n in (4, 16, 40):
+            graph = TopologyExtractor(_grid_plan(n, n, room_px=60, wall_px=6), engine='segments').extract()
+            mesh = CutawayBuilder(graph, None, None, wall_mode='boxes').build()
+            merged = size()
+            instanced = size(instancing=True, instancing_fallback=False)
+            fallback = size(instancing=True)
+            print(f"{n:>3}x{n:<3} {len(mesh.instances['walls']):>6} {merged:>10} {instanced:>12} "
+                  f"{fallback:>12} {merged - fallback:>9} {1 - fallback / merged:>6.0%}")
+    logging.disable(logging.NOTSET)
+
+
+def bench_lod_levels():
+    """Stage 6/9 LOD chain: triangles per level and MSFT_lod GLB size per plan"""
+    import logging
+    import os
+    import tempfile
+    from pipeline.stage3_topology_extraction import TopologyExtractor
+    from pipeline.stage4_room_detection import RoomDetector
+    from pipeline.stage6_3d_construction import CutawayBuilder, build_lod_chain
+    from pipeline.stage9_export import GLBExporter
+
+    logging.disable(logging.WARNING)
+    print(f"{'plan':>7} {'tris per level':>22} {'coverage':>16} "
+          f"{'single B':>10} {'with LODs B':>12} {'chain s':>8}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'plan.glb')
+
+        for n in (4, 16, 40):
+            image = _grid_plan(n, n, room_px=60, wall_px=6)
+            graph = TopologyExtractor(image, engine='segments').extract()
+            room_set = RoomDetector(image).detect()
+            mesh = CutawayBuilder(graph, room_set, None).build()
+            t, (chain, coverage) = _timed(lambda: build_lod_chain(mesh, graph, room_set))
+
+            GLBExporter(mesh).export(path)
+            single = os.path.getsize(path)
+            GLBExporter(mesh, lods=chain[1:], lod_coverage=coverage).export(path)
+            with_lods = os.path.getsize(path)
+
+            counts = '/'.join(str(m.face_count) for m in chain)
+            thresholds = '/'.join(f"{c:g}" for c in coverage)
+            print(f"{n:>3}x{n:<3} {counts:>22} {thresholds:>16} "
+                  f"{single:>10} {with_lods:>12} {t:>8.3f}")
+    logging.disable(logging.NOTSET)
+
+
+def bench_opening_split():
+    """Stage 7 openings: local wall splitting through the mesh face index"""
+    import logging
+    from pipeline.stage3_topology_extraction import TopologyExtractor
+    from pipeline.stage6_3d_construction import CutawayBuilder
+    from pipeline.stage7_openings import OpeningGenerator
+
+    logging.disable(logging.WARNING)
+    print(f"{'plan':>7} {'faces':>8} {'openings':>9} {'index s':>8} {'bad edges':>10} {'seconds':>8}")
+
+    for n in (4, 16, 40):
+        graph = TopologyExtractor(_grid_plan(n, n, room_px=60, wall_px=6), engine='segments').extract()
+        centers = graph.edge_segments().mean(axis=1)
+
+        for count in sorted({min(100, len(centers)), min(300, len(centers)), len(centers)}):
+            # One door on each of count evenly spread wall edges
+            rows = np.linspace(0, len(centers) - 1, count).astype(int)
+            mesh = CutawayBuilder(graph, None, None).build()
+            faces = mesh.face_count
+            index_t, _ = _timed(mesh.face_index)
+            generator = OpeningGenerator(mesh, graph, scale_factor=1.0)
+            generator.generate_doors([{'position': tuple(centers[r])} for r in rows])
+            t, _ = _timed(generator.split_walls)
+            _, bad = mesh.check_manifold()
+            print(f"{n:>3}x{n:<3} {faces:>8} {count:>9} {index_t:>8.4f} {len(bad):>10} {t:>8.4f}")
+    logging.disable(logging.NOTSET)
+
+
+def bench_opening_association():
+    """Stage 7 openings: broadcast host-wall association vs per-opening lookups"""
+    from pipeline.stage3_topology_extraction import TopologyExtractor
+    from pipeline.stage7_openings import associate_openings
+
+    rng = np.random.default_rng(0)
+    print(f"{'plan':>7} {'walls':>6} {'openings':>9} {'loop s':>8} {'broadcast s':>12} {'agree':>6}")
+
+    for n in (4, 16, 40):
+        graph = TopologyExtractor(_grid_plan(n, n, room_px=60, wall_px=6), engine='segments').extract()
+        segments = graph.edge_segments()
+        index = graph.spatial_index()
+        for count in (100, 1000):
+            centers = segments.mean(axis=1)[rng.integers(0, len(segments), count)] + rng.normal(0, 2, (count, 2))
+
+            def loop():
+                return [index.nearest_segment(tuple(c))[0][1] for c in centers]
+
+            loop_t, nearest = _timed(loop)
+            broadcast_t, (_, _, distances) = _timed(lambda: associate_openings(centers, segments, max_distance=np.inf))
+            agree = np.mean(np.isclose(distances, nearest))
+            print(f"{n:>3}x{n:<3} {len(segments):>6} {count:>9} {loop_t:>8.4f} {broadcast_t:>12.4f} {agree:>6.2f}")
+
+
+def bench_self_intersection():
+    """Stage 8 self-intersection check: triangle BVH build, full query and the early-exit check"""
+    import logging
+    from pipeline.stage3_topology_extraction import TopologyExtractor
+    from pipeline.stage6_3d_construction import CutawayBuilder, Mesh
+    from pipeline.stage8_validation import MeshValidator
+    from pipeline.bvh import TriangleBVH
+
+    logging.disable(logging.WARNING)
+    print(f"{'plan':>9} {'mode':>9} {'faces':>8} {'candidates':>11} {'hits':>7} {'build s':>8} "
+          f"{'query s':>8} {'check s':>8}")
+
+    def tiled(mesh, copies):
+        # copies side by side along x, keeping face groups and instances
+        width = float(np.ptp(mesh.positions[:, 0])) + 1.0
+        out = Mesh(name=mesh.name)
+        for k in range(copies):
+            base = out.add_vertices(mesh.positions + [k * width, 0.0, 0.0])[0]
+            for name in mesh.groups:
+                out.add_faces(mesh.indices[mesh.group_faces(name)] + base, group=name)
+        out.instances.update(mesh.instances)
+        return out
+
+    for n, copies in ((4, 1), (16, 1), (40, 1), (40, 3)):
+        graph = TopologyExtractor(_grid_plan(n, n, room_px=60, wall_px=6), engine='segments').extract()
+        for mode in ('footprint', 'boxes'):
+            mesh = tiled(CutawayBuilder(graph, None, None, wall_mode=mode).build(), copies)
+            build_t, bvh = _timed(lambda: TriangleBVH(mesh.positions, mesh.indices), repeat=3)
+            candidates = len(bvh.overlapping_pairs(bvh.tolerance()))
+            query_t, hits = _timed(bvh.self_intersections, repeat=3)
+
+            validator = MeshValidator(mesh)
+            check_t, _ = _timed(validator._check_self_intersection, repeat=3)
+            passed = validator.result.checks[-1][1]
+            plan = f"{copies}x{n}x{n}" if copies > 1 else f"{n}x{n}"
+            print(f"{plan:>9} {mode:>9} {mesh.face_count:>8} {candidates:>11} {len(hits):>7} "
+                  f"{build_t:>8.4f} {query_t:>8.4f} {check_t:>8.4f}{'' if passed else ' (fail)'}")
+    logging.disable(logging.NOTSET)
+
+
+def bench_glb_writer():
+    """Stage 9 GLB writer: time and peak traced memory vs binary payload"""
+    import io
+    import logging
+    import os
+    import tempfile
+    import tracemalloc
+    from pipeline.stage3_topology_extraction import TopologyExtractor
+    from pipeline.stage6_3d_construction import CutawayBuilder
+    from pipeline.stage9_export import GLBExporter
+
+    logging.disable(logging.WARNING)
+    print(f"{'plan':>7} {'target':>8} {'payload MB':>11} {'peak MB':>8} {'peak/payload':>13} {'seconds':>8}")
+
+    for n in (16, 40):
+        graph = TopologyExtractor(_grid_plan(n, n, room_px=60, wall_px=6), engine='segments').extract()
+        mesh = CutawayBuilder(graph, None, None).build()
+        path = os.path.join(tempfile.mkdtemp(), 'model.glb')
+
+        for name, target in (('file', lambda: path), ('BytesIO', io.BytesIO)):
+            exporter = GLBExporter(mesh)
+            tracemalloc.start()
+            t, _ = _timed(lambda: exporter.export(target()))
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            payload = exporter.buffer_length
+            print(f"{n:>3}x{n:<3} {name:>8} {payload / 1e6:>11.2f} {peak / 1e6:>8.2f} "
+                  f"{peak / payload:>13.2f} {t:>8.4f}")
+    logging.disable(logging.NOTSET)
+
+
+def _decode_glb(data):
+    """Parse a GLB and expand every mesh attribute/index accessor to float32 / uint32"""
+    import json
+    import struct
+
+    json_length = struct.unpack_from('<I', data, 12)[0]
+    gltf = json.loads(data[20:20 + json_length])
+    binary = memoryview(data)[28 + json_length:]
+    dtypes = {5126: np.float32, 5125: np.uint32, 5123: np.uint16, 5122: np.int16, 5120: np.int8}
+    scales = {5122: 1 / 32767, 5120: 1 / 127}
+    components = {'SCALAR': 1, 'VEC3': 3}
+
+    arrays = []
+    for mesh in gltf['meshes']:
+        for primitive in mesh['primitives']:
+            for index in list(primitive['attributes'].values()) + [primitive['indices']]:
+                accessor = gltf['accessors'][index]
+                view = gltf['bufferViews'][accessor['bufferView']]
+                dtype = np.dtype(dtypes[accessor['componentType']])
+                width = components[accessor['type']]
+                stride = view.get('byteStride', dtype.itemsize * width) // dtype.itemsize
+                offset = view['byteOffset'] + accessor.get('byteOffset', 0)
+                values = np.frombuffer(binary, dtype, count=accessor['count'] * stride, offset=offset)
+                values = values.reshape(-1, stride)[:, :width]
+                if accessor['type'] == 'SCALAR':
+                    arrays.append(values.astype(np.uint32))
+                elif accessor.get('normalized'):
+                    arrays.append(values.astype(np.float32) * np.float32(scales[accessor['componentType']]))
+                else:
+                    arrays.append(values.astype(np.float32))
+    return arrays
+
+
+def bench_glb_quantization():
+    """Stage 9 KHR_mesh_quantization: GLB size and decode time vs float attributes"""
+    import io
+    import logging
+    from pipeline.stage3_topology_extraction import TopologyExtractor
+    from pipeline.stage6_3d_construction import CutawayBuilder, build_lod_chain
+    from pipeline.stage9_export import GLBExporter
+
+    logging.disable(logging.WARNING)
+    print(f"{'plan':>7} {'variant':>10} {'float KB':>9} {'quant KB':>9} {'ratio':>6} "
+          f"{'float ms':>9} {'quant ms':>9}")
+
+    for n in (4, 16, 40):
+        graph = TopologyExtractor(_grid_plan(n, n, room_px=60, wall_px=6), engine='segments').extract()
+        mesh = CutawayBuilder(graph, None, None).build()
+        boxes = CutawayBuilder(graph, None, None, wall_mode='boxes').build()
+        chain, _ = build_lod_chain(mesh, graph, None)
+
+        for variant, source, options in (('footprint', mesh, {}),
+                                         ('lods', mesh, {'lods': chain[1:]}),
+                                         ('instanced', boxes, {'instancing': True})):
+            sizes, times = [], []
+            for quantize in (False, True):
+                stream = io.BytesIO()
+                GLBExporter(source, quantize=quantize, **options).export(stream)
+                data = stream.getvalue()
+                t, _ = _timed(lambda: _decode_glb(data), repeat=5)
+                sizes.append(len(data))
+                times.append(t)
+            print(f"{n:>3}x{n:<3} {variant:>10} {sizes[0] / 1024:>9.1f} {sizes[1] / 1024:>9.1f} "
+                  f"{sizes[1] / sizes[0]:>6.2f} {times[0] * 1000:>9.2f} {times[1] * 1000:>9.2f}")
+    logging.disable(logging.NOTSET)
+
+
+BENCHMARKS = {
+    'spatial_index': bench_spatial_index,
+    'topology_engines': bench_topology_engines,
+    'tiled_thinning': bench_tiled_thinning,
+    'room_labels': bench_room_labels,
+    'mesh_build': bench_mesh_build,
+    'mesh_checks': bench_mesh_checks,
+    'half_edges': bench_half_edges,
+    'wall_extrusion': bench_wall_extrusion,
+    'wall_footprint': bench_wall_footprint,
+    'room_floors': bench_room_floors,
+    'wall_instancing': bench_wall_instancing,
+    'lod_levels': bench_lod_levels,
+    'opening_split': bench_opening_split,
+    'opening_association': bench_opening_association,
+    'self_intersection': bench_self_intersection,
+    'glb_writer': bench_glb_writer,
+    'glb_quantization': bench_glb_quantization,
+}
+
+
+def main():
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            print('Unknown benchmark:', name, '- choose from', ', '.join(BENCHMARKS))
+            sys.exit(1)
+        print(f"\n== {name}: {BENCHMARKS[name].__doc__}")
+        BENCHMARKS[name]()
+
+
+if __name__ == '__main__':
+    main()
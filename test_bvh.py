@@ -0,0 +1,100 @@
+"""
+TEST SCRIPT: Triangle BVH (self-intersection search)
+====================================================
+
+TriangleBVH queries must agree with brute force over all triangle pairs
+on random triangle soups: box overlaps, crossing pairs, early stopping
+(limit) and skipped pairs.
+
+USAGE:
+    python test_bvh.py
+    python -m pytest test_bvh.py
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pipeline.bvh import TriangleBVH, triangles_intersect
+
+
+def _soup(rng, count, size=0.15):
+    """count independent triangles of roughly size in the unit cube"""
+    centers = rng.uniform(0, 1, (count, 1, 3))
+    corners = centers + rng.uniform(-size, size, (count, 3, 3))
+    return corners.reshape(-1, 3), np.arange(3 * count).reshape(-1, 3)
+
+
+def _all_pairs(count):
+    i, j = np.triu_indices(count, k=1)
+    return np.column_stack([i, j])
+
+
+def _as_set(pairs):
+    return set(map(tuple, np.asarray(pairs).tolist()))
+
+
+def test_overlapping_pairs_match_brute_force():
+    """Box-overlap candidates are exactly the overlapping face boxes"""
+    rng = np.random.default_rng(0)
+    for count in (1, 7, 200, 500):
+        positions, triangles = _soup(rng, count)
+        bvh = TriangleBVH(positions, triangles)
+
+        pairs = _all_pairs(count)
+        lo, hi = bvh.face_lo, bvh.face_hi
+        overlap = ((lo[pairs[:, 0]] <= hi[pairs[:, 1]]) & (lo[pairs[:, 1]] <= hi[pairs[:, 0]])).all(axis=1)
+
+        assert _as_set(bvh.overlapping_pairs()) == _as_set(pairs[overlap])
+
+
+def test_self_intersections_match_brute_force():
+    """Crossing pairs equal triangles_intersect over every pair"""
+    rng = np.random.default_rng(1)
+    for count in (2, 50, 300, 600):
+        positions, triangles = _soup(rng, count)
+        bvh = TriangleBVH(positions, triangles)
+        tolerance = bvh.tolerance()
+
+        pairs = _all_pairs(count)
+        corners = positions[triangles]
+        crossing = triangles_intersect(corners[pairs[:, 0]], corners[pairs[:, 1]], tolerance)
+
+        found = bvh.self_intersections()
+        assert len(found) == len(_as_set(found))
+        assert _as_set(found) == _as_set(pairs[crossing])
+
+
+def test_limit_and_skip():
+    """An early stop returns real hits; skipped pairs are never reported"""
+    rng = np.random.default_rng(2)
+    positions, triangles = _soup(rng, 600)
+    bvh = TriangleBVH(positions, triangles)
+    everything = _as_set(bvh.self_intersections())
+    assert len(everything) > 5
+
+    limited = _as_set(bvh.self_intersections(limit=5))
+    assert 5 <= len(limited) <= len(everything) and limited <= everything
+
+    odd = lambda fa, fb: (fa % 2 == 1) | (fb % 2 == 1)
+    kept = _as_set(bvh.self_intersections(skip=odd))
+    assert kept == {(i, j) for i, j in everything if i % 2 == 0 and j % 2 == 0}
+
+
+def test_touching_faces_are_not_intersections():
+    """A closed box (shared edges and vertices) has no crossing faces"""
+    corners = np.array([[x, y, z] for z in (0, 1) for y in (0, 1) for x in (0, 1)], dtype=np.float64)
+    quads = [(0, 2, 3, 1), (4, 5, 7, 6), (0, 1, 5, 4), (2, 6, 7, 3), (0, 4, 6, 2), (1, 3, 7, 5)]
+    triangles = np.array([t for a, b, c, d in quads for t in ((a, b, c), (a, c, d))])
+    assert len(TriangleBVH(corners, triangles).self_intersections()) == 0
+
+
+if __name__ == '__main__':
+    test_overlapping_pairs_match_brute_force()
+    test_self_intersections_match_brute_force()
+    test_limit_and_skip()
+    test_touching_faces_are_not_intersections()
+    print("✓ BVH tests passed")
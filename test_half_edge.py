@@ -0,0 +1,78 @@
+"""
+TEST SCRIPT: Half-edge connectivity
+===================================
+
+HalfEdgeMesh on small hand-built meshes: a closed box, an open-top box
+(one boundary loop around the rim) and a box with a fin (one edge shared
+by three faces).
+
+USAGE:
+    python test_half_edge.py
+    python -m pytest test_half_edge.py
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pipeline.half_edge import HalfEdgeMesh
+
+# Unit cube corners: index = x + 2y + 4z; quads wound outward
+BOX_QUADS = {
+    'bottom': (0, 2, 3, 1), 'top': (4, 5, 7, 6),
+    'front': (0, 1, 5, 4), 'back': (2, 6, 7, 3),
+    'left': (0, 4, 6, 2), 'right': (1, 3, 7, 5),
+}
+
+
+def _box(without=()):
+    return np.array([t for name, (a, b, c, d) in BOX_QUADS.items() if name not in without
+                     for t in ((a, b, c), (a, c, d))])
+
+
+def test_closed_box():
+    """Every edge has exactly one twin"""
+    mesh = HalfEdgeMesh(_box())
+    assert mesh.face_count == 12
+    assert len(mesh.boundary_half_edges()) == 0
+    assert len(mesh.non_manifold_edges()) == 0
+    assert mesh.boundary_loops() == []
+
+
+def test_open_box():
+    """Removing the top leaves one boundary loop around the rim"""
+    mesh = HalfEdgeMesh(_box(without=('top',)))
+    assert len(mesh.boundary_half_edges()) == 4
+    assert len(mesh.non_manifold_edges()) == 0
+
+    loops = mesh.boundary_loops()
+    assert len(loops) == 1
+    loop = loops[0].tolist()
+    assert sorted(loop) == [4, 5, 6, 7]
+
+    # The surface lies to the left of the loop: seen from above the rim
+    # runs clockwise (the open side faces up)
+    i = loop.index(4)
+    assert loop[i:] + loop[:i] == [4, 6, 7, 5]
+
+
+def test_fin_is_non_manifold():
+    """A third face on the edge (0, 1) makes it non-manifold"""
+    triangles = np.vstack([_box(), [[0, 1, 8]]])
+    mesh = HalfEdgeMesh(triangles)
+    assert mesh.non_manifold_edges().tolist() == [[0, 1]]
+
+    # The fin's other two edges are open, but their walk runs into the
+    # non-manifold edge, so no closed loop is reported
+    assert len(mesh.boundary_half_edges()) == 2
+    assert mesh.boundary_loops() == []
+
+
+if __name__ == '__main__':
+    test_closed_box()
+    test_open_box()
+    test_fin_is_non_manifold()
+    print("✓ Half-edge tests passed")
@@ -0,0 +1,70 @@
+"""
+TEST SCRIPT: Stage 6 Levels of Detail
+=====================================
+
+The coarser levels from build_lod_chain must cover the same floor as the
+building outline (no bounding-box floor under the notch of an L-shaped
+plan) and each kept level must have fewer triangles than the previous.
+
+USAGE:
+    python test_lod_chain.py
+    python -m pytest test_lod_chain.py
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pipeline.stage3_topology_extraction import stage3_topology_extraction
+from pipeline.stage4_room_detection import stage4_room_detection
+from pipeline.stage5_metric_normalization import MetricNormalizer
+from pipeline.stage6_3d_construction import create_cutaway_mesh, build_lod_chain
+from test_validation import _grid_plan, _l_plan
+
+
+def _chain(mask):
+    """Stages 3-6 and the LOD chain of a wall mask"""
+    wall_graph = stage3_topology_extraction(mask, engine='segments')
+    room_set = stage4_room_detection(mask, wall_graph)
+    success, _, graph, rooms = MetricNormalizer(
+        image_shape=mask.shape, wall_graph=wall_graph, room_set=room_set).normalize()
+    assert success
+    return build_lod_chain(create_cutaway_mesh(graph, rooms, None), graph, rooms)
+
+
+def _floor_area(mesh):
+    """Area of the upward-facing floor caps at z = 0"""
+    groups = [i for i, name in enumerate(mesh.groups) if name == 'floor' or name.startswith('room_')]
+    faces = mesh.indices[np.isin(mesh.face_groups, groups)]
+    a, b, c = (mesh.positions[faces[:, k]].astype(np.float64) for k in range(3))
+    on_floor = (a[:, 2] == 0) & (b[:, 2] == 0) & (c[:, 2] == 0)
+    cross = (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0])
+    return 0.5 * float(cross[on_floor & (cross > 0)].sum())
+
+
+def test_l_plan_floor_follows_outline():
+    """LOD1 floor is the outline floor plate, not the bounding box"""
+    chain, coverage = _chain(_l_plan())
+    assert len(chain) == 3 and len(coverage) == 3
+
+    full, merged, outline = chain
+    bounds = np.ptp(full.positions[:, :2], axis=0)
+    assert abs(_floor_area(merged) - _floor_area(outline)) < 1e-6 * _floor_area(outline)
+    assert _floor_area(merged) < 0.9 * bounds[0] * bounds[1]
+
+
+def test_levels_reduce_triangles():
+    """Every kept level is coarser than the one before"""
+    chain, coverage = _chain(_grid_plan(4, 4))
+    counts = [mesh.face_count for mesh in chain]
+    assert all(a > b for a, b in zip(counts, counts[1:])), counts
+    assert len(coverage) == len(chain) and coverage[-1] == 0.0
+
+
+if __name__ == '__main__':
+    test_l_plan_floor_follows_outline()
+    test_levels_reduce_triangles()
+    print("✓ LOD chain tests passed")
@@ -0,0 +1,85 @@
+"""
+TEST SCRIPT: Room Detection (Stage 4) and the Stage 8 room-wall check
+=====================================================================
+
+Rooms separated by a wall thinner than the separation threshold must fail
+RoomAdjacencyGraph.check_separation and the Stage 8 "Room Walls" check;
+regular walls must pass. The planar (graph face) detector must find one
+room per cell of a grid plan.
+
+USAGE:
+    python test_room_detection.py
+    python -m pytest test_room_detection.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pipeline.stage3_topology_extraction import stage3_topology_extraction
+from pipeline.stage4_room_detection import PlanarRoomDetector, RoomDetector, polygon_signed_area
+from pipeline.stage8_validation import ArchitectureValidator
+from test_validation import _grid_plan
+
+
+def _separation(mask):
+    """Stage 4 separation result and the Stage 8 'Room Walls' check"""
+    detector = RoomDetector(mask)
+    room_set = detector.detect()
+    assert room_set is not None and len(room_set.rooms) >= 2
+
+    result = ArchitectureValidator(None, room_set).validate()
+    checks = {name: (ok, message) for name, ok, message in result.checks}
+    return detector.validate_room_separation(), checks['Room Walls']
+
+
+def _thin_middle_wall(width):
+    """Two rooms whose shared wall is width pixels thick"""
+    mask = _grid_plan(2, 1)
+    mask[12:132, 132:144] = 0
+    mask[12:132, 132:132 + width] = 255
+    return mask
+
+
+def test_regular_walls_pass():
+    """12px walls between all rooms"""
+    for mask in (_grid_plan(2, 1), _grid_plan(3, 3)):
+        (separated, message), (ok, _) = _separation(mask)
+        assert separated and ok, message
+
+
+def test_one_pixel_wall_fails():
+    """A 1px wall is below MIN_WALL_THICKNESS_PX"""
+    (separated, message), (ok, _) = _separation(_thin_middle_wall(1))
+    assert not separated and not ok
+    assert "Rooms 0 and 1" in message
+
+
+def test_thin_wall_among_regular_walls_fails():
+    """A 2px wall in a plan of 12px walls is below THIN_WALL_FRACTION"""
+    mask = _grid_plan(3, 3)
+    mask[144:264, 132:144] = 0
+    mask[144:264, 137:139] = 255
+    (separated, message), (ok, _) = _separation(mask)
+    assert not separated and not ok, message
+
+
+def test_planar_rooms_on_grid():
+    """2x2 grid: four centerline squares of one pitch, no holes"""
+    mask = _grid_plan(2, 2)
+    room_set = PlanarRoomDetector(stage3_topology_extraction(mask, engine='segments'), mask.shape).detect()
+    assert room_set is not None and len(room_set.rooms) == 4
+
+    for room_id in room_set.rooms:
+        outer, holes = room_set.outline(room_id)
+        assert len(outer) == 4 and holes == []
+        assert abs(abs(polygon_signed_area(outer)) - 132 ** 2) < 0.01 * 132 ** 2
+
+
+if __name__ == '__main__':
+    test_regular_walls_pass()
+    test_one_pixel_wall_fails()
+    test_thin_wall_among_regular_walls_fails()
+    test_planar_rooms_on_grid()
+    print("✓ Room detection tests passed")
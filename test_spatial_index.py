@@ -0,0 +1,86 @@
+"""
+TEST SCRIPT: Segment spatial index
+==================================
+
+SegmentIndex queries must agree with the brute-force distance matrix of
+point_segment_distances on random segments, for bulk-loaded and
+incrementally built indexes.
+
+USAGE:
+    python test_spatial_index.py
+    python -m pytest test_spatial_index.py
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pipeline.spatial_index import SegmentIndex, point_segment_distances
+
+
+def _segments(rng, count, extent=100.0, length=5.0):
+    """Random short segments (some zero-length) with non-contiguous ids"""
+    start = rng.uniform(0, extent, (count, 2))
+    end = start + rng.uniform(-length, length, (count, 2))
+    end[::17] = start[::17]
+    return np.hstack([start, end]), np.arange(count, dtype=np.int64) * 3 + 7
+
+
+def _indexes(segments, ids):
+    yield SegmentIndex.bulk_load(segments, ids)
+    index = SegmentIndex(cell_size=4.0)
+    for segment_id, segment in zip(ids.tolist(), segments):
+        index.insert(segment_id, segment[:2], segment[2:])
+    yield index
+
+
+def test_segments_within_matches_brute_force():
+    """Same ids and distances as a full distance scan, nearest first"""
+    rng = np.random.default_rng(0)
+    segments, ids = _segments(rng, 400)
+    points = rng.uniform(-10, 110, (50, 2))
+    distances, _ = point_segment_distances(points, segments)
+
+    for index in _indexes(segments, ids):
+        for point, row in zip(points, distances):
+            for radius in (0.5, 3.0, 12.0):
+                hits = index.segments_within(point, radius)
+                assert sorted(i for i, _ in hits) == sorted(ids[row <= radius].tolist())
+
+                found = np.array([d for _, d in hits])
+                assert np.all(np.diff(found) >= 0)
+                assert np.allclose(found, np.sort(row[row <= radius]))
+
+
+def test_nearest_segment_matches_brute_force():
+    """k nearest distances equal the k smallest of the full scan"""
+    rng = np.random.default_rng(1)
+    segments, ids = _segments(rng, 300)
+    points = np.vstack([rng.uniform(0, 100, (40, 2)), rng.uniform(-500, 600, (10, 2))])
+    distances, _ = point_segment_distances(points, segments)
+
+    for index in _indexes(segments, ids):
+        for point, row in zip(points, distances):
+            for k in (1, 4):
+                hits = index.nearest_segment(point, k=k)
+                assert len(hits) == k
+                assert np.allclose([d for _, d in hits], np.sort(row)[:k])
+                for segment_id, distance in hits:
+                    assert np.isclose(row[ids == segment_id][0], distance)
+
+
+def test_empty_index():
+    index = SegmentIndex.bulk_load(np.zeros((0, 4)))
+    assert len(index) == 0
+    assert index.nearest_segment((0.0, 0.0)) == []
+    assert index.segments_within((0.0, 0.0), 10.0) == []
+
+
+if __name__ == '__main__':
+    test_segments_within_matches_brute_force()
+    test_nearest_segment_matches_brute_force()
+    test_empty_index()
+    print("✓ Spatial index tests passed")
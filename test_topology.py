@@ -0,0 +1,57 @@
+"""
+TEST SCRIPT: Topology Extraction (Stage 3, segments engine)
+===========================================================
+
+The segments engine must recover the wall centerline graph of synthetic
+plans exactly: one vertex per wall crossing, one edge per wall between
+crossings, vertices on the wall centerlines.
+
+USAGE:
+    python test_topology.py
+    python -m pytest test_topology.py
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pipeline.stage3_topology_extraction import stage3_topology_extraction
+from test_validation import _grid_plan, _l_plan
+
+PITCH, HALF_WALL = 132, 6  # _grid_plan defaults: room_px + wall_px, wall_px / 2
+
+
+def _on_centerlines(positions):
+    """Distance of each coordinate from the nearest wall centerline"""
+    return np.abs(positions - (np.round((positions - HALF_WALL) / PITCH) * PITCH + HALF_WALL))
+
+
+def test_grid_plans():
+    """n x n grid: (n+1)^2 crossings, 2n(n+1) walls of one pitch each"""
+    for n in (2, 3, 4):
+        graph = stage3_topology_extraction(_grid_plan(n, n), engine='segments')
+        assert graph is not None
+        assert len(graph.vertices) == (n + 1) ** 2
+        assert len(graph.edges) == 2 * n * (n + 1)
+
+        assert _on_centerlines(graph.vertex_positions()).max() < 1.0
+        segments = graph.edge_segments()
+        lengths = np.linalg.norm(segments[:, 1] - segments[:, 0], axis=1)
+        assert np.allclose(lengths, PITCH, atol=1.0)
+
+
+def test_l_plan():
+    """L-shaped plan: 8 crossings and corners, 10 walls"""
+    graph = stage3_topology_extraction(_l_plan(), engine='segments')
+    assert graph is not None
+    assert (len(graph.vertices), len(graph.edges)) == (8, 10)
+    assert _on_centerlines(graph.vertex_positions()).max() < 1.0
+
+
+if __name__ == '__main__':
+    test_grid_plans()
+    test_l_plan()
+    print("✓ Topology tests passed")
@@ -0,0 +1,65 @@
+"""
+TEST SCRIPT: Floor Slab Triangulation (rooms with holes)
+=========================================================
+
+Regression tests for pipeline/triangulation.py: a room polygon with a
+column or courtyard hole must keep its hole, i.e. the triangles cover
+exactly the room area minus the hole area.
+
+USAGE:
+    python test_triangulation.py
+    python -m pytest test_triangulation.py
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pipeline.triangulation import ring_area, triangulate_polygon
+
+
+def _covered_area(points, triangles):
+    """Signed area covered by counter-clockwise triangles"""
+    a, b, c = points[triangles[:, 0]], points[triangles[:, 1]], points[triangles[:, 2]]
+    return 0.5 * float(np.sum((b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) -
+                              (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0])))
+
+
+def test_room_with_column():
+    """Room whose bridge target used to block its own bridge (hole was dropped)"""
+
+    origin = np.array([71.48, -93.28])
+    room = np.array([[0, 0], [14.86, 0], [14.86, 11.33], [0, 11.33]]) + origin
+    column = np.array([[-1, -1], [1, -1], [1, 1], [-1, 1]]) * (5.33 / 2) + [8.75, 5.34] + origin
+
+    points, triangles = triangulate_polygon(room, [column])
+    expected = ring_area(room) - abs(ring_area(column))
+
+    assert len(triangles) == 8
+    assert abs(_covered_area(points, triangles) - expected) < 1e-9 * ring_area(room)
+
+
+def test_random_rooms_with_columns():
+    """Random rectangular rooms, each with one square column inside"""
+
+    rng = np.random.default_rng(0)
+    for _ in range(1000):
+        w, h = rng.uniform(1, 20, 2)
+        s = rng.uniform(0.05, 0.5) * min(w, h)
+        cx, cy = rng.uniform(s, w - s), rng.uniform(s, h - s)
+        origin = rng.uniform(-100, 100, 2)
+
+        room = np.array([[0, 0], [w, 0], [w, h], [0, h]]) + origin
+        column = np.array([[-1, -1], [1, -1], [1, 1], [-1, 1]]) * (s / 2) + [cx, cy] + origin
+
+        points, triangles = triangulate_polygon(room, [column])
+        assert abs(_covered_area(points, triangles) - (w * h - s * s)) < 1e-6 * w * h, (w, h, s, cx, cy, origin)
+
+
+if __name__ == '__main__':
+    test_room_with_column()
+    test_random_rooms_with_columns()
+    print("✓ Triangulation tests passed")
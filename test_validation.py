@@ -0,0 +1,97 @@
+"""
+TEST SCRIPT: Stage 8 Validation on synthetic plans
+===================================================
+
+Runs synthetic wall masks through Stages 3-8 (no semantic model needed)
+and checks the validation gate: box walls without any openings must pass
+just like box walls that Stage 7 cut doors into.
+
+USAGE:
+    python test_validation.py
+    python -m pytest test_validation.py
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pipeline.stage3_topology_extraction import stage3_topology_extraction
+from pipeline.stage4_room_detection import stage4_room_detection
+from pipeline.stage5_metric_normalization import MetricNormalizer
+from pipeline.stage6_3d_construction import create_cutaway_mesh
+from pipeline.stage7_openings import stage7_openings_generation
+from pipeline.stage8_validation import stage8_validation
+
+
+def _grid_plan(rooms_x, rooms_y, room_px=120, wall_px=12):
+    """Binary wall mask of a rooms_x x rooms_y grid of square rooms"""
+    pitch = room_px + wall_px
+    h, w = rooms_y * pitch + wall_px, rooms_x * pitch + wall_px
+    mask = np.zeros((h, w), dtype=np.uint8)
+    for i in range(rooms_y + 1):
+        mask[i * pitch:i * pitch + wall_px, :] = 255
+    for j in range(rooms_x + 1):
+        mask[:, j * pitch:j * pitch + wall_px] = 255
+    return mask
+
+
+def _l_plan():
+    """L-shaped plan: a 2x2 grid with the top-right room cut away"""
+    mask = _grid_plan(2, 2)
+    mask[:132, 144:] = 0
+    return mask
+
+
+def _validate(mask, wall_mode, door_mask=None):
+    """Stages 3-8 on a wall mask; returns the Stage 8 checks by name"""
+    wall_graph = stage3_topology_extraction(mask, engine='segments')
+    room_set = stage4_room_detection(mask, wall_graph)
+    assert room_set is not None
+
+    success, context, graph, rooms = MetricNormalizer(
+        image_shape=mask.shape, wall_graph=wall_graph, room_set=room_set).normalize()
+    assert success
+
+    mesh = create_cutaway_mesh(graph, rooms, None, wall_mode=wall_mode)
+    empty = np.zeros_like(mask)
+    success, mesh = stage7_openings_generation(
+        mesh, empty if door_mask is None else door_mask, empty, mask,
+        graph, context['scale_factor'], wall_mode=wall_mode)
+    assert success
+
+    passed, result = stage8_validation(mesh, graph, rooms, wall_count=len(wall_graph.edges))
+    return passed, {name: (ok, message) for name, ok, message in result.checks}
+
+
+def test_boxes_without_openings():
+    """Abutting wall boxes stay separate closed solids (no weld across boxes)"""
+    for mask in (_grid_plan(4, 4), _l_plan()):
+        passed, checks = _validate(mask, 'boxes')
+        assert checks['Mesh: Manifold Topology'][0], checks['Mesh: Manifold Topology']
+        assert passed, {k: v for k, v in checks.items() if not v[0]}
+
+
+def test_boxes_with_door():
+    """Same walls with a door cut by Stage 7"""
+    mask = _grid_plan(2, 2)
+    door = np.zeros_like(mask)
+    door[30:70, 132:144] = 255
+    passed, checks = _validate(mask, 'boxes', door)
+    assert passed, {k: v for k, v in checks.items() if not v[0]}
+
+
+def test_footprint_without_openings():
+    """Footprint walls on the same plans"""
+    for mask in (_grid_plan(4, 4), _l_plan()):
+        passed, checks = _validate(mask, 'footprint')
+        assert passed, {k: v for k, v in checks.items() if not v[0]}
+
+
+if __name__ == '__main__':
+    test_boxes_without_openings()
+    test_boxes_with_door()
+    test_footprint_without_openings()
+    print("✓ Validation tests passed")